@@ -0,0 +1,110 @@
+import numpy as np
+import card as c
+import poker_hand as h
+
+CHUNK_SIZE = 1 << 16
+RANK_VALUES = np.arange(c.LOWEST_RANK, c.ACE + 1)
+TIE_BREAK_SHIFTS = h.RANK_BITS * np.arange(h.NUM_CARDS_IN_HAND - 1, -1, -1)
+
+
+def hands_to_codes(hands):
+    """
+    Converts PokerHand objects to an array of card codes.
+
+    :param hands: Sequence of hands with five cards each.
+    :return: Array of shape (N, 5) of card codes.
+    """
+    return np.array([hand.get_codes() for hand in hands], dtype=np.uint8).reshape(-1, h.NUM_CARDS_IN_HAND)
+
+
+def __sort_descending(values):
+    return -np.sort(-values, axis=1)
+
+
+def __evaluate_chunk(codes):
+    """
+    Evaluates a chunk of hands with array operations.
+
+    :param codes: Array of shape (N, 5) of card codes.
+    :return: Tuple of arrays of hand types and strength keys.
+    """
+    codes = codes.astype(np.int32)
+    ranks = codes // c.NUM_SUITS + c.LOWEST_RANK
+    suits = codes % c.NUM_SUITS
+
+    is_flush = (suits == suits[:, :1]).all(axis=1)
+    rank_counts = (ranks[:, :, None] == RANK_VALUES).sum(axis=1)
+    is_paired = rank_counts > 1
+    num_paired_ranks = is_paired.sum(axis=1)
+    has_four_of_a_kind = (rank_counts == h.FOUR_OF_A_KIND).any(axis=1)
+    num_pairs = num_paired_ranks + has_four_of_a_kind
+
+    hand_types = np.select([is_flush, num_pairs == h.NUM_TWO_PAIRS, num_paired_ranks == h.NUM_PAIRS],
+                           [h.FLUSH, h.TWO_PAIR, h.PAIR], h.HIGH_CARD)
+
+    # Same lists as PokerHand.__get_pairs and __get_high_cards_in_pairs, padded with zeros.
+    pairs = __sort_descending(np.where(is_paired, RANK_VALUES, 0))
+    pairs[:, 1] = np.where(has_four_of_a_kind, pairs[:, 0], pairs[:, 1])
+    is_high_card = (rank_counts == 1) | (rank_counts == h.THREE_OF_A_KIND)
+    high_cards = __sort_descending(np.where(is_high_card, RANK_VALUES, 0))
+
+    tie_break_ranks = __sort_descending(ranks)
+    is_two_pair = hand_types == h.TWO_PAIR
+    is_pair = hand_types == h.PAIR
+    tie_break_ranks[is_two_pair | is_pair, 3:] = 0
+    tie_break_ranks[is_two_pair, :3] = np.stack([pairs[is_two_pair, 0], pairs[is_two_pair, 1],
+                                                 high_cards[is_two_pair, 0]], axis=1)
+    tie_break_ranks[is_pair, :3] = np.stack([pairs[is_pair, 0], high_cards[is_pair, 1],
+                                             high_cards[is_pair, 2]], axis=1)
+
+    strengths = (hand_types << h.CATEGORY_SHIFT) | (tie_break_ranks << TIE_BREAK_SHIFTS).sum(axis=1)
+    return hand_types, strengths
+
+
+def evaluate_many(codes):
+    """
+    Evaluates many hands at once.
+
+    :param codes: Array of shape (N, 5) of card codes.
+    :return: Tuple of arrays of hand types and strength keys, the same values
+    PokerHand.get_hand_type and PokerHand.get_strength give.
+    """
+    codes = np.asarray(codes).reshape(-1, h.NUM_CARDS_IN_HAND)
+    hand_types = np.empty(len(codes), dtype=np.int32)
+    strengths = np.empty(len(codes), dtype=np.int32)
+    for start in range(0, len(codes), CHUNK_SIZE):
+        stop = start + CHUNK_SIZE
+        hand_types[start:stop], strengths[start:stop] = __evaluate_chunk(codes[start:stop])
+    return hand_types, strengths
+
+
+def evaluate_hands(hands):
+    """
+    Evaluates many PokerHand objects at once. Each hand already keeps its strength key,
+    backed by poker_hand.STRENGTH_CACHE, so the keys are gathered from the hands
+    instead of being recomputed from their cards.
+
+    :param hands: Sequence of hands with five cards each.
+    :return: Tuple of arrays of hand types and strength keys.
+    """
+    strengths = np.array([hand.get_strength() for hand in hands], dtype=np.int32)
+    return strengths >> h.CATEGORY_SHIFT, strengths
+
+
+def compare_many(hands_1, hands_2):
+    """
+    Compares hands pairwise, the same way PokerHand.compare_to does.
+
+    :param hands_1: Array of shape (N, 5) of card codes, or a sequence of hands.
+    :param hands_2: Array of shape (N, 5) of card codes, or a sequence of hands.
+    :return: Array of 1 where hand 1 wins, -1 where hand 2 wins, and 0 where they tie
+    """
+    strengths_1 = __get_strengths(hands_1)
+    strengths_2 = __get_strengths(hands_2)
+    return np.sign(strengths_1 - strengths_2)
+
+
+def __get_strengths(hands):
+    if len(hands) > 0 and isinstance(hands[0], h.PokerHand):
+        return evaluate_hands(hands)[1]
+    return evaluate_many(hands)[1]
@@ -0,0 +1,33 @@
+import numpy as np
+import test_suite as test
+import batch_evaluator as b
+import card as c
+import poker_hand as h
+
+NUM_TEST_HANDS = 20000
+
+
+def __utest_evaluate_many():
+    u_test = test.create()
+
+    generator = np.random.default_rng(NUM_TEST_HANDS)
+    codes = generator.random((NUM_TEST_HANDS, c.NUM_CARDS_IN_DECK)).argsort(axis=1)[:, :h.NUM_CARDS_IN_HAND]
+    hands = [h.hand_from_codes(hand_codes) for hand_codes in codes.tolist()]
+    hand_types, strengths = b.evaluate_many(codes)
+
+    expected = np.array([hand.get_strength() for hand in hands])
+    test.assert_equals(u_test, "Random Hands Match PokerHand Test", 0, int((strengths != expected).sum()))
+
+    expected = np.array([hand.get_hand_type() for hand in hands])
+    test.assert_equals(u_test, "Random Hand Types Match PokerHand Test", 0, int((hand_types != expected).sum()))
+
+    half = NUM_TEST_HANDS // 2
+    expected = np.array([hand_1.compare_to(hand_2) for hand_1, hand_2 in zip(hands[:half], hands[half:])])
+    outcomes = b.compare_many(hands[:half], codes[half:])
+    test.assert_equals(u_test, "Compare Many Test", 0, int((outcomes != expected).sum()))
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_evaluate_many()
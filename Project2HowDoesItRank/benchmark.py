@@ -0,0 +1,167 @@
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+import card as c
+import deck as d
+import main as m
+import poker_hand as h
+
+DEFAULT_NUM_OPS = 20000
+NUM_MEMORY_OPS = 1000
+PERCENTILES = [50, 90, 99, 99.9]
+NANOSECONDS_PER_SECOND = 1e9
+
+# One hand of each type, as in poker_hand_tests.__u_test_compare_types.
+HANDS_BY_TYPE = {
+    h.FLUSH: [(3, "Spades"), (14, "Spades"), (8, "Spades"), (5, "Spades"), (10, "Spades")],
+    h.TWO_PAIR: [(3, "Spades"), (3, "Diamonds"), (8, "Spades"), (8, "Clubs"), (2, "Hearts")],
+    h.PAIR: [(3, "Spades"), (4, "Diamonds"), (8, "Spades"), (7, "Clubs"), (8, "Hearts")],
+    h.HIGH_CARD: [(3, "Spades"), (5, "Diamonds"), (8, "Spades"), (13, "Clubs"), (10, "Hearts")],
+}
+
+
+def get_percentile(sorted_values, percentile):
+    """
+    Gets a percentile of a sorted list of values.
+
+    :param sorted_values: Values sorted from lowest to highest.
+    :param percentile: The percentile, from 0 to 100.
+    :return: The value at that percentile.
+    """
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * percentile / 100))
+    return sorted_values[index]
+
+
+def measure(name, operation, num_ops, prepare=None):
+    """
+    Runs an operation many times, timing every call. prepare is called before each
+    call and is not timed. Peak memory is measured in a separate, shorter run, since
+    tracing allocations slows everything down.
+
+    :param name: Name of the benchmark.
+    :param operation: Function that runs the operation once.
+    :param num_ops: Number of timed calls.
+    :param prepare: Function called before each call, or None.
+    :return: Dictionary of results.
+    """
+    latencies = []
+    clock = time.perf_counter_ns
+    for i in range(num_ops):
+        if prepare is not None:
+            prepare()
+        start = clock()
+        operation()
+        latencies.append(clock() - start)
+
+    tracemalloc.start()
+    for i in range(min(num_ops, NUM_MEMORY_OPS)):
+        if prepare is not None:
+            prepare()
+        operation()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    latencies.sort()
+    total_seconds = sum(latencies) / NANOSECONDS_PER_SECOND
+    return {
+        'name': name,
+        'ops': num_ops,
+        'ops_per_sec': num_ops / total_seconds if total_seconds > 0 else float('inf'),
+        'latency_ns': {f'p{percentile}': get_percentile(latencies, percentile) for percentile in PERCENTILES},
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def bench_compare_to(num_ops):
+    """
+    Measures compare_to for every pairing of hand types. Each call compares newly
+    built hands, once with the strength cache kept warm and once with it cleared.
+
+    :param num_ops: Number of calls per pairing.
+    :return: List of results.
+    """
+    results = []
+    for type_1, cards_1 in HANDS_BY_TYPE.items():
+        for type_2, cards_2 in HANDS_BY_TYPE.items():
+            card_list_1 = [c.Card(rank, suit) for rank, suit in cards_1]
+            card_list_2 = [c.Card(rank, suit) for rank, suit in cards_2]
+            label = f'{h.HAND_TYPE_NAMES[type_1]} vs {h.HAND_TYPE_NAMES[type_2]}'
+
+            def compare():
+                h.PokerHand(card_list_1).compare_to(h.PokerHand(card_list_2))
+
+            results.append(measure(f'compare_to[{label}]', compare, num_ops))
+            results.append(measure(f'compare_to_uncached[{label}]', compare, num_ops, h.STRENGTH_CACHE.clear))
+    return results
+
+
+def bench_deck(num_ops):
+    """
+    Measures building decks and dealing cards from them.
+
+    :param num_ops: Number of calls.
+    :return: List of results.
+    """
+    game_deck = d.Deck()
+
+    def refill():
+        if game_deck.num_cards_in_deck() == 0:
+            game_deck.reset()
+
+    return [measure('deck_create', d.Deck, num_ops),
+            measure('deal_card', game_deck.deal_card, num_ops, refill)]
+
+
+def bench_game_rounds(num_ops):
+    """
+    Measures rounds of the game as main plays them, without printing or input.
+
+    :param num_ops: Number of rounds.
+    :return: List of results.
+    """
+    game_deck = d.Deck()
+
+    def refill():
+        if game_deck.less_than_5_cards():
+            game_deck.reset()
+
+    return [measure('game_round', lambda: m.deal_round(game_deck), num_ops, refill)]
+
+
+def run(num_ops=DEFAULT_NUM_OPS):
+    """
+    Runs every benchmark.
+
+    :param num_ops: Number of calls per benchmark.
+    :return: Dictionary with the environment and the list of results.
+    """
+    results = bench_compare_to(num_ops) + bench_deck(num_ops) + bench_game_rounds(num_ops)
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.time(),
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures hand evaluation, dealing and game throughput.')
+    parser.add_argument('--ops', type=int, default=DEFAULT_NUM_OPS)
+    parser.add_argument('--output', help='Path of a JSON file to write the results to')
+    args = parser.parse_args()
+
+    report = run(args.ops)
+    for result in report['results']:
+        latency = result['latency_ns']
+        print(f"{result['name']:45} {result['ops_per_sec']:14,.0f} ops/s  "
+              f"p50 {latency['p50']:>8} ns  p99 {latency['p99']:>8} ns  "
+              f"peak {result['peak_memory_bytes']:>8} B")
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
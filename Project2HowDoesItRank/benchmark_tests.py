@@ -0,0 +1,60 @@
+import json
+import test_suite as test
+import benchmark as bm
+import poker_hand as h
+
+NUM_TEST_OPS = 20
+
+
+def __utest_get_percentile():
+    u_test = test.create()
+
+    values = list(range(1, 101))
+    test.assert_equals(u_test, "Lowest Percentile Test", 1, bm.get_percentile(values, 0))
+    test.assert_equals(u_test, "Median Test", 51, bm.get_percentile(values, 50))
+    test.assert_equals(u_test, "P99.9 Test", 100, bm.get_percentile(values, 99.9))
+    test.assert_equals(u_test, "P100 Test", 100, bm.get_percentile(values, 100))
+    test.assert_equals(u_test, "Single Value Test", 7, bm.get_percentile([7], 99))
+
+    test.print_summary(u_test)
+    print()
+
+
+def __utest_measure():
+    u_test = test.create()
+
+    calls = {'operation': 0, 'prepare': 0}
+
+    def operation():
+        calls['operation'] += 1
+
+    def prepare():
+        calls['prepare'] += 1
+
+    result = bm.measure('count', operation, NUM_TEST_OPS, prepare)
+    test.assert_equals(u_test, "Result Keys Test", ['name', 'ops', 'ops_per_sec', 'latency_ns', 'peak_memory_bytes'],
+                       list(result))
+    test.assert_equals(u_test, "Name Test", 'count', result['name'])
+    test.assert_equals(u_test, "Ops Test", NUM_TEST_OPS, result['ops'])
+    test.assert_equals(u_test, "Timed And Memory Runs Test", 2 * NUM_TEST_OPS, calls['operation'])
+    test.assert_equals(u_test, "Prepare Calls Test", calls['operation'], calls['prepare'])
+    test.assert_equals(u_test, "Percentile Keys Test", [f'p{percentile}' for percentile in bm.PERCENTILES],
+                       list(result['latency_ns']))
+    latencies = list(result['latency_ns'].values())
+    test.assert_equals(u_test, "Percentiles In Order Test", sorted(latencies), latencies)
+    test.assert_equals(u_test, "Ops Per Second Test", True, result['ops_per_sec'] > 0)
+
+    report = bm.run(NUM_TEST_OPS)
+    num_pairings = len(bm.HANDS_BY_TYPE) ** 2
+    test.assert_equals(u_test, "Number Of Results Test", 2 * num_pairings + 3, len(report['results']))
+    test.assert_equals(u_test, "Pairing Names Test", True,
+                       f'compare_to[{h.HAND_TYPE_NAMES[h.FLUSH]} vs {h.HAND_TYPE_NAMES[h.PAIR]}]'
+                       in [result['name'] for result in report['results']])
+    test.assert_equals(u_test, "JSON Round Trip Test", report, json.loads(json.dumps(report)))
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_get_percentile()
+    __utest_measure()
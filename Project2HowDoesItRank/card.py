@@ -2,10 +2,48 @@ JACK = 11
 QUEEN = 12
 KING = 13
 ACE = 14
+LOWEST_RANK = 2
+SUITS = ['Diamonds', 'Clubs', 'Hearts', 'Spades']
+NUM_SUITS = 4
+NUM_RANKS = 13
+NUM_CARDS_IN_DECK = NUM_RANKS * NUM_SUITS
+SUIT_INDEX = {suit: index for index, suit in enumerate(SUITS)}
+RANK_LETTERS = {10: 'T', JACK: 'J', QUEEN: 'Q', KING: 'K', ACE: 'A'}
+RANK_NAMES = {JACK: 'Jack', QUEEN: 'Queen', KING: 'King', ACE: 'Ace'}
+
+
+def encode(rank, suit):
+    """
+    Encodes a card as a single integer code between 0 and 51.
+    :param rank: The rank of the card
+    :param suit: The suit of the card
+    :return: The card code
+    """
+    return (rank - LOWEST_RANK) * NUM_SUITS + SUIT_INDEX[suit]
+
+
+def get_code_rank(code):
+    """
+    Gets and returns the rank of an encoded card.
+    :param code: The card code
+    :return: The rank
+    """
+    return code // NUM_SUITS + LOWEST_RANK
+
+
+def get_code_suit_index(code):
+    """
+    Gets and returns the position in SUITS of the suit of an encoded card.
+    :param code: The card code
+    :return: The suit index
+    """
+    return code % NUM_SUITS
 
 
 class Card:
 
+    __slots__ = ('__rank', '__suit', '__code')
+
     def __init__(self, rank, suit):
         """
         Constructs a card with a given rank and suit.
@@ -14,6 +52,7 @@ class Card:
         """
         self.__rank = rank
         self.__suit = suit
+        self.__code = encode(rank, suit)
 
     def get_rank(self):
         """
@@ -29,17 +68,65 @@ class Card:
         """
         return self.__suit
 
+    def get_code(self):
+        """
+        Gets and returns the integer code of the card.
+        :return: The card code
+        """
+        return self.__code
+
     def __str__(self):
-        str_rank = ''
-        if self.__rank == JACK:
-            str_rank = 'Jack'
-        elif self.__rank == QUEEN:
-            str_rank = 'Queen'
-        elif self.__rank == KING:
-            str_rank = 'King'
-        elif self.__rank == ACE:
-            str_rank = 'Ace'
-        else:
-            str_rank = str(self.__rank)
-        return f'{str_rank} of {self.__suit}'
+        return LONG_NAMES[self.__code]
+
+
+CARDS = [Card(get_code_rank(code), SUITS[get_code_suit_index(code)]) for code in range(NUM_CARDS_IN_DECK)]
+
+
+def from_code(code):
+    """
+    Gets the shared card object for a card code. The 52 cards are created once, so
+    decks and hands built from codes do not allocate new cards.
+    :param code: The card code
+    :return: The card
+    """
+    return CARDS[code]
+
+
+def __get_short_name(code):
+    """
+    Builds the short name of a card, such as "AS" for the Ace of Spades or "TD" for the 10 of Diamonds.
+    :param code: The card code
+    :return: The short name
+    """
+    rank = get_code_rank(code)
+    return RANK_LETTERS.get(rank, str(rank)) + SUITS[get_code_suit_index(code)][0]
+
+
+def __get_long_name(code):
+    """
+    Builds the long name of a card, such as "Ace of Spades" or "10 of Diamonds".
+    :param code: The card code
+    :return: The long name
+    """
+    rank = get_code_rank(code)
+    return f'{RANK_NAMES.get(rank, str(rank))} of {SUITS[get_code_suit_index(code)]}'
+
+
+SHORT_NAMES = [__get_short_name(code) for code in range(NUM_CARDS_IN_DECK)]
+LONG_NAMES = [__get_long_name(code) for code in range(NUM_CARDS_IN_DECK)]
+# Long names ending in a newline, so hands and decks print one card per line with a single join.
+LONG_NAME_LINES = [long_name + '\n' for long_name in LONG_NAMES]
+SHORT_NAME_CODES = {short_name: code for code, short_name in enumerate(SHORT_NAMES)}
+SHORT_NAME_CODES.update({'10' + suit[0]: encode(10, suit) for suit in SUITS})
+
 
+def parse(short_name):
+    """
+    Gets the code of a card from its short name, such as "AS" for the Ace of Spades.
+    :param short_name: The short name, in either case
+    :return: The card code
+    """
+    code = SHORT_NAME_CODES.get(short_name.upper())
+    if code is None:
+        raise ValueError(f'Not a card: {short_name}')
+    return code
@@ -0,0 +1,152 @@
+import argparse
+import sys
+import card as c
+
+NUM_CARDS_IN_HAND = 5
+
+# Commands import the modules they need when they run, so starting the program only loads
+# card and argparse, and each command loads only what it uses.
+
+
+def __parse_codes(short_names):
+    codes = [c.parse(short_name) for short_name in short_names]
+    if len(codes) != NUM_CARDS_IN_HAND or len(set(codes)) != len(codes):
+        raise ValueError(f"A hand needs five different cards: {' '.join(short_names)}")
+    return codes
+
+
+def evaluate(args):
+    """
+    Prints the type and strength key of a hand, and how it compares to a second hand if one
+    is given. With no cards, reads one hand per line from standard input and writes one
+    "cards,hand type,strength" line per hand, like hand_history.
+    """
+    import hand_table as t
+    import poker_hand as h
+
+    if args.rules != 'project':
+        import rules as ru
+        rule_set = ru.get_rule_set(args.rules)
+        evaluate_codes, get_type_name = rule_set.evaluate, rule_set.get_category_name
+    else:
+        evaluate_codes = t.evaluate
+        get_type_name = lambda strength: h.HAND_TYPE_NAMES[t.get_hand_type(strength)]
+
+    if not args.cards:
+        for line in sys.stdin:
+            if line.strip():
+                codes = __parse_codes(line.replace(',', ' ').split())
+                strength = evaluate_codes(codes)
+                print(f"{' '.join(c.SHORT_NAMES[code] for code in codes)},{get_type_name(strength)},{strength}")
+        return
+
+    codes = __parse_codes(args.cards)
+    strength = evaluate_codes(codes)
+    print(f'Hand 1: {get_type_name(strength)} ({strength})')
+    if args.versus:
+        other_codes = __parse_codes(args.versus)
+        if set(codes) & set(other_codes):
+            raise ValueError('The hands share a card')
+        other_strength = evaluate_codes(other_codes)
+        print(f'Hand 2: {get_type_name(other_strength)} ({other_strength})')
+        print((strength > other_strength) - (strength < other_strength))
+
+
+def simulate(args):
+    """
+    Plays rounds without any input and prints how often each result and hand type came up.
+    """
+    import poker_hand as h
+    import simulation as s
+
+    tally = s.simulate(args.rounds, args.workers, args.seed)
+    outcome_frequencies = s.get_outcome_frequencies(tally)
+    print(f'Rounds: {sum(tally.values())}')
+    print(f'Hand 1 wins: {outcome_frequencies[h.HAND_1_WINS]:.6f}')
+    print(f'Tie: {outcome_frequencies[h.TIE]:.6f}')
+    print(f'Hand 2 wins: {outcome_frequencies[h.HAND_2_WINS]:.6f}')
+    for hand_type, frequency in s.get_type_frequencies(tally).items():
+        print(f'{h.HAND_TYPE_NAMES[hand_type]}: {frequency:.6f}')
+
+
+def play(args):
+    """
+    Plays one game of main without input(), answering every round correctly or at random,
+    and prints the rounds and the final score.
+    """
+    import random
+    import deck as d
+    import main as m
+
+    rng = random.Random(args.seed)
+    game_deck = d.Deck(rng)
+    total_score = 0
+    correct_answer = True
+    while not game_deck.less_than_5_cards() and correct_answer:
+        hand_1, hand_2, actual_result = m.deal_round(game_deck)
+        guess = actual_result if args.answers == 'correct' else rng.choice([1, -1, 0])
+        correct_answer = guess == actual_result
+        total_score += correct_answer
+        print(f"{' '.join(c.SHORT_NAMES[code] for code in hand_1.get_codes())} vs "
+              f"{' '.join(c.SHORT_NAMES[code] for code in hand_2.get_codes())}: "
+              f"guess {guess}, answer {actual_result}")
+    print(f'Final score: {total_score}')
+
+
+def build_tables(args):
+    """
+    Builds the hand_table cache file, or the cache file of a rule set, ahead of time, so the
+    first evaluation of a new process only has to load it.
+    """
+    if args.rules is None:
+        import hand_table as t
+        t.load_tables(args.path or t.CACHE_PATH)
+        print(args.path or t.CACHE_PATH)
+    else:
+        import rules as ru
+        rule_set = ru.get_rule_set(args.rules)
+        rule_set.get_tables()
+        print(rule_set.get_cache_path())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Evaluates hands and plays the game without the interactive prompt.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    evaluate_parser = commands.add_parser('evaluate', help='Evaluate a hand, or one hand per line from stdin')
+    evaluate_parser.add_argument('cards', nargs='*', help='Five short card names, such as AS KD 8H 8C 2S')
+    evaluate_parser.add_argument('--versus', nargs=NUM_CARDS_IN_HAND,
+                                 help='Five short card names of a hand to compare to')
+    evaluate_parser.add_argument('--rules', choices=['project', 'standard'], default='project')
+    evaluate_parser.set_defaults(run=evaluate)
+
+    simulate_parser = commands.add_parser('simulate', help='Play many rounds and print the frequencies')
+    simulate_parser.add_argument('--rounds', type=int, default=100000)
+    simulate_parser.add_argument('--workers', type=int, default=1)
+    simulate_parser.add_argument('--seed', type=int, default=0)
+    simulate_parser.set_defaults(run=simulate)
+
+    play_parser = commands.add_parser('play', help='Play one game with automatic answers')
+    play_parser.add_argument('--answers', choices=['correct', 'random'], default='correct')
+    play_parser.add_argument('--seed', type=int, default=None)
+    play_parser.set_defaults(run=play)
+
+    tables_parser = commands.add_parser('build-tables', help='Build the lookup table cache file')
+    tables_parser.add_argument('--path', help='Path of the cache file')
+    tables_parser.add_argument('--rules', choices=['project', 'standard'],
+                               help='Build the cache file of a rule set, next to the hand_table one')
+    tables_parser.set_defaults(run=build_tables)
+
+    args = parser.parse_args(argv)
+    if args.command == 'evaluate' and args.versus and not args.cards:
+        parser.error('--versus needs the five cards of the first hand')
+    if args.command == 'build-tables' and args.rules and args.path:
+        parser.error('--path only applies to the hand_table cache file')
+    try:
+        args.run(args)
+    except ValueError as error:
+        parser.error(str(error))
+
+
+if __name__ == '__main__':
+    main()
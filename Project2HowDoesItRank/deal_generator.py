@@ -0,0 +1,129 @@
+import random
+import numpy as np
+import card as c
+import deck as d
+
+RANDOM_BACKEND = 'random'
+PCG64_BACKEND = 'pcg64'
+PHILOX_BACKEND = 'philox'
+BACKENDS = [RANDOM_BACKEND, PCG64_BACKEND, PHILOX_BACKEND]
+CHUNK_SIZE = 1 << 16
+NUM_SEED_WORDS = 4
+ORDERED_CODES = np.array(d.ORDERED_CODES, dtype=np.uint8)
+
+
+class DealGenerator:
+
+    def __init__(self, seed=None, backend=PCG64_BACKEND, seed_sequence=None, jumps=0):
+        """
+        Constructs a deal generator. The same seed, backend and jumps always give the same deals.
+
+        :param seed: Integer seed, or None to draw a fresh one from the operating system.
+        :param backend: One of BACKENDS.
+        :param seed_sequence: numpy SeedSequence to use instead of seed.
+        :param jumps: Number of jumps the stream starts ahead of the seed's, as in jumped.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f'Unknown random number generator backend: {backend}')
+        if backend == RANDOM_BACKEND and jumps:
+            raise ValueError('The random backend cannot jump ahead, use spawn instead')
+        if seed_sequence is None:
+            seed_sequence = np.random.SeedSequence(seed)
+        self.__backend = backend
+        self.__seed_sequence = seed_sequence
+        self.__jumps = jumps
+        if backend == RANDOM_BACKEND:
+            self.__rng = random.Random(int.from_bytes(seed_sequence.generate_state(NUM_SEED_WORDS).tobytes(), 'little'))
+            return
+        bit_generator = np.random.PCG64(seed_sequence) if backend == PCG64_BACKEND else np.random.Philox(seed_sequence)
+        if jumps:
+            bit_generator = bit_generator.jumped(jumps)
+        self.__rng = np.random.Generator(bit_generator)
+
+    def get_backend(self):
+        """
+        Gets and returns the name of the backend.
+
+        :return: The backend.
+        """
+        return self.__backend
+
+    def get_entropy(self):
+        """
+        Gets the entropy the generator was seeded with. Passing it back as the seed, along
+        with get_jumps, replays the same deals.
+
+        :return: The seed entropy.
+        """
+        return self.__seed_sequence.entropy
+
+    def get_jumps(self):
+        """
+        Gets and returns the number of jumps the stream starts ahead of the seed's.
+
+        :return: The number of jumps.
+        """
+        return self.__jumps
+
+    def spawn(self, num_streams):
+        """
+        Creates independent generators for parallel workers. Their streams come from
+        child seed sequences, so they never overlap with each other or with this one.
+        The children of a jumped generator are jumped as far, so they differ from the
+        children of the generator it was jumped from.
+
+        :param num_streams: Number of generators to create.
+        :return: List of deal generators with the same backend.
+        """
+        return [DealGenerator(backend=self.__backend, seed_sequence=child, jumps=self.__jumps)
+                for child in self.__seed_sequence.spawn(num_streams)]
+
+    def jumped(self, jumps=1):
+        """
+        Creates a generator whose stream starts far ahead of where this one's started, as
+        if 2**127 (PCG64) or 2**128 (Philox) numbers had been drawn per jump. Deals already
+        drawn from this generator do not move the jumped stream.
+
+        :param jumps: Number of jumps.
+        :return: A deal generator.
+        """
+        if self.__backend == RANDOM_BACKEND:
+            raise ValueError('The random backend cannot jump ahead, use spawn instead')
+        seed_sequence = np.random.SeedSequence(self.__seed_sequence.entropy, spawn_key=self.__seed_sequence.spawn_key,
+                                               pool_size=self.__seed_sequence.pool_size)
+        return DealGenerator(backend=self.__backend, seed_sequence=seed_sequence, jumps=self.__jumps + jumps)
+
+    def generate(self, num_deals, num_cards=c.NUM_CARDS_IN_DECK):
+        """
+        Generates many shuffled deals at once.
+
+        :param num_deals: Number of deals.
+        :param num_cards: Number of cards dealt from each shuffled deck.
+        :return: Array of shape (num_deals, num_cards) of card codes, in the order they are dealt.
+        """
+        deals = np.empty((num_deals, num_cards), dtype=np.uint8)
+        if self.__backend == RANDOM_BACKEND:
+            for i in range(num_deals):
+                deals[i] = self.__rng.sample(d.ORDERED_CODES, num_cards)
+            return deals
+
+        for start in range(0, num_deals, CHUNK_SIZE):
+            stop = min(start + CHUNK_SIZE, num_deals)
+            block = np.tile(ORDERED_CODES, (stop - start, 1))
+            self.__rng.permuted(block, axis=1, out=block)
+            deals[start:stop] = block[:, :num_cards]
+        return deals
+
+    def decks(self, num_decks):
+        """
+        Deals decks from the generator. The same Deck object is reloaded for every deal,
+        so each deck should be used up before asking for the next one.
+
+        :param num_decks: Number of decks.
+        :return: Generator of decks.
+        """
+        game_deck = d.Deck()
+        for start in range(0, num_decks, CHUNK_SIZE):
+            for codes in self.generate(min(CHUNK_SIZE, num_decks - start)).tolist():
+                game_deck.load(codes)
+                yield game_deck
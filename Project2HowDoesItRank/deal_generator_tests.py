@@ -0,0 +1,47 @@
+import numpy as np
+import test_suite as test
+import card as c
+import deal_generator as g
+
+
+def __utest_deal_generator():
+    u_test = test.create()
+
+    for backend in g.BACKENDS:
+        deals = g.DealGenerator(7, backend).generate(100)
+        test.assert_equals(u_test, f"{backend} Same Seed Test", deals.tolist(),
+                           g.DealGenerator(7, backend).generate(100).tolist())
+        test.assert_equals(u_test, f"{backend} Every Card Once Test", True,
+                           bool((np.sort(deals, axis=1) == np.arange(c.NUM_CARDS_IN_DECK)).all()))
+
+        streams = g.DealGenerator(7, backend).spawn(2)
+        test.assert_equals(u_test, f"{backend} Spawned Streams Differ Test", False,
+                           streams[0].generate(1).tolist() == streams[1].generate(1).tolist())
+
+    for backend in [g.PCG64_BACKEND, g.PHILOX_BACKEND]:
+        generator = g.DealGenerator(7, backend)
+        jumped = generator.jumped()
+        test.assert_equals(u_test, f"{backend} Jumped Stream Differs Test", False,
+                           jumped.generate(1).tolist() == g.DealGenerator(7, backend).generate(1).tolist())
+        replayed = g.DealGenerator(jumped.get_entropy(), backend, jumps=jumped.get_jumps())
+        test.assert_equals(u_test, f"{backend} Jumped Replay Test", generator.jumped().generate(5).tolist(),
+                           replayed.generate(5).tolist())
+        test.assert_equals(u_test, f"{backend} Jumps Add Up Test", generator.jumped(2).generate(1).tolist(),
+                           generator.jumped().jumped().generate(1).tolist())
+        children = [child.generate(1).tolist() for child in g.DealGenerator(7, backend).spawn(2)]
+        jumped_children = [child.generate(1).tolist() for child in g.DealGenerator(7, backend).jumped().spawn(2)]
+        test.assert_equals(u_test, f"{backend} Jumped Children Differ Test", False,
+                           any(child in children for child in jumped_children))
+        test.assert_equals(u_test, f"{backend} Jumped Children Replay Test", jumped_children,
+                           [child.generate(1).tolist() for child in g.DealGenerator(7, backend).jumped().spawn(2)])
+
+    generator = g.DealGenerator(7)
+    game_deck = next(generator.decks(1))
+    test.assert_equals(u_test, "Deck From Generator Test", g.DealGenerator(7).generate(1)[0, :2].tolist(),
+                       [game_deck.deal_code(), game_deck.deal_code()])
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_deal_generator()
@@ -4,29 +4,63 @@ import random
 LEAST_NUM_CARDS_TO_MAKE_DECK = 5
 LOWEST_RANK = 2
 HIGHEST_RANK_ACE = 14
+NUM_CARDS_IN_HAND = 5
+ORDERED_CODES = [c.encode(rank, suit) for suit in c.SUITS for rank in range(LOWEST_RANK, HIGHEST_RANK_ACE + 1)]
 
 
 class Deck:
 
-    def __init__(self):
+    def __init__(self, rng=None):
         """
         Constructs a deck. Creates, and shuffles the deck.
+        :param rng: random.Random used to shuffle, or None to use the random module
         """
         self.__card_deck = []
+        self.__rng = random if rng is None else rng
         self.create()
         self.__shuffle()
 
     def create(self):
         """
-        Creates a deck of card and appends it to card deck list
+        Creates a deck of card codes and appends it to card deck list
         """
-        suits = ['Diamonds', 'Clubs', 'Hearts', 'Spades']
-        for suit in suits:
-            for rank in range(LOWEST_RANK, HIGHEST_RANK_ACE + 1):
-                self.__card_deck.append(c.Card(rank, suit))
+        self.__card_deck.extend(ORDERED_CODES)
 
     def __shuffle(self):
-        random.shuffle(self.__card_deck)
+        self.__rng.shuffle(self.__card_deck)
+
+    def __shuffle_cards_to_deal(self, num_to_deal):
+        """
+        Runs only the first num_to_deal steps of a Fisher-Yates shuffle. The cards at the
+        end of the deck, which are dealt first, are then a uniformly random draw.
+        :param num_to_deal: number of cards that will be dealt
+        """
+        cards = self.__card_deck
+        random_fraction = self.__rng.random
+        for i in range(len(cards) - 1, len(cards) - 1 - num_to_deal, -1):
+            j = int(random_fraction() * (i + 1))
+            cards[i], cards[j] = cards[j], cards[i]
+
+    def reset(self, num_to_deal=None):
+        """
+        Puts every card back in the deck and shuffles it again, reusing the deck's list
+        instead of building a new deck
+        :param num_to_deal: number of cards that will be dealt before the next reset, or
+        None to shuffle the whole deck
+        """
+        self.__card_deck[:] = ORDERED_CODES
+        if num_to_deal is None:
+            self.__shuffle()
+        else:
+            self.__shuffle_cards_to_deal(min(num_to_deal, len(self.__card_deck)))
+
+    def load(self, codes):
+        """
+        Replaces the cards in the deck with cards in a given order, reusing the deck's list
+        :param codes: card codes, in the order they should be dealt
+        """
+        self.__card_deck[:] = codes
+        self.__card_deck.reverse()
 
     def num_cards_in_deck(self):
         """
@@ -35,6 +69,13 @@ class Deck:
         """
         return len(self.__card_deck)
 
+    def get_codes(self):
+        """
+        Gets the codes of the cards left in the deck, in the order they would be dealt from last to first
+        :return: list of card codes
+        """
+        return self.__card_deck.copy()
+
     def less_than_5_cards(self):
         """
         Checks whether the deck has less than 5 cards
@@ -47,11 +88,39 @@ class Deck:
         Pops the last card in the deck
         :return: the card that was popped
         """
+        return c.from_code(self.__card_deck.pop())
+
+    def deal_code(self):
+        """
+        Pops the last card in the deck without looking up its card object
+        :return: the code of the card that was popped
+        """
         return self.__card_deck.pop()
 
+    def deal_many(self, num_cards):
+        """
+        Deals several cards at once, in the order deal_card would deal them
+        :param num_cards: number of cards to deal
+        :return: list of the codes of the cards dealt
+        :raises IndexError: if the deck has fewer than num_cards cards left
+        """
+        if num_cards > len(self.__card_deck):
+            raise IndexError(f'cannot deal {num_cards} cards from a deck of {len(self.__card_deck)}')
+        start = len(self.__card_deck) - num_cards
+        dealt = self.__card_deck[start:]
+        del self.__card_deck[start:]
+        dealt.reverse()
+        return dealt
+
+    def deal_hands(self, num_hands):
+        """
+        Deals several hands at once, in the order PokerHand.deal_hand would deal them
+        :param num_hands: number of hands to deal
+        :return: list of lists of the codes of the cards in each hand
+        :raises IndexError: if the deck has too few cards left for every hand
+        """
+        dealt = self.deal_many(num_hands * NUM_CARDS_IN_HAND)
+        return [dealt[i:i + NUM_CARDS_IN_HAND] for i in range(0, len(dealt), NUM_CARDS_IN_HAND)]
+
     def __str__(self):
-        deck_string = ''
-        for card in self.__card_deck:
-            deck_string += card.__str__()
-            deck_string += '\n'
-        return deck_string
+        return ''.join([c.LONG_NAME_LINES[code] for code in self.__card_deck])
@@ -0,0 +1,52 @@
+import random
+import test_suite as test
+import deck as d
+
+
+def __get_index_error(deal):
+    """
+    Calls a function and returns the IndexError it raises, or None if it raises none.
+    """
+    try:
+        deal()
+    except IndexError as error:
+        return error
+    return None
+
+
+def __load(game_deck, codes):
+    """
+    Loads cards into a deck and returns the deck.
+    """
+    game_deck.load(list(codes))
+    return game_deck
+
+
+def __utest_deal_many():
+    u_test = test.create()
+
+    game_deck = d.Deck(random.Random(1))
+    expected = [game_deck.deal_code() for i in range(7)]
+    game_deck = d.Deck(random.Random(1))
+    test.assert_equals(u_test, "Deal Many Order Test", expected, game_deck.deal_many(7))
+    test.assert_equals(u_test, "Deal Hands Test", [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]],
+                       __load(game_deck, range(10)).deal_hands(2))
+    test.assert_equals(u_test, "Deal Whole Deck Test", d.ORDERED_CODES,
+                       __load(game_deck, d.ORDERED_CODES).deal_many(len(d.ORDERED_CODES)))
+
+    game_deck = d.Deck()
+    test.assert_equals(u_test, "Deal Many Overdraw Test", True,
+                       __get_index_error(lambda: game_deck.deal_many(55)) is not None)
+    test.assert_equals(u_test, "Overdraw Keeps Cards Test", 52, game_deck.num_cards_in_deck())
+    test.assert_equals(u_test, "Deal Hands Overdraw Test", True,
+                       __get_index_error(lambda: game_deck.deal_hands(11)) is not None)
+    test.assert_equals(u_test, "Deal Hands Overdraw Keeps Cards Test", 52, game_deck.num_cards_in_deck())
+    game_deck.deal_many(50)
+    test.assert_equals(u_test, "Overdraw Near Empty Test", True,
+                       __get_index_error(lambda: game_deck.deal_many(3)) is not None)
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_deal_many()
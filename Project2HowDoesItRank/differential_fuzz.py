@@ -0,0 +1,390 @@
+import argparse
+import collections
+import multiprocessing
+import time
+import numpy as np
+import card as c
+import deck as d
+import batch_evaluator as b
+import hand_table as t
+import poker_hand as h
+import rules as ru
+import seven_card as sc
+import simulation as sim
+
+PAIRS_PER_TASK = 20000
+MAX_MISMATCHES_PER_TASK = 10
+NUM_CARDS_PER_PAIR = 2 * h.NUM_CARDS_IN_HAND
+RANDOM_PAIRS = 'random'
+FEW_RANKS_PAIRS = 'few_ranks'
+SAME_RANKS_PAIRS = 'same_ranks'
+FLUSH_PAIRS = 'flushes'
+# Ranks that only a few cards are dealt from, so most hands have three or four of a kind,
+# full houses or two pairs.
+MIN_FEW_RANKS = 3
+MAX_FEW_RANKS = 5
+
+
+def __compare_each(compare):
+    """
+    Turns a function comparing two hands into one comparing lists of hands pairwise.
+    """
+    return lambda hands_1, hands_2: [compare(codes_1, codes_2) for codes_1, codes_2 in zip(hands_1, hands_2)]
+
+
+def __compare_seven_card_many(hands_1, hands_2):
+    strengths_1 = sc.evaluate_many(np.array(hands_1, dtype=np.uint8))[1]
+    strengths_2 = sc.evaluate_many(np.array(hands_2, dtype=np.uint8))[1]
+    return np.sign(strengths_1 - strengths_2).tolist()
+
+
+# Each engine compares two lists of hands given as card codes and returns a list of
+# HAND_1_WINS, TIE or HAND_2_WINS.
+ENGINES = {
+    'poker_hand': __compare_each(lambda codes_1, codes_2:
+                                 h.hand_from_codes(codes_1).compare_to(h.hand_from_codes(codes_2))),
+    'hand_table': __compare_each(t.compare),
+    'batch_evaluator': lambda hands_1, hands_2: b.compare_many(np.array(hands_1, dtype=np.uint8),
+                                                               np.array(hands_2, dtype=np.uint8)).tolist(),
+    'rules': __compare_each(ru.PROJECT_RULES.compare),
+    'seven_card': __compare_each(sc.compare),
+    'seven_card_many': __compare_seven_card_many,
+}
+MODES = [RANDOM_PAIRS, FEW_RANKS_PAIRS, SAME_RANKS_PAIRS, FLUSH_PAIRS]
+
+
+# The reference is a port of PokerHand.compare_to as it was before the hand_table rewrite,
+# working on card codes and sharing no code with the engines, so it keeps the original
+# quirks: three of a kind counts as a Pair, four of a kind and full houses count as Two
+# Pair, and a Pair's tie-break skips the highest kicker.
+def __get_pairs(hand_ranks):
+    pairs = []
+    for rank in hand_ranks:
+        if rank not in pairs:
+            if hand_ranks.count(rank) > 1:
+                pairs.append(rank)
+                if hand_ranks.count(rank) == h.FOUR_OF_A_KIND:
+                    pairs.append(rank)
+    return pairs
+
+
+def __get_high_cards_in_pairs(hand_ranks):
+    pairs = []
+    high_card = []
+    for rank in hand_ranks:
+        if rank not in pairs:
+            if hand_ranks.count(rank) > 1:
+                if hand_ranks.count(rank) == h.THREE_OF_A_KIND:
+                    high_card.append(rank)
+                pairs.append(rank)
+            else:
+                high_card.append(rank)
+    return high_card
+
+
+def __get_hand_type(codes, hand_ranks):
+    if len({c.get_code_suit_index(code) for code in codes}) == 1:
+        return h.FLUSH
+    num_pairs = len(__get_pairs(hand_ranks))
+    if num_pairs == h.NUM_TWO_PAIRS:
+        return h.TWO_PAIR
+    elif num_pairs == h.NUM_PAIRS:
+        return h.PAIR
+    else:
+        return h.HIGH_CARD
+
+
+def __compare_ranks(rank_1, rank_2):
+    if rank_1 > rank_2:
+        return h.HAND_1_WINS
+    elif rank_1 == rank_2:
+        return h.TIE
+    else:
+        return h.HAND_2_WINS
+
+
+def __compare_flush_or_high_card(hand_1_ranks, hand_2_ranks):
+    winning_hand = h.TIE
+    i = 0
+    while winning_hand == h.TIE and i < h.NUM_CARDS_IN_HAND:
+        winning_hand = __compare_ranks(hand_1_ranks[i], hand_2_ranks[i])
+        i += 1
+    return winning_hand
+
+
+def __compare_two_pair(hand_1_ranks, hand_2_ranks):
+    pairs_hand_1 = __get_pairs(hand_1_ranks)
+    pairs_hand_2 = __get_pairs(hand_2_ranks)
+    winning_hand = h.TIE
+    i = 0
+    while winning_hand == h.TIE and i < h.NUM_TWO_PAIRS:
+        winning_hand = __compare_ranks(pairs_hand_1[i], pairs_hand_2[i])
+        i += 1
+    if winning_hand == h.TIE:
+        winning_hand = __compare_ranks(__get_high_cards_in_pairs(hand_1_ranks)[0],
+                                       __get_high_cards_in_pairs(hand_2_ranks)[0])
+    return winning_hand
+
+
+def __compare_pair(hand_1_ranks, hand_2_ranks):
+    pairs_hand_1 = __get_pairs(hand_1_ranks)
+    high_card_hand_1 = __get_high_cards_in_pairs(hand_1_ranks)
+    pairs_hand_2 = __get_pairs(hand_2_ranks)
+    high_card_hand_2 = __get_high_cards_in_pairs(hand_2_ranks)
+    winning_hand = h.TIE
+    i = 0
+    while winning_hand == h.TIE and i < h.NUM_PAIRS:
+        winning_hand = __compare_ranks(pairs_hand_1[i], pairs_hand_2[i])
+        i += 1
+    while winning_hand == h.TIE and i < h.NUM_HIGH_CARDS_PAIR:
+        winning_hand = __compare_ranks(high_card_hand_1[i], high_card_hand_2[i])
+        i += 1
+    return winning_hand
+
+
+def reference_compare(codes_1, codes_2):
+    """
+    Compares two hands the way PokerHand.compare_to did before the hand_table rewrite, the
+    behavior every engine, PokerHand included, must match.
+
+    :param codes_1: Card codes of the first hand.
+    :param codes_2: Card codes of the second hand.
+    :return: HAND_1_WINS, TIE or HAND_2_WINS.
+    """
+    hand_1_ranks = sorted([c.get_code_rank(code) for code in codes_1], reverse=True)
+    hand_2_ranks = sorted([c.get_code_rank(code) for code in codes_2], reverse=True)
+    hand_1_type = __get_hand_type(codes_1, hand_1_ranks)
+    hand_2_type = __get_hand_type(codes_2, hand_2_ranks)
+    if hand_1_type != hand_2_type:
+        return __compare_ranks(hand_1_type, hand_2_type)
+    elif hand_1_type == h.TWO_PAIR:
+        return __compare_two_pair(hand_1_ranks, hand_2_ranks)
+    elif hand_1_type == h.PAIR:
+        return __compare_pair(hand_1_ranks, hand_2_ranks)
+    else:
+        return __compare_flush_or_high_card(hand_1_ranks, hand_2_ranks)
+
+
+def __deal_few_ranks(game_deck, rng):
+    ranks = rng.sample(range(c.LOWEST_RANK, c.ACE + 1), rng.randint(MIN_FEW_RANKS, MAX_FEW_RANKS))
+    game_deck.load(rng.sample([c.encode(rank, suit) for rank in ranks for suit in c.SUITS], NUM_CARDS_PER_PAIR))
+    return game_deck.deal_hands(2)
+
+
+def __deal_same_ranks(game_deck, rng):
+    """
+    Deals a hand and gives the second hand the same ranks with other suits where it can,
+    now and then moving a card up or down a rank, so most pairs tie or differ only in a
+    tie-break.
+    """
+    game_deck.reset(h.NUM_CARDS_IN_HAND)
+    hand_1 = game_deck.deal_many(h.NUM_CARDS_IN_HAND)
+    used = set(hand_1)
+    hand_2 = []
+    for code in hand_1:
+        rank = c.get_code_rank(code)
+        if rng.random() < 0.5 / h.NUM_CARDS_IN_HAND:
+            rank = min(max(rank + rng.choice([-1, 1]), c.LOWEST_RANK), c.ACE)
+        choices = [c.encode(rank, suit) for suit in c.SUITS if c.encode(rank, suit) not in used]
+        if not choices:
+            choices = [other for other in range(c.NUM_CARDS_IN_DECK) if other not in used]
+        hand_2.append(rng.choice(choices))
+        used.add(hand_2[-1])
+    return hand_1, hand_2
+
+
+def __deal_flushes(game_deck, rng):
+    """
+    Deals two flushes in different suits, breaking the second one half of the time by
+    moving its last card to the suit of the first.
+    """
+    suit_1, suit_2 = rng.sample(c.SUITS, 2)
+    ranks = range(c.LOWEST_RANK, c.ACE + 1)
+    hand_1 = [c.encode(rank, suit_1) for rank in rng.sample(ranks, h.NUM_CARDS_IN_HAND)]
+    hand_2 = [c.encode(rank, suit_2) for rank in rng.sample(ranks, h.NUM_CARDS_IN_HAND)]
+    if rng.random() < 0.5:
+        off_suit = c.encode(c.get_code_rank(hand_2[-1]), suit_1)
+        if off_suit not in hand_1:
+            hand_2[-1] = off_suit
+    game_deck.load(hand_1 + hand_2)
+    return game_deck.deal_hands(2)
+
+
+def __deal_random(game_deck, rng):
+    game_deck.reset(NUM_CARDS_PER_PAIR)
+    return game_deck.deal_hands(2)
+
+
+DEALERS = {RANDOM_PAIRS: __deal_random, FEW_RANKS_PAIRS: __deal_few_ranks, SAME_RANKS_PAIRS: __deal_same_ranks,
+           FLUSH_PAIRS: __deal_flushes}
+
+
+def generate_pairs(num_pairs, rng, modes=MODES):
+    """
+    Deals pairs of hands from a deck.Deck, cycling through the generation modes.
+
+    :param num_pairs: Number of pairs.
+    :param rng: random.Random used to shuffle and pick cards.
+    :param modes: Modes to cycle through: RANDOM_PAIRS, FEW_RANKS_PAIRS, SAME_RANKS_PAIRS or FLUSH_PAIRS.
+    :return: Tuple of two lists of hands, as lists of card codes.
+    """
+    game_deck = d.Deck(rng)
+    hands_1 = []
+    hands_2 = []
+    for i in range(num_pairs):
+        hand_1, hand_2 = DEALERS[modes[i % len(modes)]](game_deck, rng)
+        hands_1.append(list(hand_1))
+        hands_2.append(list(hand_2))
+    return hands_1, hands_2
+
+
+def is_mismatch(compare, codes_1, codes_2):
+    """
+    Checks whether an engine disagrees with the reference on a pair of hands.
+
+    :param compare: Engine from ENGINES.
+    :param codes_1: Card codes of the first hand.
+    :param codes_2: Card codes of the second hand.
+    :return: True iff the engine gives another result than reference_compare.
+    """
+    return compare([codes_1], [codes_2])[0] != reference_compare(codes_1, codes_2)
+
+
+def shrink(compare, codes_1, codes_2):
+    """
+    Makes a mismatching pair of hands as simple as possible while it still mismatches, by
+    swapping cards, one at a time, for the lowest card code that keeps the mismatch.
+
+    :param compare: Engine from ENGINES.
+    :param codes_1: Card codes of the first hand.
+    :param codes_2: Card codes of the second hand.
+    :return: Tuple of the simplified card codes of both hands.
+    """
+    cards = list(codes_1) + list(codes_2)
+    changed = True
+    while changed:
+        changed = False
+        for position in range(NUM_CARDS_PER_PAIR):
+            for code in range(cards[position]):
+                if code in cards:
+                    continue
+                candidate = cards[:position] + [code] + cards[position + 1:]
+                if is_mismatch(compare, candidate[:h.NUM_CARDS_IN_HAND], candidate[h.NUM_CARDS_IN_HAND:]):
+                    cards = candidate
+                    changed = True
+                    break
+    return cards[:h.NUM_CARDS_IN_HAND], cards[h.NUM_CARDS_IN_HAND:]
+
+
+def fuzz_pairs(hands_1, hands_2, engine_names):
+    """
+    Runs the reference and some engines on the same pairs of hands.
+
+    :param hands_1: First hands, as lists of card codes.
+    :param hands_2: Second hands, as lists of card codes.
+    :param engine_names: Names of the engines in ENGINES.
+    :return: Tuple of a Counter of seconds spent per engine, including 'reference', and a
+    dictionary mapping engine names to up to MAX_MISMATCHES_PER_TASK mismatching pairs.
+    """
+    seconds = collections.Counter()
+    start = time.perf_counter()
+    expected = [reference_compare(codes_1, codes_2) for codes_1, codes_2 in zip(hands_1, hands_2)]
+    seconds['reference'] += time.perf_counter() - start
+
+    mismatches = {}
+    for engine_name in engine_names:
+        start = time.perf_counter()
+        actual = ENGINES[engine_name](hands_1, hands_2)
+        seconds[engine_name] += time.perf_counter() - start
+        mismatches[engine_name] = [(hands_1[i], hands_2[i]) for i in range(len(expected))
+                                   if actual[i] != expected[i]][:MAX_MISMATCHES_PER_TASK]
+    return seconds, mismatches
+
+
+def __fuzz_task(task):
+    seed, task_index, num_pairs, engine_names, modes, use_cache = task
+    hands_1, hands_2 = generate_pairs(num_pairs, sim.get_task_rng(seed, task_index), modes)
+    max_size = h.STRENGTH_CACHE.get_max_size()
+    if not use_cache:
+        h.STRENGTH_CACHE.set_max_size(0)
+    try:
+        return num_pairs, fuzz_pairs(hands_1, hands_2, engine_names)
+    finally:
+        h.STRENGTH_CACHE.set_max_size(max_size)
+
+
+def fuzz(num_pairs, engine_names=None, modes=MODES, num_workers=None, seed=0, use_cache=True):
+    """
+    Compares engines with the reference on many generated pairs of hands, across a pool of
+    processes. Pairs are dealt in tasks of PAIRS_PER_TASK pairs with their own random
+    streams, so the same seed finds the same mismatches with any number of workers.
+
+    :param num_pairs: Number of pairs of hands.
+    :param engine_names: Names of the engines in ENGINES, or None for all of them.
+    :param modes: Generation modes to cycle through.
+    :param num_workers: Number of processes, or None for one per core. With 1 the tasks run
+    in this process.
+    :param seed: The seed of the run.
+    :param use_cache: False to turn off poker_hand.STRENGTH_CACHE while each task runs, in
+    whichever process runs it, so PokerHand works out every hand again.
+    :return: Dictionary with the number of pairs, the wall time and pairs per second of the
+    whole run, the pairs per second of each engine and of the reference on one core, and per
+    engine the shrunk mismatches as pairs of short card names.
+    """
+    engine_names = list(ENGINES) if engine_names is None else list(engine_names)
+    tasks = []
+    for task_index, start in enumerate(range(0, num_pairs, PAIRS_PER_TASK)):
+        tasks.append((seed, task_index, min(PAIRS_PER_TASK, num_pairs - start), engine_names, modes,
+                      use_cache))
+
+    seconds = collections.Counter()
+    mismatches = {engine_name: [] for engine_name in engine_names}
+    start = time.perf_counter()
+    if num_workers == 1:
+        results = list(map(__fuzz_task, tasks))
+    else:
+        with multiprocessing.Pool(num_workers) as pool:
+            results = pool.map(__fuzz_task, tasks)
+    for task_pairs, (task_seconds, task_mismatches) in results:
+        seconds.update(task_seconds)
+        for engine_name, pairs in task_mismatches.items():
+            mismatches[engine_name].extend(pairs)
+    elapsed = time.perf_counter() - start
+
+    shrunk = {}
+    for engine_name, pairs in mismatches.items():
+        reproducers = {tuple(map(tuple, shrink(ENGINES[engine_name], codes_1, codes_2))) for codes_1, codes_2 in pairs}
+        shrunk[engine_name] = [[' '.join(c.SHORT_NAMES[code] for code in hand) for hand in reproducer]
+                               for reproducer in sorted(reproducers)]
+    return {'pairs': num_pairs, 'elapsed_sec': elapsed, 'pairs_per_sec': num_pairs / elapsed,
+            'engine_pairs_per_sec': {name: num_pairs / engine_seconds if engine_seconds else float('inf')
+                                     for name, engine_seconds in seconds.items()},
+            'mismatches': shrunk}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Checks PokerHand and the fast evaluators against the original compare_to.')
+    parser.add_argument('--pairs', type=int, default=1000000)
+    parser.add_argument('--engines', nargs='+', choices=list(ENGINES), default=None)
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=MODES)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Turn off poker_hand.STRENGTH_CACHE so PokerHand works out every hand again')
+    args = parser.parse_args()
+
+    report = fuzz(args.pairs, args.engines, args.modes, args.workers, args.seed, not args.no_cache)
+    print(f"Pairs: {report['pairs']} in {report['elapsed_sec']:.2f}s ({report['pairs_per_sec']:,.0f} pairs/sec)")
+    for name, pairs_per_sec in report['engine_pairs_per_sec'].items():
+        print(f'{name}: {pairs_per_sec:,.0f} pairs/sec per core')
+    for name, reproducers in report['mismatches'].items():
+        print(f'{name}: {len(reproducers)} mismatches')
+        for hand_1, hand_2 in reproducers:
+            print(f'    {hand_1} vs {hand_2}')
+    if any(report['mismatches'].values()):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
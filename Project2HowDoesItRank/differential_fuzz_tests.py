@@ -0,0 +1,62 @@
+import test_suite as test
+import card as c
+import differential_fuzz as df
+import poker_hand as h
+import rules as ru
+import simulation as sim
+
+
+def __replace(cards, position, code):
+    cards = cards[:position] + [code] + cards[position + 1:]
+    return cards[:h.NUM_CARDS_IN_HAND], cards[h.NUM_CARDS_IN_HAND:]
+
+
+def __utest_differential_fuzz():
+    u_test = test.create()
+
+    report = df.fuzz(4000, num_workers=1, seed=1)
+    test.assert_equals(u_test, "Engines Agree Test", {name: [] for name in df.ENGINES}, report['mismatches'])
+    max_size = h.STRENGTH_CACHE.get_max_size()
+    report = df.fuzz(4000, ['poker_hand'], num_workers=2, seed=2, use_cache=False)
+    test.assert_equals(u_test, "Engines Agree Without Cache Test", {'poker_hand': []}, report['mismatches'])
+    test.assert_equals(u_test, "Cache Size Restored Test", max_size, h.STRENGTH_CACHE.get_max_size())
+
+    def parse_codes(short_names):
+        return [c.parse(short_name) for short_name in short_names.split()]
+    test.assert_equals(u_test, "Reference Trips Are A Pair Test", h.HAND_2_WINS,
+                       df.reference_compare(parse_codes('9S 9H 9D 4C 2S'), parse_codes('3S 3H 2D 2C 4H')))
+    test.assert_equals(u_test, "Reference Full House Is Two Pair Test", h.HAND_2_WINS,
+                       df.reference_compare(parse_codes('5S 5H 5D 4C 4S'), parse_codes('6S 6H 2D 2C 3H')))
+    test.assert_equals(u_test, "Reference Pair Skips Top Kicker Test", h.TIE,
+                       df.reference_compare(parse_codes('8S 8H AD 4C 2S'), parse_codes('8D 8C KS 4H 2H')))
+
+    hands_1, hands_2 = df.generate_pairs(400, sim.get_task_rng(1, 0))
+    test.assert_equals(u_test, "Hands Are Disjoint Test", True,
+                       all(len(set(hand_1 + hand_2)) == df.NUM_CARDS_PER_PAIR
+                           for hand_1, hand_2 in zip(hands_1, hands_2)))
+    test.assert_equals(u_test, "Reproducible Test", (hands_1, hands_2),
+                       df.generate_pairs(400, sim.get_task_rng(1, 0)))
+
+    # An engine that treats three of a kind as better than two pair.
+    def broken_compare(hands_1, hands_2):
+        return [ru.STANDARD_RULES.compare(codes_1, codes_2) for codes_1, codes_2 in zip(hands_1, hands_2)]
+    df.ENGINES['broken'] = broken_compare
+    try:
+        seconds, mismatches = df.fuzz_pairs(hands_1, hands_2, ['broken'])
+        test.assert_equals(u_test, "Broken Engine Caught Test", True, len(mismatches['broken']) > 0)
+        codes_1, codes_2 = df.shrink(broken_compare, *mismatches['broken'][0])
+        cards = codes_1 + codes_2
+        test.assert_equals(u_test, "Shrunk Pair Still Mismatches Test", True,
+                           df.is_mismatch(broken_compare, codes_1, codes_2))
+        test.assert_equals(u_test, "Shrunk Pair Is Minimal Test", True,
+                           all(not df.is_mismatch(broken_compare, *__replace(cards, position, code))
+                               for position in range(df.NUM_CARDS_PER_PAIR) for code in range(cards[position])
+                               if code not in cards))
+    finally:
+        del df.ENGINES['broken']
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_differential_fuzz()
@@ -0,0 +1,203 @@
+import bisect
+import collections
+import itertools
+import math
+import multiprocessing
+import os
+import card as c
+import hand_table as t
+import poker_hand as h
+
+NUM_HANDS = math.comb(c.NUM_CARDS_IN_DECK, h.NUM_CARDS_IN_HAND)
+NUM_TASKS = 64
+TASKS_PER_WORKER = 4
+EXPECTED_TYPE_COUNTS = {h.FLUSH: 5148, h.TWO_PAIR: 127920, h.PAIR: 1153152, h.HIGH_CARD: 1312740}
+
+# The hand 1 codes and hand 2 completion groups of a head_to_head, set once in each worker
+# process so tasks only carry their hand 1 completions.
+WORKER_HANDS = {}
+
+
+def colex_rank(codes):
+    """
+    Gets the position of a set of cards in colexicographic order, where sets are ordered
+    by their highest card first.
+
+    :param codes: Card codes, in any order.
+    :return: The index, from 0 to C(52, len(codes)) - 1.
+    """
+    index = 0
+    for i, code in enumerate(sorted(codes)):
+        index += math.comb(code, i + 1)
+    return index
+
+
+def colex_unrank(index, num_cards=h.NUM_CARDS_IN_HAND):
+    """
+    Gets the set of cards at a position in colexicographic order.
+
+    :param index: The index.
+    :param num_cards: Number of cards in the set.
+    :return: List of card codes from lowest to highest.
+    """
+    codes = [0] * num_cards
+    code = c.NUM_CARDS_IN_DECK
+    for i in range(num_cards, 0, -1):
+        code -= 1
+        while math.comb(code, i) > index:
+            code -= 1
+        codes[i - 1] = code
+        index -= math.comb(code, i)
+    return codes
+
+
+def next_combination(codes):
+    """
+    Changes a set of cards into the next one in colexicographic order.
+
+    :param codes: List of card codes from lowest to highest, changed in place.
+    :return: No return.
+    """
+    i = 0
+    while i < len(codes) - 1 and codes[i] + 1 == codes[i + 1]:
+        codes[i] = i
+        i += 1
+    codes[i] += 1
+
+
+def count_hand_types(start=0, stop=NUM_HANDS):
+    """
+    Counts the type of every five-card hand in a range of colex indexes.
+
+    :param start: First index of the range.
+    :param stop: Index after the last one in the range.
+    :return: Counter of hands keyed by hand type.
+    """
+    strength_counts = collections.Counter()
+    codes = colex_unrank(start)
+    for i in range(start, stop):
+        strength_counts[t.evaluate(codes)] += 1
+        next_combination(codes)
+
+    type_counts = collections.Counter()
+    for strength, count in strength_counts.items():
+        type_counts[t.get_hand_type(strength)] += count
+    return type_counts
+
+
+def __count_hand_types_in_range(index_range):
+    return count_hand_types(*index_range)
+
+
+def census(num_workers=None):
+    """
+    Counts the type of all C(52, 5) hands, splitting the colex indexes between processes.
+
+    :param num_workers: Number of processes, or None for one per core.
+    :return: Counter of hands keyed by hand type.
+    """
+    bounds = [NUM_HANDS * i // NUM_TASKS for i in range(NUM_TASKS + 1)]
+    index_ranges = list(zip(bounds[:-1], bounds[1:]))
+
+    type_counts = collections.Counter()
+    if num_workers == 1:
+        for index_range in index_ranges:
+            type_counts.update(__count_hand_types_in_range(index_range))
+    else:
+        with multiprocessing.Pool(num_workers) as pool:
+            for range_counts in pool.imap_unordered(__count_hand_types_in_range, index_ranges):
+                type_counts.update(range_counts)
+    return type_counts
+
+
+def __group_strengths(hand_codes, remaining):
+    """
+    Evaluates every completion of a hand and groups the strengths by each subset of
+    the cards added, so deals sharing cards with another hand can be excluded.
+
+    :param hand_codes: Card codes already in the hand.
+    :param remaining: Card codes that can complete the hand.
+    :return: Dictionary mapping sorted tuples of card codes to sorted lists of strengths.
+    """
+    groups = collections.defaultdict(list)
+    num_missing = h.NUM_CARDS_IN_HAND - len(hand_codes)
+    for completion in itertools.combinations(remaining, num_missing):
+        strength = t.evaluate(hand_codes + list(completion))
+        for size in range(num_missing + 1):
+            for cards in itertools.combinations(completion, size):
+                groups[cards].append(strength)
+    for strengths in groups.values():
+        strengths.sort()
+    return groups
+
+
+def __count_outcomes(hand_1_codes, hand_2_groups, hand_1_completions):
+    """
+    Compares some completions of hand 1 against every completion of hand 2 that
+    does not share a card with them. Deals sharing cards are removed by
+    inclusion-exclusion over the cards added to hand 1.
+
+    :param hand_1_codes: Card codes already in hand 1.
+    :param hand_2_groups: Strengths of the completions of hand 2, grouped by __group_strengths.
+    :param hand_1_completions: Tuples of card codes that complete hand 1.
+    :return: Dictionary mapping HAND_1_WINS, TIE, and HAND_2_WINS to a number of deals.
+    """
+    outcomes = {h.HAND_1_WINS: 0, h.TIE: 0, h.HAND_2_WINS: 0}
+    for completion_1 in hand_1_completions:
+        strength_1 = t.evaluate(hand_1_codes + list(completion_1))
+        for size in range(len(completion_1) + 1):
+            sign = -1 if size % 2 else 1
+            for cards in itertools.combinations(completion_1, size):
+                strengths = hand_2_groups.get(cards)
+                if strengths:
+                    num_lower = bisect.bisect_left(strengths, strength_1)
+                    num_not_higher = bisect.bisect_right(strengths, strength_1)
+                    outcomes[h.HAND_1_WINS] += sign * num_lower
+                    outcomes[h.TIE] += sign * (num_not_higher - num_lower)
+                    outcomes[h.HAND_2_WINS] += sign * (len(strengths) - num_not_higher)
+    return outcomes
+
+
+def __init_worker(hand_1_codes, hand_2_groups):
+    WORKER_HANDS['hand_1_codes'] = hand_1_codes
+    WORKER_HANDS['hand_2_groups'] = hand_2_groups
+
+
+def __count_outcomes_in_worker(hand_1_completions):
+    return __count_outcomes(WORKER_HANDS['hand_1_codes'], WORKER_HANDS['hand_2_groups'], hand_1_completions)
+
+
+def head_to_head(hand_1, hand_2, game_deck=None, num_workers=1):
+    """
+    Counts exactly how often each hand wins over every way of completing both hands
+    to five cards from the cards that are left.
+
+    :param hand_1: PokerHand with at most 5 cards.
+    :param hand_2: PokerHand with at most 5 cards.
+    :param game_deck: Deck holding the cards that can still be dealt, or None for
+    every card not in either hand.
+    :param num_workers: Number of processes, or None for one per core. Hand 2's completions
+    are evaluated once and handed to each process when it starts, and hand 1's are split
+    into TASKS_PER_WORKER tasks per process.
+    :return: Dictionary mapping HAND_1_WINS, TIE, and HAND_2_WINS to a number of deals.
+    """
+    hand_1_codes = hand_1.get_codes()
+    hand_2_codes = hand_2.get_codes()
+    if game_deck is None:
+        used = set(hand_1_codes + hand_2_codes)
+        remaining = [code for code in range(c.NUM_CARDS_IN_DECK) if code not in used]
+    else:
+        remaining = sorted(game_deck.get_codes())
+
+    hand_1_completions = list(itertools.combinations(remaining, h.NUM_CARDS_IN_HAND - len(hand_1_codes)))
+    hand_2_groups = __group_strengths(hand_2_codes, remaining)
+    if num_workers == 1:
+        return __count_outcomes(hand_1_codes, hand_2_groups, hand_1_completions)
+
+    num_tasks = (num_workers or os.cpu_count()) * TASKS_PER_WORKER
+    tasks = [hand_1_completions[i::num_tasks] for i in range(num_tasks)]
+    outcomes = collections.Counter({h.HAND_1_WINS: 0, h.TIE: 0, h.HAND_2_WINS: 0})
+    with multiprocessing.Pool(num_workers, __init_worker, (hand_1_codes, hand_2_groups)) as pool:
+        for task_outcomes in pool.imap_unordered(__count_outcomes_in_worker, tasks):
+            outcomes.update(task_outcomes)
+    return dict(outcomes)
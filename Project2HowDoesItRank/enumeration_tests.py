@@ -0,0 +1,53 @@
+import test_suite as test
+import card as c
+import enumeration as e
+import poker_hand as h
+
+
+def __utest_colex():
+    u_test = test.create()
+
+    test.assert_equals(u_test, "First Hand Test", [0, 1, 2, 3, 4], e.colex_unrank(0))
+    test.assert_equals(u_test, "Last Hand Test", [47, 48, 49, 50, 51], e.colex_unrank(e.NUM_HANDS - 1))
+
+    codes = e.colex_unrank(123456)
+    e.next_combination(codes)
+    test.assert_equals(u_test, "Next Combination Test", e.colex_unrank(123457), codes)
+    test.assert_equals(u_test, "Rank Unrank Test", 123457, e.colex_rank(codes))
+
+    test.print_summary(u_test)
+    print()
+
+
+def __utest_census():
+    u_test = test.create()
+
+    test.assert_equals(u_test, "Census Test", e.EXPECTED_TYPE_COUNTS, dict(e.census(1)))
+
+    test.print_summary(u_test)
+    print()
+
+
+def __utest_head_to_head():
+    u_test = test.create()
+
+    hand_1 = h.PokerHand([c.Card(14, "Spades"), c.Card(14, "Hearts"), c.Card(9, "Clubs"), c.Card(5, "Clubs")])
+    hand_2 = h.PokerHand([c.Card(13, "Spades"), c.Card(12, "Spades"), c.Card(11, "Spades"),
+                          c.Card(10, "Spades"), c.Card(2, "Diamonds")])
+    outcomes = e.head_to_head(hand_1, hand_2)
+    test.assert_equals(u_test, "Head To Head Total Test", 43, sum(outcomes.values()))
+    test.assert_equals(u_test, "Head To Head Hand 2 Wins Test", 0, outcomes[h.HAND_2_WINS])
+
+    hand_1 = h.PokerHand([c.Card(14, "Spades"), c.Card(13, "Spades")])
+    hand_2 = h.PokerHand([c.Card(9, "Hearts"), c.Card(9, "Clubs")])
+    outcomes = e.head_to_head(hand_1, hand_2, num_workers=1)
+    test.assert_equals(u_test, "Head To Head Two Card Total Test", 245430240, sum(outcomes.values()))
+    test.assert_equals(u_test, "Head To Head Parallel Test", outcomes, e.head_to_head(hand_1, hand_2, num_workers=2))
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_colex()
+    __utest_census()
+    __utest_head_to_head()
@@ -0,0 +1,176 @@
+import itertools
+import math
+import random
+import statistics
+import card as c
+import enumeration as e
+import hand_table as t
+import poker_hand as h
+import simulation as s
+
+EXACT_LIMIT = 5000
+BATCH_SIZE = 2000
+DEFAULT_MAX_SAMPLES = 200000
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_HALF_WIDTH = 0.01
+
+
+def __get_remaining(hand_codes, opponent_codes, game_deck):
+    if game_deck is not None:
+        return sorted(game_deck.get_codes())
+    used = set(hand_codes + opponent_codes)
+    return [code for code in range(c.NUM_CARDS_IN_DECK) if code not in used]
+
+
+def __exact_type_probabilities(hand_codes, remaining):
+    """
+    Works out the probability of each hand type by going through every way the hand
+    can be completed.
+
+    :return: Dictionary mapping hand types to probabilities.
+    """
+    type_counts = dict.fromkeys(h.HAND_TYPE_NAMES, 0)
+    for completion in itertools.combinations(remaining, h.NUM_CARDS_IN_HAND - len(hand_codes)):
+        type_counts[t.get_hand_type(t.evaluate(hand_codes + list(completion)))] += 1
+    num_completions = sum(type_counts.values())
+    return {hand_type: count / num_completions for hand_type, count in type_counts.items()}
+
+
+def __exact_equity(hand, opponent, game_deck, remaining):
+    """
+    Works out the equity by going through every way the hands can be completed.
+
+    :return: Dictionary of results.
+    """
+    outcomes = e.head_to_head(hand, opponent, game_deck)
+    num_deals = sum(outcomes.values())
+    return {
+        'type_probabilities': __exact_type_probabilities(hand.get_codes(), remaining),
+        'win': outcomes[h.HAND_1_WINS] / num_deals,
+        'tie': outcomes[h.TIE] / num_deals,
+        'loss': outcomes[h.HAND_2_WINS] / num_deals,
+        'num_deals': num_deals,
+        'exact': True,
+        'half_width': 0.0,
+    }
+
+
+def __sample_batch(task):
+    """
+    Deals random completions of both hands and tallies the results.
+
+    :param task: Tuple of hand codes, opponent codes, remaining codes, number of deals, seed and batch index.
+    :return: Tuple of the hand's type counts and a dictionary of outcome counts.
+    """
+    hand_codes, opponent_codes, remaining, num_deals, seed, batch_index = task
+    rng = s.get_task_rng(seed, batch_index)
+    num_missing = h.NUM_CARDS_IN_HAND - len(hand_codes)
+    num_drawn = num_missing + h.NUM_CARDS_IN_HAND - len(opponent_codes)
+    type_counts = dict.fromkeys(h.HAND_TYPE_NAMES, 0)
+    outcomes = {h.HAND_1_WINS: 0, h.TIE: 0, h.HAND_2_WINS: 0}
+    for i in range(num_deals):
+        drawn = rng.sample(remaining, num_drawn)
+        strength_1 = t.evaluate(hand_codes + drawn[:num_missing])
+        strength_2 = t.evaluate(opponent_codes + drawn[num_missing:])
+        type_counts[t.get_hand_type(strength_1)] += 1
+        if strength_1 > strength_2:
+            outcomes[h.HAND_1_WINS] += 1
+        elif strength_1 < strength_2:
+            outcomes[h.HAND_2_WINS] += 1
+        else:
+            outcomes[h.TIE] += 1
+    return type_counts, outcomes
+
+
+def __sampled_equity(hand, opponent, remaining, confidence, half_width, max_samples, seed, pool, pool_size):
+    """
+    Estimates the equity from random deals, in batches, until the confidence interval
+    of every outcome probability is narrower than half_width on each side.
+
+    :return: Dictionary of results.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+    num_parallel = 1 if pool is None else pool_size
+    hand_codes = hand.get_codes()
+    opponent_codes = opponent.get_codes()
+
+    type_counts = dict.fromkeys(h.HAND_TYPE_NAMES, 0)
+    outcomes = {h.HAND_1_WINS: 0, h.TIE: 0, h.HAND_2_WINS: 0}
+    num_deals = 0
+    batch_index = 0
+    widest = 1.0
+    while num_deals < max_samples and widest > half_width:
+        tasks = []
+        for i in range(num_parallel):
+            tasks.append((hand_codes, opponent_codes, remaining, BATCH_SIZE, seed, batch_index))
+            batch_index += 1
+        results = map(__sample_batch, tasks) if pool is None else pool.map(__sample_batch, tasks)
+        for batch_type_counts, batch_outcomes in results:
+            for hand_type, count in batch_type_counts.items():
+                type_counts[hand_type] += count
+            for outcome, count in batch_outcomes.items():
+                outcomes[outcome] += count
+        num_deals += BATCH_SIZE * num_parallel
+        widest = max(z * math.sqrt(count / num_deals * (1 - count / num_deals) / num_deals)
+                     for count in outcomes.values())
+
+    return {
+        'type_probabilities': {hand_type: count / num_deals for hand_type, count in type_counts.items()},
+        'win': outcomes[h.HAND_1_WINS] / num_deals,
+        'tie': outcomes[h.TIE] / num_deals,
+        'loss': outcomes[h.HAND_2_WINS] / num_deals,
+        'num_deals': num_deals,
+        'exact': False,
+        'half_width': widest,
+    }
+
+
+def calculate_equity(hand, opponent=None, game_deck=None, exact=None, confidence=DEFAULT_CONFIDENCE,
+                     half_width=DEFAULT_HALF_WIDTH, max_samples=DEFAULT_MAX_SAMPLES, seed=None, pool=None,
+                     pool_size=None):
+    """
+    Works out how a partially dealt hand will end up, and how likely it is to beat an
+    opponent once both hands have 5 cards.
+
+    :param hand: PokerHand with at most 5 cards.
+    :param opponent: PokerHand with at most 5 cards, or None for an opponent with no cards yet.
+    :param game_deck: Deck holding the cards that can still be dealt, or None for every
+    card not in either hand.
+    :param exact: True to go through every deal, False to sample deals, or None to go
+    through every deal only when there are at most EXACT_LIMIT ways to complete each hand.
+    When deals are sampled, the hand type probabilities are still exact if the hand alone
+    has at most EXACT_LIMIT completions.
+    :param confidence: Confidence level of the sampled estimate.
+    :param half_width: Sampling stops once every win, tie, and loss probability is known
+    to within this much at the given confidence.
+    :param max_samples: Sampling stops after this many deals even if it is less precise.
+    :param seed: Seed of the sampled deals, or None for a random one.
+    :param pool: multiprocessing.Pool to sample batches in parallel, or None to sample here.
+    :param pool_size: Number of batches to sample at a time in the pool, normally its number
+    of processes. Needed whenever pool is given.
+    :return: Dictionary with the probability of each hand type for the hand, the win,
+    tie, and loss probabilities, the number of deals used, whether those probabilities
+    are exact, and the half width of the widest confidence interval.
+    :raises ValueError: if pool is given without a positive pool_size.
+    """
+    if pool is not None and (pool_size is None or pool_size <= 0):
+        raise ValueError(f'A pool needs the number of batches to sample at a time: {pool_size}')
+    if opponent is None:
+        opponent = h.PokerHand([])
+    hand_codes = hand.get_codes()
+    opponent_codes = opponent.get_codes()
+    remaining = __get_remaining(hand_codes, opponent_codes, game_deck)
+
+    num_hand_completions = math.comb(len(remaining), h.NUM_CARDS_IN_HAND - len(hand_codes))
+    num_opponent_completions = math.comb(len(remaining), h.NUM_CARDS_IN_HAND - len(opponent_codes))
+    if exact is None:
+        exact = max(num_hand_completions, num_opponent_completions) <= EXACT_LIMIT
+
+    if exact:
+        return __exact_equity(hand, opponent, game_deck, remaining)
+    equity = __sampled_equity(hand, opponent, remaining, confidence, half_width, max_samples, seed, pool, pool_size)
+    if num_hand_completions <= EXACT_LIMIT:
+        equity['type_probabilities'] = __exact_type_probabilities(hand_codes, remaining)
+    return equity
@@ -0,0 +1,56 @@
+import multiprocessing
+import test_suite as test
+import card as c
+import equity as eq
+import poker_hand as h
+
+
+class SerialPool:
+
+    def map(self, function, tasks):
+        """
+        Runs the tasks in this process, in place of a multiprocessing.Pool.
+        """
+        return list(map(function, tasks))
+
+
+def __utest_equity():
+    u_test = test.create()
+
+    hand = h.PokerHand([c.Card(14, "Spades"), c.Card(14, "Hearts"), c.Card(9, "Clubs")])
+    opponent = h.PokerHand([c.Card(13, "Spades"), c.Card(12, "Spades"), c.Card(11, "Spades")])
+
+    exact = eq.calculate_equity(hand, opponent)
+    test.assert_equals(u_test, "Exact Mode Test", True, exact['exact'])
+    test.assert_equals(u_test, "Exact Probabilities Add Up Test", 1.0,
+                       round(exact['win'] + exact['tie'] + exact['loss'], 9))
+
+    sampled = eq.calculate_equity(hand, opponent, exact=False, seed=1, half_width=0.005)
+    test.assert_equals(u_test, "Sampled Within Interval Test", True,
+                       abs(sampled['win'] - exact['win']) < 2 * sampled['half_width'])
+    test.assert_equals(u_test, "Sampled Same Seed Test", sampled,
+                       eq.calculate_equity(hand, opponent, exact=False, seed=1, half_width=0.005))
+
+    with multiprocessing.Pool(2) as pool:
+        pooled = eq.calculate_equity(hand, opponent, exact=False, seed=1, half_width=0.02, pool=pool, pool_size=2)
+    test.assert_equals(u_test, "Pool Size Batches Test", 0, pooled['num_deals'] % (2 * eq.BATCH_SIZE))
+    test.assert_equals(u_test, "Pool Size Parameter Test", pooled,
+                       eq.calculate_equity(hand, opponent, exact=False, seed=1, half_width=0.02,
+                                           pool=SerialPool(), pool_size=2))
+
+    try:
+        eq.calculate_equity(hand, opponent, exact=False, pool=SerialPool())
+        rejected = False
+    except ValueError:
+        rejected = True
+    test.assert_equals(u_test, "Pool Without Size Test", True, rejected)
+
+    hand = h.PokerHand([c.Card(2, "Hearts"), c.Card(7, "Hearts"), c.Card(14, "Hearts"), c.Card(9, "Hearts")])
+    type_probabilities = eq.calculate_equity(hand)['type_probabilities']
+    test.assert_equals(u_test, "Flush Draw Test", round(9 / 48, 9), round(type_probabilities[h.FLUSH], 9))
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_equity()
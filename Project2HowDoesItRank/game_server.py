@@ -0,0 +1,260 @@
+import argparse
+import asyncio
+import random
+import time
+import card as c
+import deck as d
+import hand_table as t
+import poker_hand as h
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+BACKLOG = 4096
+NUM_HANDS_PER_ROUND = 2
+VALID_GUESSES = {str(h.HAND_1_WINS): h.HAND_1_WINS, str(h.TIE): h.TIE, str(h.HAND_2_WINS): h.HAND_2_WINS}
+CORRECT_ANSWERS = 'correct'
+RANDOM_ANSWERS = 'random'
+DEAL_STAGE = 'deal'
+EVALUATE_STAGE = 'evaluate'
+
+
+def format_hand(label, codes):
+    """
+    Formats a protocol line holding a hand, such as "HAND1 AS KD 8H 8C 2S".
+
+    :param label: HAND1 or HAND2.
+    :param codes: Card codes of the hand.
+    :return: The line.
+    """
+    return f"{label} {' '.join(c.SHORT_NAMES[code] for code in codes)}\n"
+
+
+class GameServer:
+
+    def __init__(self, rng=None, histograms=None):
+        """
+        Constructs a server for the "which hand is worth more" game. Every connection
+        plays its own game with its own deck. Hands are compared on the event loop: a
+        table lookup takes about a microsecond, far less than sending it to another
+        process or thread would.
+
+        Each round the server sends "HAND1 <cards>", "HAND2 <cards>" and "GUESS". The
+        client answers 1, -1 or 0 and the server replies "CORRECT <score>" or
+        "WRONG <answer> <score>". The game ends, with "END <score>", after a wrong guess
+        or when fewer than 5 cards are left, just like main.
+
+        :param rng: random.Random used to shuffle the decks, or None to use the random module.
+        :param histograms: Dictionary mapping DEAL_STAGE and EVALUATE_STAGE to objects with a
+        record(nanoseconds) method, to time those stages of every round, or None.
+        """
+        self.__rng = rng
+        self.__histograms = histograms
+        self.__num_sessions = 0
+        self.__num_active_sessions = 0
+        self.__num_rounds = 0
+
+    def get_num_sessions(self):
+        """
+        Gets and returns the number of sessions started.
+
+        :return: The number of sessions.
+        """
+        return self.__num_sessions
+
+    def get_num_active_sessions(self):
+        """
+        Gets and returns the number of sessions still being played.
+
+        :return: The number of active sessions.
+        """
+        return self.__num_active_sessions
+
+    def get_num_rounds(self):
+        """
+        Gets and returns the number of rounds played in every session.
+
+        :return: The number of rounds.
+        """
+        return self.__num_rounds
+
+    async def __read_guess(self, reader, writer):
+        """
+        Asks for a guess until the client sends a valid one.
+
+        :return: The guess, or None if the client disconnected or sent a line longer than
+        the stream limit, which ends the session.
+        """
+        while True:
+            writer.write(b'GUESS\n')
+            await writer.drain()
+            try:
+                line = await reader.readline()
+            except ValueError:
+                writer.write(b'ERROR Line too long\n')
+                return None
+            if not line:
+                return None
+            guess = VALID_GUESSES.get(line.decode('ascii', 'replace').strip())
+            if guess is not None:
+                return guess
+            writer.write(b'ERROR Enter 1 for Hand 1, -1 for Hand 2, or 0 for a Tie\n')
+
+    async def play_session(self, reader, writer):
+        """
+        Plays one game with a connected client.
+
+        :param reader: asyncio.StreamReader of the connection.
+        :param writer: asyncio.StreamWriter of the connection.
+        :return: The final score.
+        """
+        self.__num_sessions += 1
+        self.__num_active_sessions += 1
+        game_deck = d.Deck(self.__rng)
+        total_score = 0
+        correct_answer = True
+        try:
+            while not game_deck.less_than_5_cards() and correct_answer:
+                if self.__histograms is None:
+                    hand_1_codes, hand_2_codes = game_deck.deal_hands(NUM_HANDS_PER_ROUND)
+                    actual_result = t.compare(hand_1_codes, hand_2_codes)
+                else:
+                    deal_start = time.perf_counter_ns()
+                    hand_1_codes, hand_2_codes = game_deck.deal_hands(NUM_HANDS_PER_ROUND)
+                    evaluate_start = time.perf_counter_ns()
+                    actual_result = t.compare(hand_1_codes, hand_2_codes)
+                    evaluate_stop = time.perf_counter_ns()
+                    self.__histograms[DEAL_STAGE].record(evaluate_start - deal_start)
+                    self.__histograms[EVALUATE_STAGE].record(evaluate_stop - evaluate_start)
+                writer.write((format_hand('HAND1', hand_1_codes) + format_hand('HAND2', hand_2_codes)).encode('ascii'))
+
+                guess = await self.__read_guess(reader, writer)
+                if guess is None:
+                    break
+                self.__num_rounds += 1
+                if guess != actual_result:
+                    correct_answer = False
+                    writer.write(f'WRONG {actual_result} {total_score}\n'.encode('ascii'))
+                else:
+                    total_score += 1
+                    writer.write(f'CORRECT {total_score}\n'.encode('ascii'))
+
+            writer.write(f'END {total_score}\n'.encode('ascii'))
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.__num_active_sessions -= 1
+            await close_writer(writer)
+        return total_score
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None):
+        """
+        Starts listening for sessions.
+
+        :param host: Host to listen on.
+        :param port: TCP port to listen on, or 0 for any free port.
+        :param path: Path of a Unix socket to listen on instead of TCP, or None.
+        :return: The asyncio server.
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self.play_session, path=path, backlog=BACKLOG)
+        return await asyncio.start_server(self.play_session, host, port, backlog=BACKLOG)
+
+
+async def close_writer(writer):
+    """
+    Closes a connection and waits until it is closed, ignoring a peer that already left.
+
+    :param writer: asyncio.StreamWriter of the connection.
+    """
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except ConnectionError:
+        pass
+
+
+def __parse_hand(line):
+    return [c.parse(short_name) for short_name in line.split()[1:]]
+
+
+async def play_client(host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, answers=CORRECT_ANSWERS, rng=random):
+    """
+    Plays one game against a server as a simulated player.
+
+    :param host: Host of the server.
+    :param port: TCP port of the server.
+    :param path: Path of the server's Unix socket, or None to use TCP.
+    :param answers: CORRECT_ANSWERS to always answer right, or RANDOM_ANSWERS to guess.
+    :param rng: random.Random used for random answers.
+    :return: The final score sent by the server.
+    """
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+
+    hands = {}
+    final_score = None
+    while final_score is None:
+        line = (await reader.readline()).decode('ascii')
+        if not line:
+            break
+        kind = line.split()[0]
+        if kind in ('HAND1', 'HAND2'):
+            hands[kind] = __parse_hand(line)
+        elif kind == 'GUESS':
+            if answers == CORRECT_ANSWERS:
+                guess = t.compare(hands['HAND1'], hands['HAND2'])
+            else:
+                guess = rng.choice(list(VALID_GUESSES.values()))
+            writer.write(f'{guess}\n'.encode('ascii'))
+            await writer.drain()
+        elif kind == 'END':
+            final_score = int(line.split()[1])
+    await close_writer(writer)
+    return final_score
+
+
+async def simulate_clients(num_clients, host=DEFAULT_HOST, port=DEFAULT_PORT, path=None, answers=CORRECT_ANSWERS):
+    """
+    Plays many games against a server at the same time.
+
+    :param num_clients: Number of simulated players.
+    :param host: Host of the server.
+    :param port: TCP port of the server.
+    :param path: Path of the server's Unix socket, or None to use TCP.
+    :param answers: CORRECT_ANSWERS or RANDOM_ANSWERS.
+    :return: List of the final scores.
+    """
+    return await asyncio.gather(*[play_client(host, port, path, answers) for i in range(num_clients)])
+
+
+async def __run(args):
+    game_server = GameServer()
+    server = await game_server.start(args.host, args.port, args.path)
+    async with server:
+        if args.simulate:
+            port = server.sockets[0].getsockname()[1] if args.path is None else None
+            scores = await simulate_clients(args.simulate, args.host, port, args.path, args.answers)
+            print(f'Sessions: {game_server.get_num_sessions()}')
+            print(f'Rounds: {game_server.get_num_rounds()}')
+            print(f'Average score: {sum(scores) / len(scores):.3f}')
+        else:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Hosts the "which hand is worth more" game for many players.')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--path', help='Path of a Unix socket to listen on instead of TCP')
+    parser.add_argument('--simulate', type=int, default=0,
+                        help='Play this many simulated players against the server, then exit')
+    parser.add_argument('--answers', choices=[CORRECT_ANSWERS, RANDOM_ANSWERS], default=CORRECT_ANSWERS)
+    args = parser.parse_args()
+    asyncio.run(__run(args))
+
+
+if __name__ == '__main__':
+    main()
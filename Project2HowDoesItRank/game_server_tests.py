@@ -0,0 +1,83 @@
+import asyncio
+import random
+import test_suite as test
+import game_server as g
+import latency_histogram as lh
+
+NUM_TEST_CLIENTS = 20
+NUM_ROUNDS_PER_GAME = 5
+# More than the 64 KiB an asyncio stream buffers while looking for the end of a line.
+LONG_LINE_SIZE = 1 << 17
+
+
+async def __play_games(answers, histograms=None):
+    """
+    Starts a server on a free port, plays NUM_TEST_CLIENTS games against it at once and
+    returns the server and the final scores.
+    """
+    game_server = g.GameServer(random.Random(1), histograms)
+    server = await game_server.start(g.DEFAULT_HOST, 0)
+    async with server:
+        port = server.sockets[0].getsockname()[1]
+        scores = await g.simulate_clients(NUM_TEST_CLIENTS, g.DEFAULT_HOST, port, answers=answers)
+    return game_server, scores
+
+
+async def __send_bad_guess(guess):
+    """
+    Answers the first GUESS with something that is not a guess, reads the two lines the
+    server sends back, then leaves, and returns the server and the kind of every line it sent.
+    """
+    game_server = g.GameServer(random.Random(1))
+    server = await game_server.start(g.DEFAULT_HOST, 0)
+    async with server:
+        reader, writer = await asyncio.open_connection(g.DEFAULT_HOST, server.sockets[0].getsockname()[1])
+        lines = [await reader.readline() for i in range(3)]
+        writer.write(guess)
+        lines.append(await reader.readline())
+        lines.append(await reader.readline())
+        await g.close_writer(writer)
+        while game_server.get_num_active_sessions():
+            await asyncio.sleep(0.01)
+    return game_server, [line.decode('ascii').split()[0] for line in lines]
+
+
+def __utest_game_server():
+    u_test = test.create()
+
+    histograms = {g.DEAL_STAGE: lh.LatencyHistogram(), g.EVALUATE_STAGE: lh.LatencyHistogram()}
+    game_server, scores = asyncio.run(__play_games(g.CORRECT_ANSWERS, histograms))
+    test.assert_equals(u_test, "Correct Answers Score Test", [NUM_ROUNDS_PER_GAME] * NUM_TEST_CLIENTS, scores)
+    test.assert_equals(u_test, "Sessions Test", NUM_TEST_CLIENTS, game_server.get_num_sessions())
+    test.assert_equals(u_test, "Sessions Ended Test", 0, game_server.get_num_active_sessions())
+    test.assert_equals(u_test, "Rounds Test", NUM_ROUNDS_PER_GAME * NUM_TEST_CLIENTS, game_server.get_num_rounds())
+    test.assert_equals(u_test, "Deal Timed Test", NUM_ROUNDS_PER_GAME * NUM_TEST_CLIENTS,
+                       histograms[g.DEAL_STAGE].get_total_count())
+    test.assert_equals(u_test, "Evaluate Timed Test", NUM_ROUNDS_PER_GAME * NUM_TEST_CLIENTS,
+                       histograms[g.EVALUATE_STAGE].get_total_count())
+
+    game_server, scores = asyncio.run(__play_games(g.RANDOM_ANSWERS))
+    test.assert_equals(u_test, "Random Answers Score Test", True,
+                       all(0 <= score <= NUM_ROUNDS_PER_GAME for score in scores))
+    num_wrong_answers = sum(score < NUM_ROUNDS_PER_GAME for score in scores)
+    test.assert_equals(u_test, "Random Answers Rounds Test", sum(scores) + num_wrong_answers,
+                       game_server.get_num_rounds())
+
+    game_server, kinds = asyncio.run(__send_bad_guess(b'x\n'))
+    test.assert_equals(u_test, "Bad Guess Test", ['HAND1', 'HAND2', 'GUESS', 'ERROR', 'GUESS'], kinds)
+    test.assert_equals(u_test, "Client Left Test", (1, 0, 0),
+                       (game_server.get_num_sessions(), game_server.get_num_active_sessions(),
+                        game_server.get_num_rounds()))
+
+
+    game_server, kinds = asyncio.run(__send_bad_guess(b'1' * LONG_LINE_SIZE))
+    test.assert_equals(u_test, "Long Line Test", ['HAND1', 'HAND2', 'GUESS', 'ERROR', 'END'], kinds)
+    test.assert_equals(u_test, "Long Line Ended Session Test", (1, 0, 0),
+                       (game_server.get_num_sessions(), game_server.get_num_active_sessions(),
+                        game_server.get_num_rounds()))
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_game_server()
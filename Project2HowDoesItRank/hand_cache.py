@@ -0,0 +1,109 @@
+import collections
+import threading
+
+DEFAULT_MAX_SIZE = 8192
+
+
+class HandCache:
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        Constructs an empty cache that keeps at most max_size entries. When it is full,
+        the entry that was used least recently is removed.
+
+        Lookups reorder the entries, so every method holds a lock, and the cache can be
+        shared by threads such as the workers of a ThreadPoolExecutor.
+
+        :param max_size: The most entries the cache keeps.
+        """
+        self.__entries = collections.OrderedDict()
+        self.__max_size = max_size
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = threading.Lock()
+
+    def get(self, signature):
+        """
+        Looks up the value stored for a hand signature.
+
+        :param signature: The hand signature.
+        :return: The stored value, or None if the signature is not in the cache.
+        """
+        with self.__lock:
+            value = self.__entries.get(signature)
+            if value is None:
+                self.__misses += 1
+            else:
+                self.__hits += 1
+                self.__entries.move_to_end(signature)
+            return value
+
+    def put(self, signature, value):
+        """
+        Stores the value for a hand signature.
+
+        :param signature: The hand signature.
+        :param value: The value to store.
+        :return: No return.
+        """
+        with self.__lock:
+            self.__entries[signature] = value
+            self.__entries.move_to_end(signature)
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes every entry and resets the hit and miss counters.
+
+        :return: No return.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    def get_size(self):
+        """
+        Gets and returns the number of entries in the cache.
+
+        :return: The number of entries.
+        """
+        return len(self.__entries)
+
+    def get_max_size(self):
+        """
+        Gets and returns the most entries the cache keeps.
+
+        :return: The size bound.
+        """
+        return self.__max_size
+
+    def set_max_size(self, max_size):
+        """
+        Changes the most entries the cache keeps, removing the least recently used
+        entries if there are too many.
+
+        :param max_size: The new size bound.
+        :return: No return.
+        """
+        with self.__lock:
+            self.__max_size = max_size
+            while len(self.__entries) > self.__max_size:
+                self.__entries.popitem(last=False)
+
+    def get_hits(self):
+        """
+        Gets and returns the number of lookups that found a value.
+
+        :return: The number of hits.
+        """
+        return self.__hits
+
+    def get_misses(self):
+        """
+        Gets and returns the number of lookups that did not find a value.
+
+        :return: The number of misses.
+        """
+        return self.__misses
@@ -0,0 +1,69 @@
+import concurrent.futures
+import random
+import test_suite as test
+import hand_cache as hc
+import poker_hand as h
+
+NUM_TEST_THREADS = 8
+NUM_TEST_LOOKUPS = 20000
+
+
+def __utest_hand_cache():
+    u_test = test.create()
+
+    cache = hc.HandCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    test.assert_equals(u_test, "Least Recently Used Evicted Test", None, cache.get('b'))
+    test.assert_equals(u_test, "Recently Used Kept Test", 1, cache.get('a'))
+    test.assert_equals(u_test, "Size Bound Test", 2, cache.get_size())
+    test.assert_equals(u_test, "Hits Test", 2, cache.get_hits())
+    test.assert_equals(u_test, "Misses Test", 1, cache.get_misses())
+
+    cache.set_max_size(1)
+    test.assert_equals(u_test, "Shrink Test", 1, cache.get('a'))
+    test.assert_equals(u_test, "Shrink Evicts Test", None, cache.get('c'))
+
+    test.print_summary(u_test)
+
+
+def __use_cache(cache, seed):
+    """
+    Looks up and stores random signatures, many more than the cache holds, so entries keep
+    being moved and evicted.
+    """
+    rng = random.Random(seed)
+    for i in range(NUM_TEST_LOOKUPS):
+        signature = rng.randrange(4 * cache.get_max_size())
+        if cache.get(signature) is None:
+            cache.put(signature, signature + 1)
+    return True
+
+
+def __utest_threads():
+    u_test = test.create()
+
+    cache = hc.HandCache(64)
+    with concurrent.futures.ThreadPoolExecutor(NUM_TEST_THREADS) as executor:
+        results = list(executor.map(__use_cache, [cache] * NUM_TEST_THREADS, range(NUM_TEST_THREADS)))
+    test.assert_equals(u_test, "Threads Finished Test", [True] * NUM_TEST_THREADS, results)
+    test.assert_equals(u_test, "Every Lookup Counted Test", NUM_TEST_THREADS * NUM_TEST_LOOKUPS,
+                       cache.get_hits() + cache.get_misses())
+    test.assert_equals(u_test, "Size Bound Under Threads Test", 64, cache.get_size())
+
+    hands = [h.hand_from_codes(random.Random(i).sample(range(52), h.NUM_CARDS_IN_HAND)) for i in range(2000)]
+    expected = [hand.get_strength() for hand in hands]
+    h.STRENGTH_CACHE.clear()
+    with concurrent.futures.ThreadPoolExecutor(NUM_TEST_THREADS) as executor:
+        strengths = list(executor.map(lambda hand: h.hand_from_codes(hand.get_codes()).get_strength(), hands))
+    test.assert_equals(u_test, "Shared Strength Cache Test", expected, strengths)
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_hand_cache()
+    __utest_threads()
@@ -0,0 +1,223 @@
+import argparse
+import itertools
+import multiprocessing
+import os
+import shutil
+import card as c
+import hand_table as t
+import poker_hand as h
+
+CHUNK_SIZE = 4096
+NUM_TASKS_PER_WORKER = 4
+
+
+def parse_hand(line, line_number=None):
+    """
+    Parses one line of a hand history, such as "AS KD 8H 8C 2S". Cards may be
+    separated by spaces or commas.
+
+    :param line: The line.
+    :param line_number: Number of the line in its file, used in error messages.
+    :return: List of five different card codes, or an empty list for a blank line.
+    :raises ValueError: if the line is not five different cards.
+    """
+    where = '' if line_number is None else f'Line {line_number}: '
+    try:
+        codes = [c.parse(short_name) for short_name in line.replace(',', ' ').split()]
+    except ValueError as error:
+        raise ValueError(f'{where}{error}') from None
+    if codes and (len(codes) != h.NUM_CARDS_IN_HAND or len(set(codes)) != len(codes)):
+        raise ValueError(f'{where}Expected {h.NUM_CARDS_IN_HAND} different cards: {line.strip()}')
+    return codes
+
+
+def read_hands(lines, first_line_number=1):
+    """
+    Parses lines lazily, skipping blank lines.
+
+    :param lines: Iterable of lines, such as an open file.
+    :param first_line_number: Number of the first line in its file, used in error messages.
+    :return: Generator of lists of card codes.
+    :raises ValueError: if a line is not five different cards.
+    """
+    for line_number, line in enumerate(lines, first_line_number):
+        codes = parse_hand(line, line_number)
+        if codes:
+            yield codes
+
+
+def iter_chunks(items, chunk_size=CHUNK_SIZE):
+    """
+    Groups an iterable into lists of at most chunk_size items.
+
+    :param items: The iterable.
+    :param chunk_size: The most items in a chunk.
+    :return: Generator of lists.
+    """
+    items = iter(items)
+    chunk = list(itertools.islice(items, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(items, chunk_size))
+
+
+def format_result(codes, strength):
+    """
+    Formats the evaluation of one hand as a CSV line.
+
+    :param codes: Card codes of the hand.
+    :param strength: Strength key of the hand.
+    :return: The line, "cards,hand type,strength".
+    """
+    hand_type = t.get_hand_type(strength)
+    return f"{' '.join(c.SHORT_NAMES[code] for code in codes)},{h.HAND_TYPE_NAMES[hand_type]},{strength}\n"
+
+
+def rank_lines(lines, output_file, first_line_number=1):
+    """
+    Evaluates the hands in some lines chunk by chunk and writes one result line per hand,
+    so memory use does not depend on the number of lines.
+
+    :param lines: Iterable of lines.
+    :param output_file: Open text file to write to.
+    :param first_line_number: Number of the first line in its file, used in error messages.
+    :return: Number of hands written.
+    """
+    num_hands = 0
+    for chunk in iter_chunks(read_hands(lines, first_line_number)):
+        output_file.writelines(format_result(codes, t.evaluate(codes)) for codes in chunk)
+        num_hands += len(chunk)
+    return num_hands
+
+
+def __read_byte_range(input_path, start, stop):
+    """
+    Reads the lines that start inside a range of bytes of a file. Every line belongs to
+    exactly one range, no matter where the range boundaries fall.
+
+    :param input_path: Path of the file.
+    :param start: First byte of the range.
+    :param stop: Byte after the last one in the range.
+    :return: Generator of lines, as bytes.
+    """
+    with open(input_path, 'rb') as input_file:
+        if start > 0:
+            input_file.seek(start - 1)
+            input_file.readline()
+        while input_file.tell() < stop:
+            line = input_file.readline()
+            if not line:
+                break
+            yield line
+
+
+def __decode_lines(lines, first_line_number=None):
+    """
+    Decodes lines read from a hand history, which must be ASCII text.
+
+    :param lines: Iterable of lines, as bytes.
+    :param first_line_number: Number of the first line in its file, used in error messages,
+    or None if it is not known.
+    :return: Generator of lines, as strings.
+    :raises ValueError: if a line is not ASCII text.
+    """
+    for line_number, line in enumerate(lines, first_line_number or 1):
+        try:
+            yield line.decode('ascii')
+        except UnicodeDecodeError:
+            where = '' if first_line_number is None else f'Line {line_number}: '
+            raise ValueError(f'{where}Not ASCII text: {line.strip()!r}') from None
+
+
+def __count_lines_before(input_path, start):
+    """
+    Counts the lines of a file that start before the first line __read_byte_range reads
+    for a range beginning at start.
+
+    :param input_path: Path of the file.
+    :param start: First byte of the range.
+    :return: The number of lines.
+    """
+    if start == 0:
+        return 0
+    num_lines = 1
+    with open(input_path, 'rb') as input_file:
+        remaining = start - 1
+        while remaining > 0:
+            block = input_file.read(min(remaining, CHUNK_SIZE * 16))
+            num_lines += block.count(b'\n')
+            remaining -= len(block)
+    return num_lines
+
+
+def __rank_byte_range(task):
+    input_path, start, stop, part_path = task
+    try:
+        with open(part_path, 'w') as part_file:
+            return rank_lines(__decode_lines(__read_byte_range(input_path, start, stop)), part_file)
+    except ValueError:
+        # Line numbers are only worth counting from the start of the file once a line turns
+        # out to be bad, so rank the range again with them to raise the error with the right one.
+        first_line_number = __count_lines_before(input_path, start) + 1
+        with open(part_path, 'w') as part_file:
+            lines = __decode_lines(__read_byte_range(input_path, start, stop), first_line_number)
+            return rank_lines(lines, part_file, first_line_number)
+
+
+def __remove_parts(part_paths):
+    for part_path in part_paths:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+
+
+def rank_file(input_path, output_path, num_workers=1):
+    """
+    Evaluates every hand in a hand history file and writes the results as CSV, in the
+    same order as the input. With more than one worker, the file is split into byte
+    ranges that are ranked by separate processes and then joined. The results are written
+    next to output_path and only moved there once every hand is ranked, so a failed run
+    leaves no output behind.
+
+    :param input_path: Path of the hand history.
+    :param output_path: Path of the CSV file to write.
+    :param num_workers: Number of processes, or None for one per core.
+    :return: Number of hands written.
+    :raises ValueError: if a line is not ASCII text or not five different cards.
+    """
+    joined_path = f'{output_path}.part'
+    tasks = []
+    try:
+        if num_workers == 1:
+            with open(input_path, 'rb') as input_file, open(joined_path, 'w') as output_file:
+                num_hands = rank_lines(__decode_lines(input_file, 1), output_file)
+        else:
+            num_tasks = (num_workers or os.cpu_count()) * NUM_TASKS_PER_WORKER
+            size = os.path.getsize(input_path)
+            bounds = [size * i // num_tasks for i in range(num_tasks + 1)]
+            tasks = [(input_path, bounds[i], bounds[i + 1], f'{output_path}.part{i}') for i in range(num_tasks)]
+            with multiprocessing.Pool(num_workers) as pool:
+                num_hands = sum(pool.map(__rank_byte_range, tasks))
+
+            with open(joined_path, 'wb') as output_file:
+                for task in tasks:
+                    with open(task[-1], 'rb') as part_file:
+                        shutil.copyfileobj(part_file, output_file)
+        os.replace(joined_path, output_path)
+    finally:
+        __remove_parts([joined_path] + [task[-1] for task in tasks])
+    return num_hands
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Evaluates every hand in a hand history file.')
+    parser.add_argument('input')
+    parser.add_argument('output')
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    num_hands = rank_file(args.input, args.output, args.workers)
+    print(f'Hands: {num_hands}')
+
+
+if __name__ == '__main__':
+    main()
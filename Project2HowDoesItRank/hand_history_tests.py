@@ -0,0 +1,101 @@
+import os
+import random
+import tempfile
+import test_suite as test
+import card as c
+import hand_history as hh
+import poker_hand as h
+
+NUM_TEST_HANDS = 3000
+
+
+def __write(path, text):
+    with open(path, 'w', newline='') as output_file:
+        output_file.write(text)
+
+
+def __read(path):
+    with open(path) as input_file:
+        return input_file.read()
+
+
+def __rank(directory, text, num_workers):
+    """
+    Ranks a hand history given as text and returns the output, or the message of the
+    ValueError raised, along with any files other than the input left in the directory.
+    """
+    input_path = os.path.join(directory, 'hands.txt')
+    output_path = os.path.join(directory, f'ranked_{num_workers}.csv')
+    __write(input_path, text)
+    try:
+        hh.rank_file(input_path, output_path, num_workers)
+        result = __read(output_path)
+        os.remove(output_path)
+    except ValueError as error:
+        result = str(error)
+    return result, sorted(name for name in os.listdir(directory) if name != 'hands.txt')
+
+
+def __utest_parse_hand():
+    u_test = test.create()
+
+    test.assert_equals(u_test, "Parse Test", [c.parse(name) for name in ['AS', 'KD', '8H', '8C', '2S']],
+                       hh.parse_hand('AS KD 8H 8C 2S\n'))
+    test.assert_equals(u_test, "Commas Test", hh.parse_hand('AS KD 8H 8C 2S'), hh.parse_hand('AS,KD, 8H,8C,2S'))
+    test.assert_equals(u_test, "Blank Line Test", [], hh.parse_hand('  \n'))
+    for line in ['AS AS KS QS JS', 'AS AS KD QD JD', 'AS KD 8H 8C', 'AS KD 8H 8C 2S 3S', 'AS KD 8H 8C 1S']:
+        try:
+            hh.parse_hand(line, 7)
+            message = None
+        except ValueError as error:
+            message = str(error)
+        test.assert_equals(u_test, f"Rejects {line} Test", True, message is not None and message.startswith('Line 7: '))
+
+    test.print_summary(u_test)
+
+
+def __utest_rank_file():
+    u_test = test.create()
+
+    generator = random.Random(NUM_TEST_HANDS)
+    hands = [generator.sample(range(c.NUM_CARDS_IN_DECK), h.NUM_CARDS_IN_HAND) for i in range(NUM_TEST_HANDS)]
+    lines = [' '.join(c.SHORT_NAMES[code] for code in codes) + '\n' for codes in hands]
+    lines[10] = '\n'
+    lines[20] = lines[20].replace(' ', ',')
+    text = ''.join(lines)
+    expected = ''.join(hh.format_result(codes, h.hand_from_codes(codes).get_strength())
+                       for i, codes in enumerate(hands) if i != 10)
+
+    with tempfile.TemporaryDirectory() as directory:
+        test.assert_equals(u_test, "One Worker Test", (expected, []), __rank(directory, text, 1))
+        for num_workers in [2, 3, 8]:
+            test.assert_equals(u_test, f"{num_workers} Workers Match One Worker Test", (expected, []),
+                               __rank(directory, text, num_workers))
+        test.assert_equals(u_test, "No Final Newline Test", __rank(directory, text.rstrip('\n'), 1),
+                           __rank(directory, text.rstrip('\n'), 3))
+        test.assert_equals(u_test, "More Workers Than Lines Test", __rank(directory, ''.join(lines[:2]), 1),
+                           __rank(directory, ''.join(lines[:2]), 8))
+        test.assert_equals(u_test, "Empty File Test", ('', []), __rank(directory, '', 4))
+
+        bad_lines = lines.copy()
+        bad_lines[2500] = 'AS AS KS QS JS\n'
+        bad_text = ''.join(bad_lines)
+        test.assert_equals(u_test, "Duplicate Card Line Number Test", True,
+                           __rank(directory, bad_text, 1)[0].startswith('Line 2501: '))
+        test.assert_equals(u_test, "Duplicate Card Workers Test", __rank(directory, bad_text, 1),
+                           __rank(directory, bad_text, 3))
+        test.assert_equals(u_test, "Nothing Left On Error Test", [], __rank(directory, bad_text, 1)[1])
+
+        bad_lines[2500] = 'AS KD 8H 8C 2\u00e9\n'
+        bad_text = ''.join(bad_lines)
+        test.assert_equals(u_test, "Not ASCII Line Number Test", True,
+                           __rank(directory, bad_text, 1)[0].startswith('Line 2501: Not ASCII text'))
+        test.assert_equals(u_test, "Not ASCII Workers Test", __rank(directory, bad_text, 1),
+                           __rank(directory, bad_text, 3))
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_parse_hand()
+    __utest_rank_file()
@@ -0,0 +1,154 @@
+import struct
+import numpy as np
+import batch_evaluator as b
+import poker_hand as h
+
+MAGIC = b'PHST'
+FORMAT_VERSION = 1
+HEADER_FORMAT = '<4sHHQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+RECORD_DTYPE = np.dtype([('cards', np.uint8, (h.NUM_CARDS_IN_HAND,)), ('hand_type', np.uint8),
+                         ('strength', '<u4')])
+CHUNK_SIZE = 1 << 16
+
+
+class HandStoreWriter:
+
+    def __init__(self, path):
+        """
+        Creates a hand store file. Records are appended with write, and the header is
+        completed when the writer is closed.
+
+        :param path: Path of the file.
+        """
+        self.__file = open(path, 'wb')
+        self.__count = 0
+        self.__write_header()
+
+    def __write_header(self):
+        self.__file.write(struct.pack(HEADER_FORMAT, MAGIC, FORMAT_VERSION, RECORD_DTYPE.itemsize, self.__count))
+
+    def write(self, codes, strengths=None):
+        """
+        Appends evaluated hands to the file.
+
+        :param codes: Array of shape (N, 5) of card codes.
+        :param strengths: Array of the N strength keys, or None to evaluate the hands.
+        :return: No return.
+        """
+        codes = np.asarray(codes).reshape(-1, h.NUM_CARDS_IN_HAND)
+        if strengths is None:
+            strengths = b.evaluate_many(codes)[1]
+        strengths = np.asarray(strengths)
+        records = np.empty(len(codes), dtype=RECORD_DTYPE)
+        records['cards'] = codes
+        records['hand_type'] = strengths >> h.CATEGORY_SHIFT
+        records['strength'] = strengths
+        records.tofile(self.__file)
+        self.__count += len(records)
+
+    def close(self):
+        """
+        Writes the number of records to the header and closes the file.
+
+        :return: No return.
+        """
+        self.__file.seek(0)
+        self.__write_header()
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class HandStoreReader:
+
+    def __init__(self, path):
+        """
+        Opens a hand store file. The records are memory-mapped, so nothing is read
+        until it is used.
+
+        :param path: Path of the file.
+        """
+        with open(path, 'rb') as store_file:
+            header = store_file.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f'Not a hand store file: {path}')
+        magic, version, record_size, count = struct.unpack(HEADER_FORMAT, header)
+        if magic != MAGIC or record_size != RECORD_DTYPE.itemsize:
+            raise ValueError(f'Not a hand store file: {path}')
+        if version != FORMAT_VERSION:
+            raise ValueError(f'Unsupported hand store version {version}: {path}')
+
+        if count == 0:
+            self.__records = np.empty(0, dtype=RECORD_DTYPE)
+        else:
+            self.__records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+
+    def __len__(self):
+        return len(self.__records)
+
+    def __getitem__(self, index):
+        """
+        Gets a record or a slice of records, without copying them.
+
+        :param index: Index or slice.
+        :return: A record with cards, hand_type and strength fields, or an array of them.
+        """
+        return self.__records[index]
+
+    def get_records(self):
+        """
+        Gets a view of every record.
+
+        :return: Structured array of records.
+        """
+        return self.__records
+
+    def get_cards(self):
+        """
+        Gets a view of the cards of every hand.
+
+        :return: Array of shape (N, 5) of card codes.
+        """
+        return self.__records['cards']
+
+    def get_hand_types(self):
+        """
+        Gets a view of the type of every hand.
+
+        :return: Array of hand types.
+        """
+        return self.__records['hand_type']
+
+    def get_strengths(self):
+        """
+        Gets a view of the strength key of every hand.
+
+        :return: Array of strength keys.
+        """
+        return self.__records['strength']
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """
+        Goes through the records in chunks.
+
+        :param chunk_size: The most records in a chunk.
+        :return: Generator of views of consecutive records.
+        """
+        for start in range(0, len(self.__records), chunk_size):
+            yield self.__records[start:start + chunk_size]
+
+    def count_hand_types(self):
+        """
+        Counts the stored hands of each type.
+
+        :return: Dictionary mapping hand types to numbers of hands.
+        """
+        counts = np.zeros(h.FLUSH + 1, dtype=np.int64)
+        for chunk in self.iter_chunks():
+            counts += np.bincount(chunk['hand_type'], minlength=h.FLUSH + 1)
+        return {hand_type: int(counts[hand_type]) for hand_type in h.HAND_TYPE_NAMES}
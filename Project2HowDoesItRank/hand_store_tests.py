@@ -0,0 +1,38 @@
+import os
+import tempfile
+import numpy as np
+import test_suite as test
+import batch_evaluator as b
+import hand_store as hs
+import poker_hand as h
+
+NUM_TEST_HANDS = 1000
+
+
+def __utest_hand_store():
+    u_test = test.create()
+
+    generator = np.random.default_rng(NUM_TEST_HANDS)
+    codes = generator.random((NUM_TEST_HANDS, 52)).argsort(axis=1)[:, :h.NUM_CARDS_IN_HAND].astype(np.uint8)
+    hand_types, strengths = b.evaluate_many(codes)
+
+    with tempfile.TemporaryDirectory() as test_dir:
+        test_path = os.path.join(test_dir, 'hand_store_test.bin')
+        with hs.HandStoreWriter(test_path) as writer:
+            writer.write(codes[:NUM_TEST_HANDS // 2])
+            writer.write(codes[NUM_TEST_HANDS // 2:], strengths[NUM_TEST_HANDS // 2:])
+
+        reader = hs.HandStoreReader(test_path)
+        test.assert_equals(u_test, "Count Test", NUM_TEST_HANDS, len(reader))
+        test.assert_equals(u_test, "Cards Test", True, bool((reader.get_cards() == codes).all()))
+        test.assert_equals(u_test, "Strengths Test", True, bool((reader.get_strengths() == strengths).all()))
+        test.assert_equals(u_test, "Random Access Test", int(hand_types[7]), int(reader[7]['hand_type']))
+        test.assert_equals(u_test, "Chunks Test", NUM_TEST_HANDS, sum(len(chunk) for chunk in reader.iter_chunks(300)))
+        test.assert_equals(u_test, "Count Hand Types Test", NUM_TEST_HANDS, sum(reader.count_hand_types().values()))
+        del reader
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_hand_store()
@@ -0,0 +1,197 @@
+import hashlib
+import itertools
+import os
+import pickle
+import sys
+import card as c
+import poker_hand as h
+
+TABLE_VERSION = 2
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hand_tables.pickle')
+RANK_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+MAX_CARDS_OF_A_RANK = c.NUM_SUITS
+
+CODE_SUIT = [c.get_code_suit_index(code) for code in range(c.NUM_CARDS_IN_DECK)]
+CODE_PRIME = [RANK_PRIMES[c.get_code_rank(code) - c.LOWEST_RANK] for code in range(c.NUM_CARDS_IN_DECK)]
+CODE_RANK_BIT = [1 << (c.get_code_rank(code) - c.LOWEST_RANK) for code in range(c.NUM_CARDS_IN_DECK)]
+
+
+def __get_hand_strength(codes):
+    return h.hand_from_codes(codes).get_strength()
+
+
+def __build_flush_table(strength_of):
+    """
+    Evaluates every flush once, keyed by the bitmask of the ranks in the hand.
+
+    :param strength_of: Function giving the strength key of five card codes.
+    :return: List of strength keys indexed by rank bitmask.
+    """
+    flush_table = [0] * (1 << c.NUM_RANKS)
+    for ranks in itertools.combinations(range(c.LOWEST_RANK, c.ACE + 1), h.NUM_CARDS_IN_HAND):
+        codes = [c.encode(rank, c.SUITS[0]) for rank in ranks]
+        rank_bits = 0
+        for code in codes:
+            rank_bits |= CODE_RANK_BIT[code]
+        flush_table[rank_bits] = strength_of(codes)
+    return flush_table
+
+
+def __build_rank_table(strength_of):
+    """
+    Evaluates every hand that is not a flush once, keyed by the product of the primes
+    of its ranks, which is the same for every hand with the same ranks.
+
+    :param strength_of: Function giving the strength key of five card codes.
+    :return: Dictionary mapping prime products to strength keys.
+    """
+    rank_table = {}
+    for ranks in itertools.combinations_with_replacement(range(c.LOWEST_RANK, c.ACE + 1), h.NUM_CARDS_IN_HAND):
+        if max(ranks.count(rank) for rank in ranks) > MAX_CARDS_OF_A_RANK:
+            continue
+        suit_indices = [ranks[:i].count(ranks[i]) for i in range(len(ranks))]
+        if len(set(suit_indices)) == 1:
+            suit_indices[0] = 1
+        codes = [c.encode(rank, c.SUITS[suit_index]) for rank, suit_index in zip(ranks, suit_indices)]
+        prime_product = 1
+        for code in codes:
+            prime_product *= CODE_PRIME[code]
+        rank_table[prime_product] = strength_of(codes)
+    return rank_table
+
+
+def build_tables(strength_of=__get_hand_strength):
+    """
+    Builds the lookup tables by running every distinct hand through a strength function
+    once. Any ranking that depends only on the ranks and on whether the hand is a flush
+    can be compiled this way.
+
+    :param strength_of: Function giving the strength key of five card codes, by default
+    PokerHand.get_strength.
+    :return: Tuple of the flush table and the rank table.
+    """
+    return __build_flush_table(strength_of), __build_rank_table(strength_of)
+
+
+def get_source_hash(modules):
+    """
+    Hashes the source files of some modules, so a table cache can tell whether the code that
+    built it has changed since.
+
+    :param modules: The modules.
+    :return: Hex digest of their source files.
+    """
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(module.__file__, 'rb') as source_file:
+            digest.update(source_file.read())
+    return digest.hexdigest()
+
+
+def load_tables(path=CACHE_PATH, strength_of=__get_hand_strength, source_hash=None):
+    """
+    Loads the lookup tables from a cache file, building and saving them first if the file
+    is missing or was written by another table version or other source code.
+
+    :param path: Path of the cache file.
+    :param strength_of: Function the tables are built from, as in build_tables.
+    :param source_hash: Hash of the source the tables are built from, or None for the
+    sources of card, poker_hand and hand_table, which PokerHand's tables are built from.
+    :return: Tuple of the flush table and the rank table.
+    """
+    if source_hash is None:
+        source_hash = get_source_hash([c, h, sys.modules[__name__]])
+    try:
+        with open(path, 'rb') as cache_file:
+            version, cached_hash, flush_table, rank_table = pickle.load(cache_file)
+        if version == TABLE_VERSION and cached_hash == source_hash:
+            return flush_table, rank_table
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        pass
+
+    flush_table, rank_table = build_tables(strength_of)
+    try:
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'wb') as cache_file:
+            pickle.dump((TABLE_VERSION, source_hash, flush_table, rank_table), cache_file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+    return flush_table, rank_table
+
+
+# The (flush table, rank table) of PokerHand once get_tables has loaded them. They are not
+# loaded at import, so programs that never evaluate a hand do not pay for them.
+DEFAULT_TABLES = []
+
+
+def get_tables():
+    """
+    Gets PokerHand's lookup tables, loading them from the cache file, or building them, the
+    first time.
+
+    :return: Tuple of the flush table and the rank table.
+    """
+    if not DEFAULT_TABLES:
+        DEFAULT_TABLES.append(load_tables())
+    return DEFAULT_TABLES[0]
+
+
+def evaluate(codes, flush_table=None, rank_table=None):
+    """
+    Looks up the strength key of a hand of five distinct cards. With the default tables
+    the key is the same one PokerHand.get_strength gives for those cards.
+
+    A repeated card in a hand of one suit, and a rank given five times, are rejected.
+    Other repeated cards are not checked, so callers must pass five different cards.
+
+    :param codes: Sequence of five card codes.
+    :param flush_table: Flush table from build_tables, or None for get_tables.
+    :param rank_table: Rank table from build_tables, or None for get_tables.
+    :return: The strength key.
+    :raises ValueError: if the cards are not a hand the tables hold.
+    """
+    if flush_table is None:
+        flush_table, rank_table = DEFAULT_TABLES[0] if DEFAULT_TABLES else get_tables()
+    code_1, code_2, code_3, code_4, code_5 = codes
+    suit = CODE_SUIT[code_1]
+    if CODE_SUIT[code_2] == suit and CODE_SUIT[code_3] == suit and CODE_SUIT[code_4] == suit \
+            and CODE_SUIT[code_5] == suit:
+        strength = flush_table[CODE_RANK_BIT[code_1] | CODE_RANK_BIT[code_2] | CODE_RANK_BIT[code_3]
+                               | CODE_RANK_BIT[code_4] | CODE_RANK_BIT[code_5]]
+        if not strength:
+            raise ValueError(f'Not five different cards: {list(codes)}')
+        return strength
+    try:
+        return rank_table[CODE_PRIME[code_1] * CODE_PRIME[code_2] * CODE_PRIME[code_3]
+                          * CODE_PRIME[code_4] * CODE_PRIME[code_5]]
+    except KeyError:
+        raise ValueError(f'Not five different cards: {list(codes)}') from None
+
+
+def get_hand_type(strength):
+    """
+    Gets the hand type stored in a strength key.
+
+    :param strength: The strength key.
+    :return: FLUSH, TWO_PAIR, PAIR, or HIGH_CARD.
+    """
+    return strength >> h.CATEGORY_SHIFT
+
+
+def compare(codes_1, codes_2):
+    """
+    Compares two hands given as card codes, the same way PokerHand.compare_to does.
+
+    :param codes_1: Card codes of the first hand.
+    :param codes_2: Card codes of the second hand.
+    :return: 1 if hand 1 wins, -1 if hand 2 wins, and 0 if they tie
+    """
+    strength_1 = evaluate(codes_1)
+    strength_2 = evaluate(codes_2)
+    if strength_1 > strength_2:
+        return h.HAND_1_WINS
+    elif strength_1 < strength_2:
+        return h.HAND_2_WINS
+    else:
+        return h.TIE
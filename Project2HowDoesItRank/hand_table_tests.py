@@ -0,0 +1,84 @@
+import os
+import pickle
+import random
+import tempfile
+import test_suite as test
+import card as c
+import hand_table as t
+import poker_hand as h
+
+NUM_TEST_HANDS = 2000
+
+
+def __utest_evaluate():
+    u_test = test.create()
+
+    generator = random.Random(NUM_TEST_HANDS)
+    num_mismatches = 0
+    for i in range(NUM_TEST_HANDS):
+        codes = generator.sample(range(c.NUM_CARDS_IN_DECK), h.NUM_CARDS_IN_HAND)
+        if t.evaluate(codes) != h.hand_from_codes(codes).get_strength():
+            num_mismatches += 1
+    test.assert_equals(u_test, "Random Hands Match PokerHand Test", 0, num_mismatches)
+
+    flush = [c.encode(rank, 'Hearts') for rank in [2, 7, 14, 9, 13]]
+    four_of_a_kind = [c.encode(12, suit) for suit in c.SUITS] + [c.encode(11, 'Spades')]
+    full_house = [c.encode(11, 'Spades'), c.encode(11, 'Diamonds'), c.encode(12, 'Spades'),
+                  c.encode(12, 'Clubs'), c.encode(12, 'Hearts')]
+    three_of_a_kind = [c.encode(3, 'Spades'), c.encode(4, 'Diamonds'), c.encode(7, 'Spades'),
+                       c.encode(7, 'Clubs'), c.encode(7, 'Hearts')]
+
+    test.assert_equals(u_test, "Flush Type Test", h.FLUSH, t.get_hand_type(t.evaluate(flush)))
+    test.assert_equals(u_test, "Four Of A Kind Type Test", h.TWO_PAIR, t.get_hand_type(t.evaluate(four_of_a_kind)))
+    test.assert_equals(u_test, "Three Of A Kind Type Test", h.PAIR, t.get_hand_type(t.evaluate(three_of_a_kind)))
+    test.assert_equals(u_test, "Four Of A Kind vs Full House Test (Hand 1 Wins[1])", h.HAND_1_WINS,
+                       t.compare(four_of_a_kind, full_house))
+    test.assert_equals(u_test, "Flush vs Four Of A Kind Test (Hand 1 Wins[1])", h.HAND_1_WINS,
+                       t.compare(flush, four_of_a_kind))
+
+    for names in [['AS', 'AS', 'KS', 'QS', 'JS'], ['AS', 'AS', 'AS', 'AS', 'AS']]:
+        try:
+            t.evaluate([c.parse(name) for name in names])
+            rejected = False
+        except ValueError:
+            rejected = True
+        test.assert_equals(u_test, f"Rejects {' '.join(names)} Test", True, rejected)
+
+    test.print_summary(u_test)
+
+
+def __utest_load_tables():
+    u_test = test.create()
+
+    built_hands = []
+
+    def strength_of(codes):
+        built_hands.append(codes)
+        return 1
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tables.pickle')
+        tables = t.load_tables(path, strength_of, 'source 1')
+        test.assert_equals(u_test, "Built When Missing Test", True, len(built_hands) > 0)
+        built_hands.clear()
+        test.assert_equals(u_test, "Loaded From Cache Test", tables, t.load_tables(path, strength_of, 'source 1'))
+        test.assert_equals(u_test, "Not Rebuilt Test", 0, len(built_hands))
+
+        t.load_tables(path, strength_of, 'source 2')
+        test.assert_equals(u_test, "Rebuilt When Source Changes Test", True, len(built_hands) > 0)
+        built_hands.clear()
+
+        with open(path, 'wb') as cache_file:
+            pickle.dump((t.TABLE_VERSION - 1, 'source 2') + tables, cache_file)
+        t.load_tables(path, strength_of, 'source 2')
+        test.assert_equals(u_test, "Rebuilt When Version Changes Test", True, len(built_hands) > 0)
+
+    test.assert_equals(u_test, "Source Hash Test", t.get_source_hash([c, h, t]), t.get_source_hash([c, h, t]))
+    test.assert_equals(u_test, "Source Hash Differs Test", False, t.get_source_hash([c]) == t.get_source_hash([h]))
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_evaluate()
+    __utest_load_tables()
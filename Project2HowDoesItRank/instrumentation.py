@@ -0,0 +1,215 @@
+import collections
+import functools
+import time
+import batch_evaluator as b
+import deck as d
+import hand_table as t
+import poker_hand as h
+import rules as ru
+import seven_card as sc
+
+METRIC_PREFIX = 'poker'
+NANOSECONDS_PER_SECOND = 1e9
+# (module or class, attribute, metric name) of every public entry point that is counted and
+# timed. Only public names are wrapped, so renaming a private helper cannot silently stop a
+# count, and calls are counted where production code makes them, before any cache.
+TIMED_FUNCTIONS = [
+    (t, 'compare', 'hand_table_compare'),
+    (b, 'evaluate_many', 'batch_evaluate_many'),
+    (b, 'compare_many', 'batch_compare_many'),
+    (sc, 'evaluate', 'seven_card_evaluate'),
+    (sc, 'evaluate_many', 'seven_card_evaluate_many'),
+    (ru.RuleSet, 'evaluate', 'rules_evaluate'),
+    (h.PokerHand, 'get_strength', 'get_strength'),
+    (h.PokerHand, 'deal_hand', 'deal_hand'),
+    (d.Deck, 'create', 'deck_create'),
+    (d.Deck, 'reset', 'deck_reset'),
+    (d.Deck, 'deal_card', 'deal_card'),
+    (d.Deck, 'deal_code', 'deal_code'),
+    (d.Deck, 'deal_many', 'deal_many'),
+]
+EVALUATE_FUNCTION = (t, 'evaluate')
+COMPARE_METHOD = (h.PokerHand, 'compare_to')
+
+ORIGINALS = {}
+CALLS = collections.Counter()
+TIMES_NS = collections.Counter()
+HAND_TYPE_CALLS = collections.Counter()
+HAND_TYPE_TIMES_NS = collections.Counter()
+MATCHUP_CALLS = collections.Counter()
+MATCHUP_TIMES_NS = collections.Counter()
+# The STRENGTH_CACHE hits and misses at the last reset, so snapshots report the lookups since.
+CACHE_BASELINE = {'hits': h.STRENGTH_CACHE.get_hits(), 'misses': h.STRENGTH_CACHE.get_misses()}
+
+
+def __timed(name, function):
+    """
+    Wraps a function or method so every call is counted and timed under a metric name.
+
+    :param name: The metric name.
+    :param function: The function to wrap.
+    :return: The wrapper.
+    """
+    @functools.wraps(function)
+    def timed(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            TIMES_NS[name] += time.perf_counter_ns() - start
+            CALLS[name] += 1
+    return timed
+
+
+def __timed_evaluate(function):
+    """
+    Wraps hand_table.evaluate, the lookup simulation, hand_history, equity, enumeration and
+    the game server go through. Every call is counted, and calls with PokerHand's tables are
+    also counted per hand type of the result.
+    """
+    @functools.wraps(function)
+    def timed(codes, flush_table=None, rank_table=None):
+        start = time.perf_counter_ns()
+        strength = None
+        try:
+            strength = function(codes, flush_table, rank_table)
+            return strength
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            TIMES_NS['evaluate'] += elapsed
+            CALLS['evaluate'] += 1
+            if strength is not None and flush_table is None:
+                hand_type = h.HAND_TYPE_NAMES[t.get_hand_type(strength)]
+                HAND_TYPE_TIMES_NS[hand_type] += elapsed
+                HAND_TYPE_CALLS[hand_type] += 1
+    return timed
+
+
+def __timed_compare(method):
+    """
+    Wraps PokerHand.compare_to so calls are counted and timed per pair of hand types.
+    The time includes working out the strengths the first time each hand is compared.
+    """
+    @functools.wraps(method)
+    def timed(hand, other):
+        start = time.perf_counter_ns()
+        result = method(hand, other)
+        elapsed = time.perf_counter_ns() - start
+        matchup = (h.HAND_TYPE_NAMES[hand.get_hand_type()], h.HAND_TYPE_NAMES[other.get_hand_type()])
+        MATCHUP_TIMES_NS[matchup] += elapsed
+        MATCHUP_CALLS[matchup] += 1
+        return result
+    return timed
+
+
+def is_enabled():
+    """
+    Checks whether the instrumentation is installed.
+
+    :return: True iff the methods are being counted and timed.
+    """
+    return bool(ORIGINALS)
+
+
+def enable():
+    """
+    Replaces the public evaluation and dealing entry points with counting and timing
+    wrappers. Counts keep adding up across enable and disable until reset is called.
+
+    Callers that kept a reference to an entry point before enable, such as a default
+    argument, keep calling the original and are not counted.
+    """
+    if is_enabled():
+        return
+    for owner, attribute, name in TIMED_FUNCTIONS:
+        ORIGINALS[(owner, attribute)] = vars(owner)[attribute]
+        setattr(owner, attribute, __timed(name, vars(owner)[attribute]))
+    for (owner, attribute), wrap in [(EVALUATE_FUNCTION, __timed_evaluate), (COMPARE_METHOD, __timed_compare)]:
+        ORIGINALS[(owner, attribute)] = vars(owner)[attribute]
+        setattr(owner, attribute, wrap(vars(owner)[attribute]))
+
+
+def disable():
+    """
+    Puts the original functions back, so the instrumentation costs nothing at all.
+    """
+    for (owner, attribute), function in ORIGINALS.items():
+        setattr(owner, attribute, function)
+    ORIGINALS.clear()
+
+
+def reset():
+    """
+    Sets every count and time back to zero, and starts counting STRENGTH_CACHE lookups
+    from now.
+    """
+    for counter in [CALLS, TIMES_NS, HAND_TYPE_CALLS, HAND_TYPE_TIMES_NS, MATCHUP_CALLS, MATCHUP_TIMES_NS]:
+        counter.clear()
+    CACHE_BASELINE['hits'] = h.STRENGTH_CACHE.get_hits()
+    CACHE_BASELINE['misses'] = h.STRENGTH_CACHE.get_misses()
+
+
+def __get_cache_counts():
+    """
+    Gets the STRENGTH_CACHE hits and misses since the last reset. The cache sits behind
+    PokerHand.get_strength, so these show how many of the get_strength calls were answered
+    without working out a strength.
+    """
+    return {'hits': h.STRENGTH_CACHE.get_hits() - CACHE_BASELINE['hits'],
+            'misses': h.STRENGTH_CACHE.get_misses() - CACHE_BASELINE['misses']}
+
+
+def snapshot():
+    """
+    Copies the counts and times recorded so far.
+
+    :return: Dictionary with 'calls' and 'time_ns' per entry point, 'hand_types' with the
+    calls and time_ns of hand_table.evaluate per hand type, 'matchups' with the calls and
+    time_ns per "<type> vs <type>" comparison, most expensive first, and the
+    poker_hand.STRENGTH_CACHE hits and misses since the last reset.
+    """
+    matchups = sorted(MATCHUP_CALLS, key=lambda matchup: MATCHUP_TIMES_NS[matchup], reverse=True)
+    return {
+        'enabled': is_enabled(),
+        'calls': dict(CALLS),
+        'time_ns': dict(TIMES_NS),
+        'hand_types': {hand_type: {'calls': HAND_TYPE_CALLS[hand_type], 'time_ns': HAND_TYPE_TIMES_NS[hand_type]}
+                       for hand_type in HAND_TYPE_CALLS},
+        'matchups': {f'{matchup[0]} vs {matchup[1]}': {'calls': MATCHUP_CALLS[matchup],
+                                                        'time_ns': MATCHUP_TIMES_NS[matchup]}
+                     for matchup in matchups},
+        'strength_cache': __get_cache_counts(),
+    }
+
+
+def to_prometheus():
+    """
+    Formats the counts and times in the Prometheus text exposition format.
+
+    :return: The text.
+    """
+    lines = [f'# TYPE {METRIC_PREFIX}_calls_total counter']
+    lines += [f'{METRIC_PREFIX}_calls_total{{function="{name}"}} {count}' for name, count in sorted(CALLS.items())]
+    lines.append(f'# TYPE {METRIC_PREFIX}_seconds_total counter')
+    lines += [f'{METRIC_PREFIX}_seconds_total{{function="{name}"}} {TIMES_NS[name] / NANOSECONDS_PER_SECOND:.9f}'
+              for name in sorted(CALLS)]
+    lines.append(f'# TYPE {METRIC_PREFIX}_evaluate_calls_total counter')
+    lines += [f'{METRIC_PREFIX}_evaluate_calls_total{{hand_type="{hand_type}"}} {count}'
+              for hand_type, count in sorted(HAND_TYPE_CALLS.items())]
+    lines.append(f'# TYPE {METRIC_PREFIX}_evaluate_seconds_total counter')
+    lines += [f'{METRIC_PREFIX}_evaluate_seconds_total{{hand_type="{hand_type}"}} '
+              f'{HAND_TYPE_TIMES_NS[hand_type] / NANOSECONDS_PER_SECOND:.9f}'
+              for hand_type in sorted(HAND_TYPE_CALLS)]
+    lines.append(f'# TYPE {METRIC_PREFIX}_compare_calls_total counter')
+    lines += [f'{METRIC_PREFIX}_compare_calls_total{{hand_1="{hand_1}",hand_2="{hand_2}"}} {count}'
+              for (hand_1, hand_2), count in sorted(MATCHUP_CALLS.items())]
+    lines.append(f'# TYPE {METRIC_PREFIX}_compare_seconds_total counter')
+    lines += [f'{METRIC_PREFIX}_compare_seconds_total{{hand_1="{hand_1}",hand_2="{hand_2}"}} '
+              f'{MATCHUP_TIMES_NS[(hand_1, hand_2)] / NANOSECONDS_PER_SECOND:.9f}'
+              for hand_1, hand_2 in sorted(MATCHUP_CALLS)]
+    cache_counts = __get_cache_counts()
+    lines.append(f'# TYPE {METRIC_PREFIX}_strength_cache_hits_total counter')
+    lines.append(f'{METRIC_PREFIX}_strength_cache_hits_total {cache_counts["hits"]}')
+    lines.append(f'# TYPE {METRIC_PREFIX}_strength_cache_misses_total counter')
+    lines.append(f'{METRIC_PREFIX}_strength_cache_misses_total {cache_counts["misses"]}')
+    return '\n'.join(lines) + '\n'
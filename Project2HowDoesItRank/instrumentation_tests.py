@@ -0,0 +1,90 @@
+import random
+import test_suite as test
+import card as c
+import deck as d
+import hand_table as t
+import instrumentation as ins
+import poker_hand as h
+import rules as ru
+import simulation as s
+
+
+def __utest_instrumentation():
+    u_test = test.create()
+    original_compare_to = h.PokerHand.compare_to
+    original_evaluate = t.evaluate
+    original_deal_many = d.Deck.deal_many
+
+    ins.reset()
+    ins.enable()
+    test.assert_equals(u_test, "Enabled Test", True, ins.is_enabled())
+    num_rounds = 0
+    game_deck = d.Deck()
+    while not game_deck.less_than_5_cards():
+        hand_1 = h.PokerHand([])
+        hand_1.deal_hand(game_deck)
+        hand_2 = h.PokerHand([])
+        hand_2.deal_hand(game_deck)
+        hand_1.compare_to(hand_2)
+        num_rounds += 1
+    flush_1 = h.hand_from_codes([0, 8, 12, 20, 24])
+    flush_2 = h.hand_from_codes([4, 16, 28, 32, 36])
+    flush_1.compare_to(flush_2)
+
+    tally = s.play_rounds(100, random.Random(1))
+    flush = [c.parse(name) for name in ['2H', '7H', 'AH', '9H', 'KH']]
+    t.compare(flush, [c.parse(name) for name in ['2S', '7D', 'AH', '9H', 'KH']])
+    ru.STANDARD_RULES.evaluate(flush)
+    enabled_counts = ins.snapshot()
+    ins.disable()
+
+    counts = ins.snapshot()
+    test.assert_equals(u_test, "Disabled Test", False, ins.is_enabled())
+    test.assert_equals(u_test, "Compare Restored Test", original_compare_to, h.PokerHand.compare_to)
+    test.assert_equals(u_test, "Evaluate Restored Test", original_evaluate, t.evaluate)
+    test.assert_equals(u_test, "Deal Many Restored Test", original_deal_many, d.Deck.deal_many)
+    test.assert_equals(u_test, "Snapshot After Disable Test", enabled_counts['calls'], counts['calls'])
+    test.assert_equals(u_test, "Deck Create Count Test", 2, counts['calls']['deck_create'])
+    test.assert_equals(u_test, "Deal Hand Count Test", 2 * num_rounds, counts['calls']['deal_hand'])
+    test.assert_equals(u_test, "Deal Card Count Test", 10 * num_rounds, counts['calls']['deal_card'])
+    test.assert_equals(u_test, "Compare Count Test", num_rounds + 1,
+                       sum(matchup['calls'] for matchup in counts['matchups'].values()))
+    test.assert_equals(u_test, "Flush Matchup Test", 1, counts['matchups']['Flush vs Flush']['calls'])
+    test.assert_equals(u_test, "Get Strength Count Test", True, counts['calls']['get_strength'] >= 2 * num_rounds + 2)
+
+    # Two lookups per simulated round, two from hand_table.compare and one with the standard
+    # tables, which is not given a PokerHand hand type.
+    test.assert_equals(u_test, "Evaluate Count Test", 2 * 100 + 2 + 1, counts['calls']['evaluate'])
+    test.assert_equals(u_test, "Evaluate Hand Types Test", 2 * 100 + 2,
+                       sum(hand_type['calls'] for hand_type in counts['hand_types'].values()))
+    test.assert_equals(u_test, "Simulation Hand Types Test",
+                       sum(count * ((type_1 == h.FLUSH) + (type_2 == h.FLUSH))
+                           for (type_1, type_2, result), count in tally.items()) + 1,
+                       counts['hand_types']['Flush']['calls'])
+    test.assert_equals(u_test, "Deal Many Count Test", 100, counts['calls']['deal_many'])
+    test.assert_equals(u_test, "Compare Function Count Test", 1, counts['calls']['hand_table_compare'])
+    test.assert_equals(u_test, "Rules Evaluate Count Test", 1, counts['calls']['rules_evaluate'])
+    test.assert_equals(u_test, "Cache Lookups Test", True,
+                       counts['strength_cache']['hits'] + counts['strength_cache']['misses'] > 0)
+
+    hand_1.compare_to(hand_2)
+    t.evaluate(flush)
+    test.assert_equals(u_test, "Nothing Counted When Disabled Test", counts, ins.snapshot())
+    text = ins.to_prometheus()
+    test.assert_equals(u_test, "Prometheus Deal Card Test", True,
+                       f'poker_calls_total{{function="deal_card"}} {10 * num_rounds}\n' in text)
+    test.assert_equals(u_test, "Prometheus Matchup Test", True,
+                       'poker_compare_calls_total{hand_1="Flush",hand_2="Flush"} 1\n' in text)
+    test.assert_equals(u_test, "Prometheus Hand Type Test", True,
+                       f'poker_evaluate_calls_total{{hand_type="Flush"}} {counts["hand_types"]["Flush"]["calls"]}\n'
+                       in text)
+
+    ins.reset()
+    test.assert_equals(u_test, "Reset Test", {}, ins.snapshot()['calls'])
+    test.assert_equals(u_test, "Reset Cache Counts Test", {'hits': 0, 'misses': 0}, ins.snapshot()['strength_cache'])
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_instrumentation()
@@ -0,0 +1,147 @@
+SUB_BUCKET_BITS = 7
+HALF_SUB_BUCKET_COUNT = 1 << (SUB_BUCKET_BITS - 1)
+PERCENTILES = [50.0, 99.0, 99.9]
+
+
+def get_bucket_index(value):
+    """
+    Finds the histogram bucket of a value. Values below 2 ** SUB_BUCKET_BITS get a bucket each,
+    and every larger power of two is split into HALF_SUB_BUCKET_COUNT buckets, so a bucket is
+    never wider than 1/64 of the values it holds.
+
+    :param value: Non-negative integer.
+    :return: The bucket index.
+    """
+    shift = max(value.bit_length() - SUB_BUCKET_BITS, 0)
+    return shift * HALF_SUB_BUCKET_COUNT + (value >> shift)
+
+
+def get_bucket_value(index):
+    """
+    Finds the lowest value that falls in a bucket.
+
+    :param index: Bucket index.
+    :return: The lowest value of the bucket.
+    """
+    shift = max(index // HALF_SUB_BUCKET_COUNT - 1, 0)
+    return (index - shift * HALF_SUB_BUCKET_COUNT) << shift
+
+
+class LatencyHistogram:
+
+    def __init__(self):
+        """
+        Constructs an empty HDR-style histogram of latencies in nanoseconds. Recording is a
+        couple of shifts and a list update, so it can sit in the game loop, and percentiles
+        are accurate to within 2%.
+        """
+        self.__counts = []
+        self.__total_count = 0
+        self.__total = 0
+        self.__min = None
+        self.__max = 0
+
+    def record(self, nanoseconds):
+        """
+        Records one latency.
+
+        :param nanoseconds: The latency.
+        """
+        nanoseconds = max(int(nanoseconds), 0)
+        index = get_bucket_index(nanoseconds)
+        if index >= len(self.__counts):
+            self.__counts.extend([0] * (index + 1 - len(self.__counts)))
+        self.__counts[index] += 1
+        self.__total_count += 1
+        self.__total += nanoseconds
+        if self.__min is None or nanoseconds < self.__min:
+            self.__min = nanoseconds
+        if nanoseconds > self.__max:
+            self.__max = nanoseconds
+
+    def merge(self, other):
+        """
+        Adds every latency recorded in another histogram to this one.
+
+        :param other: LatencyHistogram to add.
+        """
+        other_counts = other.get_counts()
+        if len(other_counts) > len(self.__counts):
+            self.__counts.extend([0] * (len(other_counts) - len(self.__counts)))
+        for index, count in enumerate(other_counts):
+            self.__counts[index] += count
+        self.__total_count += other.get_total_count()
+        self.__total += other.get_mean() * other.get_total_count()
+        if other.get_total_count():
+            if self.__min is None or other.get_min() < self.__min:
+                self.__min = other.get_min()
+            self.__max = max(self.__max, other.get_max())
+
+    def get_counts(self):
+        """
+        Gets and returns the count of every bucket.
+
+        :return: List of counts indexed by bucket.
+        """
+        return list(self.__counts)
+
+    def get_total_count(self):
+        """
+        Gets and returns the number of latencies recorded.
+
+        :return: The number of latencies.
+        """
+        return self.__total_count
+
+    def get_min(self):
+        """
+        Gets and returns the lowest latency recorded.
+
+        :return: The lowest latency, or 0 if nothing was recorded.
+        """
+        return self.__min or 0
+
+    def get_max(self):
+        """
+        Gets and returns the highest latency recorded.
+
+        :return: The highest latency.
+        """
+        return self.__max
+
+    def get_mean(self):
+        """
+        Gets and returns the mean latency.
+
+        :return: The mean latency, or 0 if nothing was recorded.
+        """
+        return self.__total / self.__total_count if self.__total_count else 0
+
+    def get_value_at_percentile(self, percentile):
+        """
+        Finds the latency below which the given percentage of latencies fall.
+
+        :param percentile: Percentage from 0 to 100.
+        :return: The highest value of the bucket holding that latency, capped to the maximum.
+        """
+        if not self.__total_count:
+            return 0
+        target = max(1, -(-percentile * self.__total_count // 100))
+        running_count = 0
+        for index, count in enumerate(self.__counts):
+            running_count += count
+            if running_count >= target:
+                return min(max(get_bucket_value(index + 1) - 1, self.get_min()), self.__max)
+        return self.__max
+
+    def get_summary(self):
+        """
+        Summarizes the histogram.
+
+        :return: Dictionary with the count, min, mean, max and the PERCENTILES, in nanoseconds.
+        """
+        summary = {'count': self.__total_count, 'min': self.get_min(), 'mean': round(self.get_mean()),
+                   'max': self.__max}
+        for percentile in PERCENTILES:
+            summary[f'p{percentile:g}'] = self.get_value_at_percentile(percentile)
+        return summary
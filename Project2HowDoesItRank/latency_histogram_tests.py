@@ -0,0 +1,38 @@
+import test_suite as test
+import latency_histogram as lh
+
+
+def __utest_latency_histogram():
+    u_test = test.create()
+
+    test.assert_equals(u_test, "Small Values Own Bucket Test", [0, 1, 127],
+                       [lh.get_bucket_value(lh.get_bucket_index(value)) for value in [0, 1, 127]])
+    values = [128, 1000, 123456, 10 ** 9]
+    test.assert_equals(u_test, "Bucket Width Test", True,
+                       all(0 <= value - lh.get_bucket_value(lh.get_bucket_index(value)) <= value / 64
+                           for value in values))
+    indexes = [lh.get_bucket_index(value) for value in range(20000)]
+    test.assert_equals(u_test, "Contiguous Buckets Test", True,
+                       all(0 <= later - earlier <= 1 for earlier, later in zip(indexes, indexes[1:])))
+
+    histogram = lh.LatencyHistogram()
+    for value in range(1, 10001):
+        histogram.record(value * 1000)
+    test.assert_equals(u_test, "Count Test", 10000, histogram.get_total_count())
+    test.assert_equals(u_test, "Max Test", 10000000, histogram.get_max())
+    test.assert_equals(u_test, "Median Test", True, abs(histogram.get_value_at_percentile(50) - 5000000) <= 100000)
+    test.assert_equals(u_test, "P99.9 Test", True, abs(histogram.get_value_at_percentile(99.9) - 9990000) <= 200000)
+    test.assert_equals(u_test, "P100 Test", 10000000, histogram.get_value_at_percentile(100))
+
+    other = lh.LatencyHistogram()
+    other.record(20000000)
+    histogram.merge(other)
+    test.assert_equals(u_test, "Merged Count Test", 10001, histogram.get_total_count())
+    test.assert_equals(u_test, "Merged Max Test", 20000000, histogram.get_max())
+    test.assert_equals(u_test, "Empty Histogram Test", 0, lh.LatencyHistogram().get_value_at_percentile(99))
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_latency_histogram()
@@ -0,0 +1,164 @@
+import argparse
+import asyncio
+import json
+import random
+import time
+import card as c
+import game_server as g
+import hand_table as t
+import latency_histogram as lh
+
+RESPOND_STAGE = 'respond'
+STAGES = [g.DEAL_STAGE, g.EVALUATE_STAGE, RESPOND_STAGE]
+
+
+async def play_paced_session(host, port, path, answers, rng, histograms, pacer):
+    """
+    Plays one game as a simulated player, timing each answer from when it is sent until the
+    server replies.
+
+    :param host: Host of the server.
+    :param port: TCP port of the server.
+    :param path: Path of the server's Unix socket, or None to use TCP.
+    :param answers: g.CORRECT_ANSWERS or g.RANDOM_ANSWERS.
+    :param rng: random.Random used for random answers.
+    :param histograms: Dictionary with a lh.LatencyHistogram for RESPOND_STAGE.
+    :param pacer: Coroutine function awaited before each answer to hold the target rate.
+    :return: Number of rounds played.
+    """
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+
+    hands = {}
+    num_rounds = 0
+    guess_start = None
+    try:
+        while True:
+            line = (await reader.readline()).decode('ascii')
+            if not line:
+                break
+            kind = line.split()[0]
+            if kind in ('HAND1', 'HAND2'):
+                hands[kind] = [c.parse(short_name) for short_name in line.split()[1:]]
+            elif kind == 'GUESS':
+                await pacer()
+                if answers == g.CORRECT_ANSWERS:
+                    guess = t.compare(hands['HAND1'], hands['HAND2'])
+                else:
+                    guess = rng.choice(list(g.VALID_GUESSES.values()))
+                guess_start = time.perf_counter_ns()
+                writer.write(f'{guess}\n'.encode('ascii'))
+                await writer.drain()
+            elif kind in ('CORRECT', 'WRONG'):
+                histograms[RESPOND_STAGE].record(time.perf_counter_ns() - guess_start)
+                num_rounds += 1
+            elif kind == 'END':
+                break
+    finally:
+        await g.close_writer(writer)
+    return num_rounds
+
+
+async def run_player(player, num_players, rate, deadline, host, port, path, answers, seed, histograms):
+    """
+    Plays games back to back until the deadline, answering at rate / num_players rounds per
+    second. Players start staggered so the whole load arrives evenly.
+
+    :param player: Index of the player.
+    :param num_players: Number of players sharing the target rate.
+    :param rate: Target rounds per second over every player, or 0 to answer at once.
+    :param deadline: perf_counter time at which no new game is started.
+    :return: Number of rounds played.
+    """
+    rng = random.Random(f'{seed}:{player}')
+    interval = num_players / rate if rate else 0.0
+    next_due = time.perf_counter() + interval * player / num_players
+
+    async def pacer():
+        nonlocal next_due
+        delay = next_due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        next_due = max(next_due + interval, time.perf_counter() - interval)
+
+    num_rounds = 0
+    while time.perf_counter() < deadline:
+        num_rounds += await play_paced_session(host, port, path, answers, rng, histograms, pacer)
+    return num_rounds
+
+
+async def run_load_test(num_players, rate=0, duration=5.0, answers=g.RANDOM_ANSWERS, seed=0, path=None):
+    """
+    Starts a GameServer on a local port (or Unix socket) and drives it with simulated players
+    for a while, recording deal and evaluate times on the server and respond times on the
+    players.
+
+    :param num_players: Number of simulated players.
+    :param rate: Target rounds per second over every player, or 0 to go as fast as possible.
+    :param duration: Seconds during which new games are started.
+    :param answers: g.CORRECT_ANSWERS or g.RANDOM_ANSWERS.
+    :param seed: Seed of the decks and the random answers.
+    :param path: Path of a Unix socket to use instead of TCP, or None.
+    :return: Dictionary with the settings, rounds, sessions, throughput and a summary per stage.
+    """
+    histograms = {stage: lh.LatencyHistogram() for stage in STAGES}
+    game_server = g.GameServer(random.Random(seed), histograms)
+    server = await game_server.start(g.DEFAULT_HOST, 0, path)
+    async with server:
+        port = server.sockets[0].getsockname()[1] if path is None else None
+        start = time.perf_counter()
+        rounds = await asyncio.gather(*[
+            run_player(player, num_players, rate, start + duration, g.DEFAULT_HOST, port, path, answers,
+                       seed, histograms)
+            for player in range(num_players)])
+        elapsed = time.perf_counter() - start
+
+    return {'players': num_players, 'target_rate': rate, 'answers': answers, 'elapsed_sec': elapsed,
+            'sessions': game_server.get_num_sessions(), 'rounds': sum(rounds),
+            'rounds_per_sec': sum(rounds) / elapsed,
+            'latency_ns': {stage: histograms[stage].get_summary() for stage in STAGES}}
+
+
+def format_report(report):
+    """
+    Formats a load test report as a table of latencies in microseconds.
+
+    :param report: Dictionary returned by run_load_test.
+    :return: The text.
+    """
+    lines = [f"Players: {report['players']}  Target rate: {report['target_rate'] or 'max'}  "
+             f"Answers: {report['answers']}",
+             f"Sessions: {report['sessions']}  Rounds: {report['rounds']}  "
+             f"Throughput: {report['rounds_per_sec']:,.0f} rounds/sec",
+             f"{'stage':<10}{'count':>10}" + ''.join(f"{f'p{p:g} us':>12}" for p in lh.PERCENTILES) + f"{'max us':>12}"]
+    for stage, summary in report['latency_ns'].items():
+        lines.append(f"{stage:<10}{summary['count']:>10}"
+                     + ''.join(f"{summary[f'p{p:g}'] / 1000:>12.1f}" for p in lh.PERCENTILES)
+                     + f"{summary['max'] / 1000:>12.1f}")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load tests the game server with simulated players.')
+    parser.add_argument('--players', type=int, default=100)
+    parser.add_argument('--rate', type=float, default=0,
+                        help='Target rounds per second over every player, 0 for as fast as possible')
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--answers', choices=[g.CORRECT_ANSWERS, g.RANDOM_ANSWERS], default=g.RANDOM_ANSWERS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--path', help='Path of a Unix socket to use instead of TCP')
+    parser.add_argument('--output', help='Also write the report as JSON to this file')
+    args = parser.parse_args()
+
+    report = asyncio.run(run_load_test(args.players, args.rate, args.duration, args.answers, args.seed,
+                                       args.path))
+    print(format_report(report))
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import asyncio
+import test_suite as test
+import game_server as g
+import latency_histogram as lh
+import load_test as lt
+
+NUM_TEST_PLAYERS = 4
+NUM_ROUNDS_PER_GAME = 5
+
+
+def __utest_run_load_test():
+    u_test = test.create()
+
+    report = asyncio.run(lt.run_load_test(NUM_TEST_PLAYERS, duration=0.2, answers=g.CORRECT_ANSWERS, seed=1))
+    test.assert_equals(u_test, "Report Fields Test",
+                       ['answers', 'elapsed_sec', 'latency_ns', 'players', 'rounds', 'rounds_per_sec', 'sessions',
+                        'target_rate'], sorted(report))
+    test.assert_equals(u_test, "Settings Test", (NUM_TEST_PLAYERS, 0, g.CORRECT_ANSWERS),
+                       (report['players'], report['target_rate'], report['answers']))
+    test.assert_equals(u_test, "Whole Games Test", NUM_ROUNDS_PER_GAME * report['sessions'], report['rounds'])
+    test.assert_equals(u_test, "Stages Test", lt.STAGES, list(report['latency_ns']))
+    test.assert_equals(u_test, "Every Round Timed Test", [report['rounds']] * len(lt.STAGES),
+                       [summary['count'] for summary in report['latency_ns'].values()])
+    test.assert_equals(u_test, "Percentiles Test", True,
+                       all(set(f'p{percentile:g}' for percentile in lh.PERCENTILES) <= set(summary)
+                           for summary in report['latency_ns'].values()))
+    test.assert_equals(u_test, "Throughput Test", round(report['rounds'] / report['elapsed_sec'], 6),
+                       round(report['rounds_per_sec'], 6))
+    lines = lt.format_report(report).splitlines()
+    test.assert_equals(u_test, "Report Lines Test", [g.DEAL_STAGE, g.EVALUATE_STAGE, lt.RESPOND_STAGE],
+                       [line.split()[0] for line in lines[3:]])
+
+    rate = 100
+    report = asyncio.run(lt.run_load_test(NUM_TEST_PLAYERS, rate=rate, duration=0.3, answers=g.RANDOM_ANSWERS, seed=1))
+    test.assert_equals(u_test, "Paced Rate Test", True,
+                       0 < report['rounds'] <= rate * 0.3 + NUM_TEST_PLAYERS * NUM_ROUNDS_PER_GAME)
+    test.assert_equals(u_test, "Random Answers Timed Test", report['rounds'],
+                       report['latency_ns'][lt.RESPOND_STAGE]['count'])
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_run_load_test()
@@ -4,30 +4,34 @@ import deck as d
 NUM_CARDS_IN_HAND = 5
 
 
+def deal_round(game_deck):
+    """
+    Deals hand 1 and hand 2 from the deck and compares them.
+
+    :param game_deck: The deck to deal from.
+    :return: Tuple of hand 1, hand 2, and the result of hand_1.compare_to(hand_2)
+    """
+    hand_1 = h.PokerHand([])
+    hand_1.deal_hand(game_deck)
+    hand_2 = h.PokerHand([])
+    hand_2.deal_hand(game_deck)
+    return hand_1, hand_2, hand_1.compare_to(hand_2)
+
+
 def main():
     game_deck = d.Deck()
 
     correct_answer = True
     total_score = 0
-    hand_1_list = []
-    hand_2_list = []
 
     while not game_deck.less_than_5_cards() and correct_answer:
-        # draw hand 1
+        # draw hand 1 and hand 2, then compare_to
+        hand_1, hand_2, actual_result = deal_round(game_deck)
         print('Hand 1:')
-        hand_1 = h.PokerHand(hand_1_list)
-        hand_1.deal_hand(game_deck)
         print(hand_1)
-
-        # draw hand 2
         print('Hand 2:')
-        hand_2 = h.PokerHand(hand_2_list)
-        hand_2.deal_hand(game_deck)
         print(hand_2)
 
-        # compare_to
-        actual_result = hand_1.compare_to(hand_2)
-
         user_guess = input("Which hand is worth more? Are they equal?\nEnter 1 for Hand 1,"
                            " -1 for Hand 2, or 0 for a Tie\n")
 
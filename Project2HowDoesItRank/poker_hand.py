@@ -1,5 +1,5 @@
-import test_suite as test
 import card as c
+import hand_cache as hc
 
 HAND_1_WINS = 1
 TIE = 0
@@ -14,21 +14,35 @@ FLUSH = 4
 TWO_PAIR = 3
 PAIR = 2
 HIGH_CARD = 1
+HAND_TYPE_NAMES = {FLUSH: 'Flush', TWO_PAIR: 'Two Pair', PAIR: 'Pair', HIGH_CARD: 'High Card'}
+RANK_BITS = 4
+CATEGORY_SHIFT = RANK_BITS * NUM_CARDS_IN_HAND
+STRENGTH_CACHE = hc.HandCache()
+WRITE_CHUNK_SIZE = 4096
 
 
 class PokerHand:
 
+    __slots__ = ('__card_list', '__strength', '__rank_counts', '__multiplicity_counts', '__suit_mask')
+
     def __init__(self, card_list):
         """
         Constructs a PokerHand object with a given card list.
 
         :param card_list: List of cards that should be in the hand.
         """
-        self.__card_list = card_list.copy()
+        self.__card_list = []
+        self.__strength = None
+        self.__rank_counts = [0] * (c.ACE + 1)
+        self.__multiplicity_counts = [c.NUM_RANKS, 0]
+        self.__suit_mask = 0
+        for card in card_list:
+            self.add_card(card)
 
     def get_hand(self):
         """
-        Gets and returns hand.
+        Gets and returns hand. Cards should only be added through add_card, which keeps
+        the hand's rank and suit counts up to date.
 
         :return: The hand.
         """
@@ -36,12 +50,23 @@ class PokerHand:
 
     def add_card(self, card):
         """
-        Adds a card object to a list of cards.
+        Adds a card object to a list of cards, and updates the number of cards of its
+        rank, the number of ranks with each number of cards, and the suits in the hand.
 
         :param card: The given card object.
         :return: No return.
         """
         self.__card_list.append(card)
+        self.__strength = None
+
+        rank = card.get_rank()
+        count = self.__rank_counts[rank]
+        self.__rank_counts[rank] = count + 1
+        if count + 1 == len(self.__multiplicity_counts):
+            self.__multiplicity_counts.append(0)
+        self.__multiplicity_counts[count] -= 1
+        self.__multiplicity_counts[count + 1] += 1
+        self.__suit_mask |= 1 << c.get_code_suit_index(card.get_code())
 
     def deal_hand(self, deck):
         """
@@ -53,52 +78,74 @@ class PokerHand:
         for i in range(NUM_CARDS_IN_HAND):
             self.add_card(deck.deal_card())
 
-    def __get_suits_in_hand(self):
-        return [card.get_suit() for card in self.__card_list]
+    def get_codes(self):
+        """
+        Gets and returns the integer codes of the cards in the hand.
+
+        :return: List of card codes.
+        """
+        return [card.get_code() for card in self.__card_list]
+
+    def get_num_cards(self):
+        """
+        Gets and returns the number of cards in the hand.
+
+        :return: The number of cards.
+        """
+        return len(self.__card_list)
+
+    def get_rank_count(self, rank):
+        """
+        Gets and returns the number of cards of a rank in the hand.
+
+        :param rank: The given rank.
+        :return: The number of cards of that rank.
+        """
+        return self.__rank_counts[rank]
+
+    def get_num_ranks_with_count(self, count):
+        """
+        Gets and returns how many ranks have exactly count cards in the hand, such as
+        the number of pairs for a count of 2.
+
+        :param count: The given number of cards.
+        :return: The number of ranks.
+        """
+        if count < len(self.__multiplicity_counts):
+            return self.__multiplicity_counts[count]
+        return 0
+
+    def can_be_flush(self):
+        """
+        Checks whether the hand can still become a flush, which is while it has at most
+        5 cards and all of them share a suit.
 
-    def __get_first_suit_in_hand(self, suits_in_hand):
-        return suits_in_hand[0]
+        :return: True iff the hand can still become a flush.
+        """
+        return len(self.__card_list) <= NUM_CARDS_IN_HAND and self.__suit_mask & (self.__suit_mask - 1) == 0
 
     def __get_ranks_in_hand(self):
-        return [card.get_rank() for card in self.__card_list]
+        """
+        Gets the ranks of the cards in the hand from the rank counts.
+
+        :return: List of ranks, sorted from highest to lowest.
+        """
+        hand_ranks = []
+        for rank in range(c.ACE, c.LOWEST_RANK - 1, -1):
+            hand_ranks.extend([rank] * self.__rank_counts[rank])
+        return hand_ranks
 
     def __is_flush(self):
-        is_flush = True
-        suits_in_hand = self.__get_suits_in_hand()
-        first_suit = self.__get_first_suit_in_hand(suits_in_hand)
-        for _suit in range(1, len(suits_in_hand)):
-            if suits_in_hand[_suit] != first_suit:
-                is_flush = False
-        return is_flush
+        return len(self.__card_list) > 0 and self.__suit_mask & (self.__suit_mask - 1) == 0
 
     def __is_pair(self):
-        is_pair = False
-        ranks_in_hand = self.__get_ranks_in_hand()
-        pairs = []
-        for rank in ranks_in_hand:
-            if rank not in pairs:
-                if ranks_in_hand.count(rank) > 1:
-                    pairs.append(rank)
-        if len(pairs) == 1:
-            is_pair = True
-
-        return is_pair
+        num_pairs = sum(self.__multiplicity_counts[2:])
+        return num_pairs == 1
 
     def __is_two_pair(self):
-        is_two_pair = False
-        pairs = []
-        ranks_in_hand = self.__get_ranks_in_hand()
-        for rank in ranks_in_hand:
-            if rank not in pairs:
-                if ranks_in_hand.count(rank) > 1:
-                    pairs.append(rank)
-                    if ranks_in_hand.count(rank) == FOUR_OF_A_KIND:
-                        pairs.append(rank)
-
-        if len(pairs) == 2:
-            is_two_pair = True
-
-        return is_two_pair
+        num_pairs = sum(self.__multiplicity_counts[2:])
+        num_pairs += self.get_num_ranks_with_count(FOUR_OF_A_KIND)
+        return num_pairs == 2
 
     def __hand_type(self):
         """
@@ -115,37 +162,6 @@ class PokerHand:
         else:
             return HIGH_CARD
 
-    def __compare_ranks(self, ranks_1, ranks_2):
-        """
-        Compares two ranks' values.
-
-        :param ranks_1: Given rank 1.
-        :param ranks_2: Given rank 2.
-        :return: 1 if rank 1 is greater than rank 2, 0 if they are equal, and -1 if rank 1 is less than rank 2
-        """
-        if ranks_1 > ranks_2:
-            return HAND_1_WINS
-        elif ranks_1 == ranks_2:
-            return TIE
-        else:
-            return HAND_2_WINS
-
-    def __compare_flush_or_high_card(self, hand_1_ranks, hand_2_ranks):
-        """
-        Compares two flush hands or two high-card hands and returns which hand wins.
-
-        :param hand_1_ranks: Given list of ranks from hand.
-        :param hand_2_ranks: Given list of ranks from hand.
-        :return: 1 if hand 1 wins, -1 is hand 2 wins, and 0 if they tie
-        """
-        winning_hand = 0
-        i = 0
-        while winning_hand == 0 and i < NUM_CARDS_IN_HAND:
-            winning_hand = self.__compare_ranks(hand_1_ranks[i], hand_2_ranks[i])
-            i += 1
-
-        return winning_hand
-
     def __get_pairs(self, hand_ranks):
         """
         Gets pairs from a list of ranks and creates a new list of pair ranks.
@@ -156,9 +172,9 @@ class PokerHand:
         pairs = []
         for rank in hand_ranks:
             if rank not in pairs:
-                if hand_ranks.count(rank) > 1:
+                if self.__rank_counts[rank] > 1:
                     pairs.append(rank)
-                    if hand_ranks.count(rank) == FOUR_OF_A_KIND:
+                    if self.__rank_counts[rank] == FOUR_OF_A_KIND:
                         pairs.append(rank)
         return pairs
 
@@ -173,8 +189,8 @@ class PokerHand:
         high_card = []
         for rank in hand_ranks:
             if rank not in pairs:
-                if hand_ranks.count(rank) > 1:
-                    if hand_ranks.count(rank) == THREE_OF_A_KIND:
+                if self.__rank_counts[rank] > 1:
+                    if self.__rank_counts[rank] == THREE_OF_A_KIND:
                         high_card.append(rank)
                     pairs.append(rank)
                 else:
@@ -182,53 +198,71 @@ class PokerHand:
 
         return high_card
 
-    def __compare_two_pair(self, hand_1_ranks, hand_2_ranks):
+    def __get_tie_break_ranks(self, hand_type, hand_ranks):
         """
-        Compares two two-pair hands and returns which hand wins.
+        Gets the ranks that break a tie between two hands of the same type, in the
+        order they are compared.
 
-        :param hand_1_ranks: Given list of ranks from hand.
-        :param hand_2_ranks: Given list of ranks from hand.
-        :return: 1 if hand 1 wins, -1 is hand 2 wins, and 0 if they tie
+        :param hand_type: The type of the hand.
+        :param hand_ranks: Given list of ranks in hand, sorted from highest to lowest.
+        :return: List of tie-break ranks, most significant first.
         """
-        pairs_hand_1 = self.__get_pairs(hand_1_ranks)
-        high_card_hand_1 = self.__get_high_cards_in_pairs(hand_1_ranks)
-        pairs_hand_2 = self.__get_pairs(hand_2_ranks)
-        high_card_hand_2 = self.__get_high_cards_in_pairs(hand_2_ranks)
+        if hand_type == TWO_PAIR:
+            pairs = self.__get_pairs(hand_ranks)
+            high_card = self.__get_high_cards_in_pairs(hand_ranks)
+            return pairs[:NUM_TWO_PAIRS] + high_card[:1]
+        elif hand_type == PAIR:
+            pairs = self.__get_pairs(hand_ranks)
+            high_card = self.__get_high_cards_in_pairs(hand_ranks)
+            return pairs[:NUM_PAIRS] + high_card[NUM_PAIRS:NUM_HIGH_CARDS_PAIR]
+        else:
+            return hand_ranks
 
-        winning_hand = 0
-        i = 0
-        while winning_hand == 0 and i < NUM_TWO_PAIRS:
-            winning_hand = self.__compare_ranks(pairs_hand_1[i], pairs_hand_2[i])
-            i += 1
-        if winning_hand == 0:
-            winning_hand = self.__compare_ranks(high_card_hand_1[0], high_card_hand_2[0])
+    def __compute_strength(self):
+        """
+        Computes the strength key of the hand. The hand type is stored in the high bits,
+        followed by the tie-break ranks packed in the order they are compared.
 
-        return winning_hand
+        Suits only matter for flushes, so hands with the same rank counts and flush
+        bit share a key, which is kept in STRENGTH_CACHE.
 
-    def __compare_pair(self, hand_1_ranks, hand_2_ranks):
+        :return: The strength key.
         """
-        Compares two pair hands and returns which hand wins.
+        signature = (tuple(self.__rank_counts), self.__is_flush())
+        strength = STRENGTH_CACHE.get(signature)
+        if strength is not None:
+            return strength
+
+        hand_ranks = self.__get_ranks_in_hand()
+        hand_type = self.__hand_type()
+        tie_break_ranks = self.__get_tie_break_ranks(hand_type, hand_ranks)
+
+        strength = hand_type
+        for i in range(NUM_CARDS_IN_HAND):
+            strength <<= RANK_BITS
+            if i < len(tie_break_ranks):
+                strength |= tie_break_ranks[i]
+        STRENGTH_CACHE.put(signature, strength)
+        return strength
 
-        :param hand_1_ranks: Given list of ranks from hand.
-        :param hand_2_ranks: Given list of ranks from hand.
-        :return: 1 if hand 1 wins, -1 is hand 2 wins, and 0 if they tie
+    def get_strength(self):
         """
-        pairs_hand_1 = self.__get_pairs(hand_1_ranks)
-        high_card_hand_1 = self.__get_high_cards_in_pairs(hand_1_ranks)
-        pairs_hand_2 = self.__get_pairs(hand_2_ranks)
-        high_card_hand_2 = self.__get_high_cards_in_pairs(hand_2_ranks)
+        Gets the strength key of the hand. The key is computed the first time it is needed
+        and kept until another card is added, so hands can be compared or sorted by it.
 
-        winning_hand = 0
-        i = 0
-        while winning_hand == 0 and i < NUM_PAIRS:
-            winning_hand = self.__compare_ranks(pairs_hand_1[i], pairs_hand_2[i])
-            i += 1
-        if winning_hand == 0:
-            while winning_hand == 0 and i < NUM_HIGH_CARDS_PAIR:
-                winning_hand = self.__compare_ranks(high_card_hand_1[i], high_card_hand_2[i])
-                i += 1
+        :return: An integer that is greater for hands that are worth more.
+        """
+        if self.__strength is None:
+            self.__strength = self.__compute_strength()
+        return self.__strength
+
+    def get_hand_type(self):
+        """
+        Gets the type of the hand.
 
-        return winning_hand
+        :return: FLUSH, TWO_PAIR, PAIR, or HIGH_CARD.
+        """
+        return self.get_strength() >> CATEGORY_SHIFT
 
     def compare_to(self, other):
         """
@@ -241,377 +275,52 @@ class PokerHand:
         if they are worth the SAME, and a positive number if self if worth
         MORE than other
         """
-        hand_1_type = self.__hand_type()
-        hand_2_type = other.__hand_type()
+        strength_1 = self.get_strength()
+        strength_2 = other.get_strength()
 
-        if hand_1_type > hand_2_type:
+        if strength_1 > strength_2:
             return HAND_1_WINS
-        elif hand_1_type < hand_2_type:
+        elif strength_1 < strength_2:
             return HAND_2_WINS
-        elif hand_1_type == hand_2_type:
-            hand_1_ranks = self.__get_ranks_in_hand()
-            hand_2_ranks = other.__get_ranks_in_hand()
-            hand_1_ranks.sort(reverse=True)
-            hand_2_ranks.sort(reverse=True)
-
-            if hand_1_type == FLUSH:
-                return self.__compare_flush_or_high_card(hand_1_ranks, hand_2_ranks)
-            elif hand_1_type == TWO_PAIR:
-                return self.__compare_two_pair(hand_1_ranks, hand_2_ranks)
-            elif hand_1_type == PAIR:
-                return self.__compare_pair(hand_1_ranks, hand_2_ranks)
-            else:
-                return self.__compare_flush_or_high_card(hand_1_ranks, hand_2_ranks)
+        else:
+            return TIE
 
     def __str__(self):
-        player_hand = ''
-        for card in self.__card_list:
-            player_hand += card.__str__()
-            player_hand += '\n'
-        return player_hand
-
-
-def __utest_compare_to_flush():
-    u_test = test.create()
-
-    hand_1_list = []
-    hand_1 = PokerHand(hand_1_list)
-    hand_2_list = []
-    hand_2 = PokerHand(hand_2_list)
-    hand_3_list = []
-    hand_3 = PokerHand(hand_3_list)
-    hand_4_list = []
-    hand_4 = PokerHand(hand_4_list)
-
-    hand_1.add_card(c.Card(3, "Spades"))
-    hand_1.add_card(c.Card(14, "Spades"))
-    hand_1.add_card(c.Card(8, "Spades"))
-    hand_1.add_card(c.Card(5, "Spades"))
-    hand_1.add_card(c.Card(10, "Spades"))
-
-    hand_2.add_card(c.Card(2, "Hearts"))
-    hand_2.add_card(c.Card(7, "Hearts"))
-    hand_2.add_card(c.Card(14, "Hearts"))
-    hand_2.add_card(c.Card(9, "Hearts"))
-    hand_2.add_card(c.Card(13, "Hearts"))
-
-    hand_3.add_card(c.Card(2, "Diamonds"))
-    hand_3.add_card(c.Card(7, "Diamonds"))
-    hand_3.add_card(c.Card(6, "Diamonds"))
-    hand_3.add_card(c.Card(9, "Diamonds"))
-    hand_3.add_card(c.Card(13, "Diamonds"))
-
-    hand_4.add_card(c.Card(8, "Clubs"))
-    hand_4.add_card(c.Card(5, "Clubs"))
-    hand_4.add_card(c.Card(14, "Clubs"))
-    hand_4.add_card(c.Card(3, "Clubs"))
-    hand_4.add_card(c.Card(10, "Clubs"))
-
-    winning_hand = hand_1.compare_to(hand_2)
-    test.assert_equals(u_test, "Flush Test Hand 2 Wins", HAND_2_WINS, winning_hand)
-
-    winning_hand = hand_1.compare_to(hand_3)
-    test.assert_equals(u_test, "Flush Test Hand 1 Wins", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_1.compare_to(hand_4)
-    test.assert_equals(u_test, "Flush Test Hands Tie", TIE, winning_hand)
-
-    test.print_summary(u_test)
-    print()
-
-
-def __u_test_compare_to_two_pair():
-    u_test = test.create()
-
-    hand_1_list = []
-    hand_1 = PokerHand(hand_1_list)
-    hand_2_list = []
-    hand_2 = PokerHand(hand_2_list)
-    hand_3_list = []
-    hand_3 = PokerHand(hand_3_list)
-    hand_4_list = []
-    hand_4 = PokerHand(hand_4_list)
-    hand_5_list = []
-    hand_5 = PokerHand(hand_5_list)
-    hand_6_list = []
-    hand_6 = PokerHand(hand_6_list)
-
-    hand_1.add_card(c.Card(3, "Spades"))
-    hand_1.add_card(c.Card(3, "Diamonds"))
-    hand_1.add_card(c.Card(8, "Spades"))
-    hand_1.add_card(c.Card(8, "Clubs"))
-    hand_1.add_card(c.Card(2, "Spades"))
-
-    hand_2.add_card(c.Card(7, "Clubs"))
-    hand_2.add_card(c.Card(7, "Hearts"))
-    hand_2.add_card(c.Card(9, "Spades"))
-    hand_2.add_card(c.Card(8, "Diamonds"))
-    hand_2.add_card(c.Card(8, "Hearts"))
-
-    hand_3.add_card(c.Card(6, "Spades"))
-    hand_3.add_card(c.Card(6, "Hearts"))
-    hand_3.add_card(c.Card(9, "Hearts"))
-    hand_3.add_card(c.Card(4, "Diamonds"))
-    hand_3.add_card(c.Card(4, "Hearts"))
-
-    hand_4.add_card(c.Card(2, "Clubs"))
-    hand_4.add_card(c.Card(3, "Clubs"))
-    hand_4.add_card(c.Card(8, "Spades"))
-    hand_4.add_card(c.Card(8, "Diamonds"))
-    hand_4.add_card(c.Card(3, "Diamonds"))
-
-    hand_5.add_card(c.Card(11, "Spades"))
-    hand_5.add_card(c.Card(12, "Diamonds"))
-    hand_5.add_card(c.Card(12, "Spades"))
-    hand_5.add_card(c.Card(12, "Clubs"))
-    hand_5.add_card(c.Card(12, "Spades"))
-
-    hand_6.add_card(c.Card(11, "Spades"))
-    hand_6.add_card(c.Card(11, "Diamonds"))
-    hand_6.add_card(c.Card(12, "Spades"))
-    hand_6.add_card(c.Card(12, "Clubs"))
-    hand_6.add_card(c.Card(12, "Spades"))
-
-    winning_hand = hand_1.compare_to(hand_2)
-    test.assert_equals(u_test, "Two-Pair Test Hand 2 Wins", HAND_2_WINS, winning_hand)
-
-    winning_hand = hand_1.compare_to(hand_3)
-    test.assert_equals(u_test, "Two-Pair Test Hand 1 Wins", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_1.compare_to(hand_4)
-    test.assert_equals(u_test, "Two-Pair Test Hands Tie", TIE, winning_hand)
-
-    winning_hand = hand_5.compare_to(hand_6)
-    test.assert_equals(u_test, "Pair Test Hands 1 Wins", HAND_1_WINS, winning_hand)
-
-    test.print_summary(u_test)
-    print()
-
-
-def __u_test_compare_to_pair():
-    u_test = test.create()
-
-    hand_1_list = []
-    hand_1 = PokerHand(hand_1_list)
-    hand_2_list = []
-    hand_2 = PokerHand(hand_2_list)
-    hand_3_list = []
-    hand_3 = PokerHand(hand_3_list)
-    hand_4_list = []
-    hand_4 = PokerHand(hand_4_list)
-
-    hand_1.add_card(c.Card(3, "Spades"))
-    hand_1.add_card(c.Card(4, "Diamonds"))
-    hand_1.add_card(c.Card(8, "Spades"))
-    hand_1.add_card(c.Card(7, "Clubs"))
-    hand_1.add_card(c.Card(8, "Spades"))
-
-    hand_2.add_card(c.Card(2, "Clubs"))
-    hand_2.add_card(c.Card(7, "Hearts"))
-    hand_2.add_card(c.Card(11, "Spades"))
-    hand_2.add_card(c.Card(8, "Diamonds"))
-    hand_2.add_card(c.Card(11, "Hearts"))
-
-    hand_3.add_card(c.Card(6, "Spades"))
-    hand_3.add_card(c.Card(6, "Hearts"))
-    hand_3.add_card(c.Card(9, "Hearts"))
-    hand_3.add_card(c.Card(4, "Diamonds"))
-    hand_3.add_card(c.Card(13, "Hearts"))
-
-    hand_4.add_card(c.Card(7, "Clubs"))
-    hand_4.add_card(c.Card(3, "Clubs"))
-    hand_4.add_card(c.Card(8, "Spades"))
-    hand_4.add_card(c.Card(8, "Diamonds"))
-    hand_4.add_card(c.Card(4, "Diamonds"))
-
-    winning_hand = hand_1.compare_to(hand_2)
-    test.assert_equals(u_test, "Pair Test Hand 2 Wins", HAND_2_WINS, winning_hand)
-
-    winning_hand = hand_1.compare_to(hand_3)
-    test.assert_equals(u_test, "Pair Test Hand 1 Wins", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_1.compare_to(hand_4)
-    test.assert_equals(u_test, "Pair Test Hands Tie", TIE, winning_hand)
-
-    test.print_summary(u_test)
-    print()
-
-
-def __u_test_compare_to_high_card():
-    u_test = test.create()
-
-    hand_1_list = []
-    hand_1 = PokerHand(hand_1_list)
-    hand_2_list = []
-    hand_2 = PokerHand(hand_2_list)
-    hand_3_list = []
-    hand_3 = PokerHand(hand_3_list)
-    hand_4_list = []
-    hand_4 = PokerHand(hand_4_list)
-
-    hand_1.add_card(c.Card(3, "Spades"))
-    hand_1.add_card(c.Card(5, "Diamonds"))
-    hand_1.add_card(c.Card(8, "Spades"))
-    hand_1.add_card(c.Card(13, "Clubs"))
-    hand_1.add_card(c.Card(10, "Spades"))
-
-    hand_2.add_card(c.Card(2, "Clubs"))
-    hand_2.add_card(c.Card(3, "Hearts"))
-    hand_2.add_card(c.Card(9, "Spades"))
-    hand_2.add_card(c.Card(14, "Diamonds"))
-    hand_2.add_card(c.Card(6, "Hearts"))
-
-    hand_3.add_card(c.Card(6, "Spades"))
-    hand_3.add_card(c.Card(10, "Hearts"))
-    hand_3.add_card(c.Card(9, "Hearts"))
-    hand_3.add_card(c.Card(4, "Diamonds"))
-    hand_3.add_card(c.Card(8, "Hearts"))
-
-    hand_4.add_card(c.Card(13, "Clubs"))
-    hand_4.add_card(c.Card(3, "Clubs"))
-    hand_4.add_card(c.Card(8, "Spades"))
-    hand_4.add_card(c.Card(5, "Diamonds"))
-    hand_4.add_card(c.Card(10, "Diamonds"))
-
-    winning_hand = hand_1.compare_to(hand_2)
-    test.assert_equals(u_test, "High Card Test Hand 2 Wins", HAND_2_WINS, winning_hand)
-
-    winning_hand = hand_1.compare_to(hand_3)
-    test.assert_equals(u_test, "High Card Test Hand 1 Wins", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_1.compare_to(hand_4)
-    test.assert_equals(u_test, "High Card Test Hands Tie", TIE, winning_hand)
-
-    test.print_summary(u_test)
-
-def __u_test_compare_types():
-    u_test = test.create()
-
-    hand_flush_list = []
-    hand_flush = PokerHand(hand_flush_list)
-    hand_two_pair_list = []
-    hand_two_pair = PokerHand(hand_two_pair_list)
-    hand_two_pair_list_2 = []
-    hand_two_pair_2 = PokerHand(hand_two_pair_list_2)
-    hand_two_pair_list_3 = []
-    hand_two_pair_3 = PokerHand(hand_two_pair_list_3)
-    hand_pair_list = []
-    hand_pair = PokerHand(hand_pair_list)
-    hand_pair_list_2 = []
-    hand_pair_2 = PokerHand(hand_pair_list_2)
-    hand_high_card_list = []
-    hand_high_card = PokerHand(hand_high_card_list)
-
-    hand_flush.add_card(c.Card(3, "Spades"))
-    hand_flush.add_card(c.Card(14, "Spades"))
-    hand_flush.add_card(c.Card(8, "Spades"))
-    hand_flush.add_card(c.Card(5, "Spades"))
-    hand_flush.add_card(c.Card(10, "Spades"))
-
-    hand_two_pair.add_card(c.Card(3, "Spades"))
-    hand_two_pair.add_card(c.Card(3, "Diamonds"))
-    hand_two_pair.add_card(c.Card(8, "Spades"))
-    hand_two_pair.add_card(c.Card(8, "Clubs"))
-    hand_two_pair.add_card(c.Card(2, "Spades"))
-
-    hand_two_pair_2.add_card(c.Card(9, "Spades"))
-    hand_two_pair_2.add_card(c.Card(12, "Diamonds"))
-    hand_two_pair_2.add_card(c.Card(12, "Spades"))
-    hand_two_pair_2.add_card(c.Card(12, "Clubs"))
-    hand_two_pair_2.add_card(c.Card(12, "Spades"))
-
-    hand_two_pair_3.add_card(c.Card(2, "Spades"))
-    hand_two_pair_3.add_card(c.Card(2, "Diamonds"))
-    hand_two_pair_3.add_card(c.Card(12, "Spades"))
-    hand_two_pair_3.add_card(c.Card(12, "Clubs"))
-    hand_two_pair_3.add_card(c.Card(12, "Spades"))
-
-    hand_pair.add_card(c.Card(3, "Spades"))
-    hand_pair.add_card(c.Card(4, "Diamonds"))
-    hand_pair.add_card(c.Card(8, "Spades"))
-    hand_pair.add_card(c.Card(7, "Clubs"))
-    hand_pair.add_card(c.Card(8, "Spades"))
-
-    hand_pair_2.add_card(c.Card(3, "Spades"))
-    hand_pair_2.add_card(c.Card(4, "Diamonds"))
-    hand_pair_2.add_card(c.Card(7, "Spades"))
-    hand_pair_2.add_card(c.Card(7, "Clubs"))
-    hand_pair_2.add_card(c.Card(7, "Spades"))
-
-    hand_high_card.add_card(c.Card(3, "Spades"))
-    hand_high_card.add_card(c.Card(5, "Diamonds"))
-    hand_high_card.add_card(c.Card(8, "Spades"))
-    hand_high_card.add_card(c.Card(13, "Clubs"))
-    hand_high_card.add_card(c.Card(10, "Spades"))
-
-    winning_hand = hand_flush.compare_to(hand_two_pair)
-    test.assert_equals(u_test, "Flush vs Two Pair Test (Hand 1 Wins [1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_flush.compare_to(hand_two_pair_2)
-    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 1 Wins [1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_flush.compare_to(hand_two_pair_3)
-    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 1 Wins [1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_flush.compare_to(hand_pair)
-    test.assert_equals(u_test, "Flush vs Pair Test (Hand 1 Wins [1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_flush.compare_to(hand_pair_2)
-    test.assert_equals(u_test, "Flush vs Pair 2 Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_flush.compare_to(hand_high_card)
-    test.assert_equals(u_test, "Flush vs High Card Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_two_pair.compare_to(hand_two_pair_2)
-    test.assert_equals(u_test, "Two Pair vs Two Pair 2 Test (Hand 2 Wins[-1])", HAND_2_WINS, winning_hand)
-
-    winning_hand = hand_two_pair.compare_to(hand_two_pair_3)
-    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 2 Wins [-1])", HAND_2_WINS, winning_hand)
-
-    winning_hand = hand_two_pair.compare_to(hand_pair)
-    test.assert_equals(u_test, "Two Pair vs Pair Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_two_pair.compare_to(hand_pair_2)
-    test.assert_equals(u_test, "Two Pair vs Pair 2 Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_two_pair.compare_to(hand_high_card)
-    test.assert_equals(u_test, "Two Pair vs High Card Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_two_pair_2.compare_to(hand_two_pair_3)
-    test.assert_equals(u_test, "Two Pair 2 vs Pair Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_two_pair_2.compare_to(hand_pair)
-    test.assert_equals(u_test, "Two Pair 2 vs Pair Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_two_pair_2.compare_to(hand_pair_2)
-    test.assert_equals(u_test, "Two Pair 2 vs Pair 2 Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_two_pair_2.compare_to(hand_high_card)
-    test.assert_equals(u_test, "Two Pair 2 vs High Card Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_two_pair_3.compare_to(hand_pair)
-    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 1 Wins [1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_two_pair_3.compare_to(hand_pair_2)
-    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 1 Wins [1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_two_pair_3.compare_to(hand_high_card)
-    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 1 Wins [1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_pair.compare_to(hand_pair_2)
-    test.assert_equals(u_test, "Pair vs Pair 2 Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_pair.compare_to(hand_high_card)
-    test.assert_equals(u_test, "Pair vs High Card Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    winning_hand = hand_pair_2.compare_to(hand_high_card)
-    test.assert_equals(u_test, "Pair 2 vs High Card Test (Hand 1 Wins[1])", HAND_1_WINS, winning_hand)
-
-    test.print_summary(u_test)
-
-if __name__ == '__main__':
-    __utest_compare_to_flush()
-    __u_test_compare_to_two_pair()
-    __u_test_compare_to_pair()
-    __u_test_compare_to_high_card()
-    __u_test_compare_types()
+        return ''.join([c.LONG_NAME_LINES[card.get_code()] for card in self.__card_list])
+
+
+def hand_from_codes(codes):
+    """
+    Creates a hand from a list of card codes, using the shared card objects.
+
+    :param codes: List of card codes.
+    :return: The hand.
+    """
+    return PokerHand([c.from_code(code) for code in codes])
+
+
+def write_hands(hands, output_file, long_names=False):
+    """
+    Writes hands to a file or buffer, one hand per line, such as "AS KD 8H 8C 2S" or, with
+    long names, "Ace of Spades, King of Diamonds, ...". The names come from the card tables
+    and lines are written in chunks of WRITE_CHUNK_SIZE hands.
+
+    :param hands: Iterable of PokerHands or of lists of card codes.
+    :param output_file: Text file or buffer to write to.
+    :param long_names: True to write long card names instead of short ones.
+    :return: The number of hands written.
+    """
+    names, separator = (c.LONG_NAMES, ', ') if long_names else (c.SHORT_NAMES, ' ')
+    lines = []
+    num_hands = 0
+    for hand in hands:
+        codes = hand.get_codes() if isinstance(hand, PokerHand) else hand
+        lines.append(separator.join([names[code] for code in codes]))
+        if len(lines) == WRITE_CHUNK_SIZE:
+            output_file.write('\n'.join(lines) + '\n')
+            num_hands += len(lines)
+            lines.clear()
+    if lines:
+        output_file.write('\n'.join(lines) + '\n')
+        num_hands += len(lines)
+    return num_hands
@@ -0,0 +1,424 @@
+import io
+import test_suite as test
+import card as c
+import poker_hand as h
+
+
+def __utest_compare_to_flush():
+    u_test = test.create()
+
+    hand_1_list = []
+    hand_1 = h.PokerHand(hand_1_list)
+    hand_2_list = []
+    hand_2 = h.PokerHand(hand_2_list)
+    hand_3_list = []
+    hand_3 = h.PokerHand(hand_3_list)
+    hand_4_list = []
+    hand_4 = h.PokerHand(hand_4_list)
+
+    hand_1.add_card(c.Card(3, "Spades"))
+    hand_1.add_card(c.Card(14, "Spades"))
+    hand_1.add_card(c.Card(8, "Spades"))
+    hand_1.add_card(c.Card(5, "Spades"))
+    hand_1.add_card(c.Card(10, "Spades"))
+
+    hand_2.add_card(c.Card(2, "Hearts"))
+    hand_2.add_card(c.Card(7, "Hearts"))
+    hand_2.add_card(c.Card(14, "Hearts"))
+    hand_2.add_card(c.Card(9, "Hearts"))
+    hand_2.add_card(c.Card(13, "Hearts"))
+
+    hand_3.add_card(c.Card(2, "Diamonds"))
+    hand_3.add_card(c.Card(7, "Diamonds"))
+    hand_3.add_card(c.Card(6, "Diamonds"))
+    hand_3.add_card(c.Card(9, "Diamonds"))
+    hand_3.add_card(c.Card(13, "Diamonds"))
+
+    hand_4.add_card(c.Card(8, "Clubs"))
+    hand_4.add_card(c.Card(5, "Clubs"))
+    hand_4.add_card(c.Card(14, "Clubs"))
+    hand_4.add_card(c.Card(3, "Clubs"))
+    hand_4.add_card(c.Card(10, "Clubs"))
+
+    winning_hand = hand_1.compare_to(hand_2)
+    test.assert_equals(u_test, "Flush Test Hand 2 Wins", h.HAND_2_WINS, winning_hand)
+
+    winning_hand = hand_1.compare_to(hand_3)
+    test.assert_equals(u_test, "Flush Test Hand 1 Wins", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_1.compare_to(hand_4)
+    test.assert_equals(u_test, "Flush Test Hands Tie", h.TIE, winning_hand)
+
+    test.print_summary(u_test)
+    print()
+
+
+def __u_test_compare_to_two_pair():
+    u_test = test.create()
+
+    hand_1_list = []
+    hand_1 = h.PokerHand(hand_1_list)
+    hand_2_list = []
+    hand_2 = h.PokerHand(hand_2_list)
+    hand_3_list = []
+    hand_3 = h.PokerHand(hand_3_list)
+    hand_4_list = []
+    hand_4 = h.PokerHand(hand_4_list)
+    hand_5_list = []
+    hand_5 = h.PokerHand(hand_5_list)
+    hand_6_list = []
+    hand_6 = h.PokerHand(hand_6_list)
+
+    hand_1.add_card(c.Card(3, "Spades"))
+    hand_1.add_card(c.Card(3, "Diamonds"))
+    hand_1.add_card(c.Card(8, "Spades"))
+    hand_1.add_card(c.Card(8, "Clubs"))
+    hand_1.add_card(c.Card(2, "Spades"))
+
+    hand_2.add_card(c.Card(7, "Clubs"))
+    hand_2.add_card(c.Card(7, "Hearts"))
+    hand_2.add_card(c.Card(9, "Spades"))
+    hand_2.add_card(c.Card(8, "Diamonds"))
+    hand_2.add_card(c.Card(8, "Hearts"))
+
+    hand_3.add_card(c.Card(6, "Spades"))
+    hand_3.add_card(c.Card(6, "Hearts"))
+    hand_3.add_card(c.Card(9, "Hearts"))
+    hand_3.add_card(c.Card(4, "Diamonds"))
+    hand_3.add_card(c.Card(4, "Hearts"))
+
+    hand_4.add_card(c.Card(2, "Clubs"))
+    hand_4.add_card(c.Card(3, "Clubs"))
+    hand_4.add_card(c.Card(8, "Spades"))
+    hand_4.add_card(c.Card(8, "Diamonds"))
+    hand_4.add_card(c.Card(3, "Diamonds"))
+
+    hand_5.add_card(c.Card(11, "Spades"))
+    hand_5.add_card(c.Card(12, "Diamonds"))
+    hand_5.add_card(c.Card(12, "Spades"))
+    hand_5.add_card(c.Card(12, "Clubs"))
+    hand_5.add_card(c.Card(12, "Spades"))
+
+    hand_6.add_card(c.Card(11, "Spades"))
+    hand_6.add_card(c.Card(11, "Diamonds"))
+    hand_6.add_card(c.Card(12, "Spades"))
+    hand_6.add_card(c.Card(12, "Clubs"))
+    hand_6.add_card(c.Card(12, "Spades"))
+
+    winning_hand = hand_1.compare_to(hand_2)
+    test.assert_equals(u_test, "Two-Pair Test Hand 2 Wins", h.HAND_2_WINS, winning_hand)
+
+    winning_hand = hand_1.compare_to(hand_3)
+    test.assert_equals(u_test, "Two-Pair Test Hand 1 Wins", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_1.compare_to(hand_4)
+    test.assert_equals(u_test, "Two-Pair Test Hands Tie", h.TIE, winning_hand)
+
+    winning_hand = hand_5.compare_to(hand_6)
+    test.assert_equals(u_test, "Pair Test Hands 1 Wins", h.HAND_1_WINS, winning_hand)
+
+    test.print_summary(u_test)
+    print()
+
+
+def __u_test_compare_to_pair():
+    u_test = test.create()
+
+    hand_1_list = []
+    hand_1 = h.PokerHand(hand_1_list)
+    hand_2_list = []
+    hand_2 = h.PokerHand(hand_2_list)
+    hand_3_list = []
+    hand_3 = h.PokerHand(hand_3_list)
+    hand_4_list = []
+    hand_4 = h.PokerHand(hand_4_list)
+
+    hand_1.add_card(c.Card(3, "Spades"))
+    hand_1.add_card(c.Card(4, "Diamonds"))
+    hand_1.add_card(c.Card(8, "Spades"))
+    hand_1.add_card(c.Card(7, "Clubs"))
+    hand_1.add_card(c.Card(8, "Spades"))
+
+    hand_2.add_card(c.Card(2, "Clubs"))
+    hand_2.add_card(c.Card(7, "Hearts"))
+    hand_2.add_card(c.Card(11, "Spades"))
+    hand_2.add_card(c.Card(8, "Diamonds"))
+    hand_2.add_card(c.Card(11, "Hearts"))
+
+    hand_3.add_card(c.Card(6, "Spades"))
+    hand_3.add_card(c.Card(6, "Hearts"))
+    hand_3.add_card(c.Card(9, "Hearts"))
+    hand_3.add_card(c.Card(4, "Diamonds"))
+    hand_3.add_card(c.Card(13, "Hearts"))
+
+    hand_4.add_card(c.Card(7, "Clubs"))
+    hand_4.add_card(c.Card(3, "Clubs"))
+    hand_4.add_card(c.Card(8, "Spades"))
+    hand_4.add_card(c.Card(8, "Diamonds"))
+    hand_4.add_card(c.Card(4, "Diamonds"))
+
+    winning_hand = hand_1.compare_to(hand_2)
+    test.assert_equals(u_test, "Pair Test Hand 2 Wins", h.HAND_2_WINS, winning_hand)
+
+    winning_hand = hand_1.compare_to(hand_3)
+    test.assert_equals(u_test, "Pair Test Hand 1 Wins", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_1.compare_to(hand_4)
+    test.assert_equals(u_test, "Pair Test Hands Tie", h.TIE, winning_hand)
+
+    test.print_summary(u_test)
+    print()
+
+
+def __u_test_compare_to_high_card():
+    u_test = test.create()
+
+    hand_1_list = []
+    hand_1 = h.PokerHand(hand_1_list)
+    hand_2_list = []
+    hand_2 = h.PokerHand(hand_2_list)
+    hand_3_list = []
+    hand_3 = h.PokerHand(hand_3_list)
+    hand_4_list = []
+    hand_4 = h.PokerHand(hand_4_list)
+
+    hand_1.add_card(c.Card(3, "Spades"))
+    hand_1.add_card(c.Card(5, "Diamonds"))
+    hand_1.add_card(c.Card(8, "Spades"))
+    hand_1.add_card(c.Card(13, "Clubs"))
+    hand_1.add_card(c.Card(10, "Spades"))
+
+    hand_2.add_card(c.Card(2, "Clubs"))
+    hand_2.add_card(c.Card(3, "Hearts"))
+    hand_2.add_card(c.Card(9, "Spades"))
+    hand_2.add_card(c.Card(14, "Diamonds"))
+    hand_2.add_card(c.Card(6, "Hearts"))
+
+    hand_3.add_card(c.Card(6, "Spades"))
+    hand_3.add_card(c.Card(10, "Hearts"))
+    hand_3.add_card(c.Card(9, "Hearts"))
+    hand_3.add_card(c.Card(4, "Diamonds"))
+    hand_3.add_card(c.Card(8, "Hearts"))
+
+    hand_4.add_card(c.Card(13, "Clubs"))
+    hand_4.add_card(c.Card(3, "Clubs"))
+    hand_4.add_card(c.Card(8, "Spades"))
+    hand_4.add_card(c.Card(5, "Diamonds"))
+    hand_4.add_card(c.Card(10, "Diamonds"))
+
+    winning_hand = hand_1.compare_to(hand_2)
+    test.assert_equals(u_test, "High Card Test Hand 2 Wins", h.HAND_2_WINS, winning_hand)
+
+    winning_hand = hand_1.compare_to(hand_3)
+    test.assert_equals(u_test, "High Card Test Hand 1 Wins", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_1.compare_to(hand_4)
+    test.assert_equals(u_test, "High Card Test Hands Tie", h.TIE, winning_hand)
+
+    test.print_summary(u_test)
+
+def __u_test_compare_types():
+    u_test = test.create()
+
+    hand_flush_list = []
+    hand_flush = h.PokerHand(hand_flush_list)
+    hand_two_pair_list = []
+    hand_two_pair = h.PokerHand(hand_two_pair_list)
+    hand_two_pair_list_2 = []
+    hand_two_pair_2 = h.PokerHand(hand_two_pair_list_2)
+    hand_two_pair_list_3 = []
+    hand_two_pair_3 = h.PokerHand(hand_two_pair_list_3)
+    hand_pair_list = []
+    hand_pair = h.PokerHand(hand_pair_list)
+    hand_pair_list_2 = []
+    hand_pair_2 = h.PokerHand(hand_pair_list_2)
+    hand_high_card_list = []
+    hand_high_card = h.PokerHand(hand_high_card_list)
+
+    hand_flush.add_card(c.Card(3, "Spades"))
+    hand_flush.add_card(c.Card(14, "Spades"))
+    hand_flush.add_card(c.Card(8, "Spades"))
+    hand_flush.add_card(c.Card(5, "Spades"))
+    hand_flush.add_card(c.Card(10, "Spades"))
+
+    hand_two_pair.add_card(c.Card(3, "Spades"))
+    hand_two_pair.add_card(c.Card(3, "Diamonds"))
+    hand_two_pair.add_card(c.Card(8, "Spades"))
+    hand_two_pair.add_card(c.Card(8, "Clubs"))
+    hand_two_pair.add_card(c.Card(2, "Spades"))
+
+    hand_two_pair_2.add_card(c.Card(9, "Spades"))
+    hand_two_pair_2.add_card(c.Card(12, "Diamonds"))
+    hand_two_pair_2.add_card(c.Card(12, "Spades"))
+    hand_two_pair_2.add_card(c.Card(12, "Clubs"))
+    hand_two_pair_2.add_card(c.Card(12, "Spades"))
+
+    hand_two_pair_3.add_card(c.Card(2, "Spades"))
+    hand_two_pair_3.add_card(c.Card(2, "Diamonds"))
+    hand_two_pair_3.add_card(c.Card(12, "Spades"))
+    hand_two_pair_3.add_card(c.Card(12, "Clubs"))
+    hand_two_pair_3.add_card(c.Card(12, "Spades"))
+
+    hand_pair.add_card(c.Card(3, "Spades"))
+    hand_pair.add_card(c.Card(4, "Diamonds"))
+    hand_pair.add_card(c.Card(8, "Spades"))
+    hand_pair.add_card(c.Card(7, "Clubs"))
+    hand_pair.add_card(c.Card(8, "Spades"))
+
+    hand_pair_2.add_card(c.Card(3, "Spades"))
+    hand_pair_2.add_card(c.Card(4, "Diamonds"))
+    hand_pair_2.add_card(c.Card(7, "Spades"))
+    hand_pair_2.add_card(c.Card(7, "Clubs"))
+    hand_pair_2.add_card(c.Card(7, "Spades"))
+
+    hand_high_card.add_card(c.Card(3, "Spades"))
+    hand_high_card.add_card(c.Card(5, "Diamonds"))
+    hand_high_card.add_card(c.Card(8, "Spades"))
+    hand_high_card.add_card(c.Card(13, "Clubs"))
+    hand_high_card.add_card(c.Card(10, "Spades"))
+
+    winning_hand = hand_flush.compare_to(hand_two_pair)
+    test.assert_equals(u_test, "Flush vs Two Pair Test (Hand 1 Wins [1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_flush.compare_to(hand_two_pair_2)
+    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 1 Wins [1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_flush.compare_to(hand_two_pair_3)
+    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 1 Wins [1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_flush.compare_to(hand_pair)
+    test.assert_equals(u_test, "Flush vs Pair Test (Hand 1 Wins [1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_flush.compare_to(hand_pair_2)
+    test.assert_equals(u_test, "Flush vs Pair 2 Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_flush.compare_to(hand_high_card)
+    test.assert_equals(u_test, "Flush vs High Card Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_two_pair.compare_to(hand_two_pair_2)
+    test.assert_equals(u_test, "Two Pair vs Two Pair 2 Test (Hand 2 Wins[-1])", h.HAND_2_WINS, winning_hand)
+
+    winning_hand = hand_two_pair.compare_to(hand_two_pair_3)
+    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 2 Wins [-1])", h.HAND_2_WINS, winning_hand)
+
+    winning_hand = hand_two_pair.compare_to(hand_pair)
+    test.assert_equals(u_test, "Two Pair vs Pair Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_two_pair.compare_to(hand_pair_2)
+    test.assert_equals(u_test, "Two Pair vs Pair 2 Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_two_pair.compare_to(hand_high_card)
+    test.assert_equals(u_test, "Two Pair vs High Card Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_two_pair_2.compare_to(hand_two_pair_3)
+    test.assert_equals(u_test, "Two Pair 2 vs Pair Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_two_pair_2.compare_to(hand_pair)
+    test.assert_equals(u_test, "Two Pair 2 vs Pair Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_two_pair_2.compare_to(hand_pair_2)
+    test.assert_equals(u_test, "Two Pair 2 vs Pair 2 Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_two_pair_2.compare_to(hand_high_card)
+    test.assert_equals(u_test, "Two Pair 2 vs High Card Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_two_pair_3.compare_to(hand_pair)
+    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 1 Wins [1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_two_pair_3.compare_to(hand_pair_2)
+    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 1 Wins [1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_two_pair_3.compare_to(hand_high_card)
+    test.assert_equals(u_test, "Flush vs Two Pair 2 Test (Hand 1 Wins [1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_pair.compare_to(hand_pair_2)
+    test.assert_equals(u_test, "Pair vs Pair 2 Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_pair.compare_to(hand_high_card)
+    test.assert_equals(u_test, "Pair vs High Card Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    winning_hand = hand_pair_2.compare_to(hand_high_card)
+    test.assert_equals(u_test, "Pair 2 vs High Card Test (Hand 1 Wins[1])", h.HAND_1_WINS, winning_hand)
+
+    test.print_summary(u_test)
+    print()
+
+
+def __u_test_strength():
+    u_test = test.create()
+
+    hand_1 = h.PokerHand([c.Card(3, "Spades"), c.Card(5, "Diamonds"), c.Card(8, "Spades"),
+                        c.Card(13, "Clubs"), c.Card(10, "Spades")])
+    hand_2 = h.PokerHand([c.Card(3, "Spades"), c.Card(3, "Diamonds"), c.Card(8, "Spades"),
+                        c.Card(8, "Clubs"), c.Card(2, "Spades")])
+    hand_3 = h.PokerHand([c.Card(2, "Hearts"), c.Card(7, "Hearts"), c.Card(14, "Hearts"),
+                        c.Card(9, "Hearts"), c.Card(13, "Hearts")])
+    hand_4 = h.PokerHand([c.Card(6, "Spades"), c.Card(6, "Hearts"), c.Card(9, "Hearts"),
+                        c.Card(4, "Diamonds"), c.Card(13, "Hearts")])
+
+    sorted_hands = sorted([hand_3, hand_1, hand_4, hand_2], key=h.PokerHand.get_strength)
+    test.assert_equals(u_test, "Sort By Strength Test", [hand_1, hand_4, hand_2, hand_3], sorted_hands)
+
+    test.assert_equals(u_test, "Hand Type Test", h.TWO_PAIR, hand_2.get_hand_type())
+
+    hand_5 = h.PokerHand([c.Card(6, "Clubs"), c.Card(6, "Diamonds"), c.Card(9, "Clubs"), c.Card(4, "Clubs")])
+    hand_5.get_strength()
+    hand_5.add_card(c.Card(9, "Spades"))
+    test.assert_equals(u_test, "Strength Updated After Add Card Test", h.TWO_PAIR, hand_5.get_hand_type())
+
+    hand_6 = h.hand_from_codes(hand_4.get_codes())
+    test.assert_equals(u_test, "Hand From Codes Test", h.TIE, hand_6.compare_to(hand_4))
+
+    test.print_summary(u_test)
+    print()
+
+
+def __u_test_partial_hand():
+    u_test = test.create()
+
+    hand = h.PokerHand([c.Card(9, "Hearts"), c.Card(9, "Clubs")])
+    test.assert_equals(u_test, "Rank Count Test", 2, hand.get_rank_count(9))
+    test.assert_equals(u_test, "Pairs Count Test", 1, hand.get_num_ranks_with_count(2))
+    test.assert_equals(u_test, "Mixed Suits Cannot Be Flush Test", False, hand.can_be_flush())
+
+    hand = h.PokerHand([c.Card(2, "Hearts"), c.Card(7, "Hearts"), c.Card(14, "Hearts")])
+    test.assert_equals(u_test, "Same Suit Can Be Flush Test", True, hand.can_be_flush())
+    hand.add_card(c.Card(9, "Hearts"))
+    hand.add_card(c.Card(13, "Hearts"))
+    test.assert_equals(u_test, "Fifth Card Flush Test", h.FLUSH, hand.get_hand_type())
+    test.assert_equals(u_test, "Number Of Cards Test", h.NUM_CARDS_IN_HAND, hand.get_num_cards())
+
+    test.print_summary(u_test)
+
+
+def __u_test_str():
+    u_test = test.create()
+
+    hand = h.PokerHand([c.Card(11, "Spades"), c.Card(10, "Hearts"), c.Card(2, "Diamonds")])
+    test.assert_equals(u_test, "Hand String Test", "Jack of Spades\n10 of Hearts\n2 of Diamonds\n", str(hand))
+    test.assert_equals(u_test, "Empty Hand String Test", "", str(h.PokerHand([])))
+
+    output = io.StringIO()
+    num_hands = h.write_hands([hand, [c.parse("AS"), c.parse("KD")]] * h.WRITE_CHUNK_SIZE, output)
+    lines = output.getvalue().splitlines()
+    test.assert_equals(u_test, "Write Hands Count Test", 2 * h.WRITE_CHUNK_SIZE, num_hands)
+    test.assert_equals(u_test, "Write Hands Lines Test", ["JS TH 2D", "AS KD"], lines[-2:])
+    test.assert_equals(u_test, "Write Hands Line Count Test", 2 * h.WRITE_CHUNK_SIZE, len(lines))
+
+    output = io.StringIO()
+    h.write_hands([hand], output, long_names=True)
+    test.assert_equals(u_test, "Write Long Names Test", "Jack of Spades, 10 of Hearts, 2 of Diamonds\n",
+                       output.getvalue())
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_compare_to_flush()
+    __u_test_compare_to_two_pair()
+    __u_test_compare_to_pair()
+    __u_test_compare_to_high_card()
+    __u_test_compare_types()
+    __u_test_strength()
+    __u_test_partial_hand()
+    __u_test_str()
@@ -0,0 +1,140 @@
+import heapq
+import itertools
+import os
+import tempfile
+import numpy as np
+import batch_evaluator as b
+import hand_store as hs
+import hand_table as t
+import poker_hand as h
+
+RUN_SIZE = 1 << 22
+MERGE_BUFFER_SIZE = 1 << 16
+
+
+def get_strength(hand):
+    """
+    Gets the strength key of a hand.
+
+    :param hand: A PokerHand, or a sequence of five card codes.
+    :return: The strength key.
+    """
+    if isinstance(hand, h.PokerHand):
+        return hand.get_strength()
+    return t.evaluate(hand)
+
+
+def rank_hands(hands, key=get_strength):
+    """
+    Orders hands from strongest to weakest, grouping hands of equal strength. Each
+    strength is computed once, and hands that tie keep their input order.
+
+    :param hands: Iterable of hands.
+    :param key: Function giving the strength key of a hand.
+    :return: List of (strength, list of hands) tuples, strongest first.
+    """
+    keyed_hands = sorted(((key(hand), hand) for hand in hands), key=lambda keyed_hand: keyed_hand[0], reverse=True)
+    return [(strength, [hand for hand_strength, hand in tied_hands])
+            for strength, tied_hands in itertools.groupby(keyed_hands, lambda keyed_hand: keyed_hand[0])]
+
+
+def top_k(hands, k, key=get_strength):
+    """
+    Finds the k strongest hands with a heap of size k, without sorting every hand.
+    Only k hands are returned, so the weakest tie class may be cut short.
+
+    :param hands: Iterable of hands.
+    :param k: Number of hands to keep.
+    :param key: Function giving the strength key of a hand.
+    :return: List of (strength, list of hands) tuples, strongest first.
+    """
+    keyed_hands = heapq.nlargest(k, ((key(hand), hand) for hand in hands), key=lambda keyed_hand: keyed_hand[0])
+    return [(strength, [hand for hand_strength, hand in tied_hands])
+            for strength, tied_hands in itertools.groupby(keyed_hands, lambda keyed_hand: keyed_hand[0])]
+
+
+def __write_run(codes, run_path):
+    """
+    Evaluates a run of hands that fits in memory, sorts it from strongest to weakest,
+    and writes it to a hand store file.
+
+    :param codes: Array of shape (N, 5) of card codes.
+    :param run_path: Path of the run file.
+    :return: No return.
+    """
+    strengths = b.evaluate_many(codes)[1]
+    order = np.argsort(-strengths.astype(np.int64), kind='stable')
+    with hs.HandStoreWriter(run_path) as writer:
+        writer.write(codes[order], strengths[order])
+
+
+def __iter_run(run_path):
+    reader = hs.HandStoreReader(run_path)
+    for chunk in reader.iter_chunks():
+        yield from zip(chunk['strength'].tolist(), chunk['cards'].tolist())
+
+
+def external_sort(code_chunks, output_path, run_size=RUN_SIZE, temp_dir=None):
+    """
+    Sorts more hands than fit in memory from strongest to weakest. Hands are gathered
+    into runs of run_size, each run is sorted in memory and written to a temporary hand
+    store, and the runs are then merged into the output hand store.
+
+    :param code_chunks: Iterable of arrays of shape (N, 5) of card codes.
+    :param output_path: Path of the sorted hand store to write.
+    :param run_size: Number of hands sorted in memory at once.
+    :param temp_dir: Directory for the run files, or None for the system default.
+    :return: Number of hands sorted.
+    """
+    with tempfile.TemporaryDirectory(dir=temp_dir) as run_dir:
+        run_paths = []
+        pending = []
+        num_pending = 0
+        for codes in itertools.chain(code_chunks, [None]):
+            if codes is not None:
+                codes = np.asarray(codes, dtype=np.uint8).reshape(-1, h.NUM_CARDS_IN_HAND)
+                pending.append(codes)
+                num_pending += len(codes)
+            while num_pending >= run_size or (codes is None and num_pending > 0):
+                all_pending = np.concatenate(pending)
+                run_path = os.path.join(run_dir, f'run{len(run_paths)}.bin')
+                __write_run(all_pending[:run_size], run_path)
+                run_paths.append(run_path)
+                pending = [all_pending[run_size:]]
+                num_pending = len(pending[0])
+
+        num_hands = 0
+        merged = heapq.merge(*[__iter_run(run_path) for run_path in run_paths],
+                             key=lambda record: record[0], reverse=True)
+        with hs.HandStoreWriter(output_path) as writer:
+            buffer = list(itertools.islice(merged, MERGE_BUFFER_SIZE))
+            while buffer:
+                writer.write([cards for strength, cards in buffer], [strength for strength, cards in buffer])
+                num_hands += len(buffer)
+                buffer = list(itertools.islice(merged, MERGE_BUFFER_SIZE))
+    return num_hands
+
+
+def iter_tie_classes(sorted_store):
+    """
+    Goes through the tie classes of a hand store sorted by external_sort.
+
+    :param sorted_store: HandStoreReader of a sorted hand store.
+    :return: Generator of (strength, start, stop) tuples, where sorted_store[start:stop]
+    holds the hands of that strength.
+    """
+    class_start = 0
+    class_strength = None
+    position = 0
+    for chunk in sorted_store.iter_chunks():
+        strengths = chunk['strength']
+        if class_strength is not None and strengths[0] != class_strength:
+            yield class_strength, class_start, position
+            class_start = position
+        for change in (np.flatnonzero(np.diff(strengths)) + 1).tolist():
+            yield int(strengths[change - 1]), class_start, position + change
+            class_start = position + change
+        class_strength = int(strengths[-1])
+        position += len(chunk)
+    if class_strength is not None:
+        yield class_strength, class_start, position
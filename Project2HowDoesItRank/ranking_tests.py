@@ -0,0 +1,49 @@
+import os
+import tempfile
+import numpy as np
+import test_suite as test
+import hand_store as hs
+import poker_hand as h
+import ranking as r
+
+NUM_TEST_HANDS = 5000
+
+
+def __utest_ranking():
+    u_test = test.create()
+
+    generator = np.random.default_rng(NUM_TEST_HANDS)
+    codes = generator.random((NUM_TEST_HANDS, 52)).argsort(axis=1)[:, :h.NUM_CARDS_IN_HAND].astype(np.uint8)
+    hands = [h.hand_from_codes(hand_codes) for hand_codes in codes.tolist()]
+
+    ranked = r.rank_hands(hands)
+    ordered_hands = [hand for strength, tied_hands in ranked for hand in tied_hands]
+    num_out_of_order = sum(1 for hand_1, hand_2 in zip(ordered_hands, ordered_hands[1:])
+                           if hand_1.compare_to(hand_2) == h.HAND_2_WINS)
+    test.assert_equals(u_test, "Rank Hands Order Test", 0, num_out_of_order)
+    test.assert_equals(u_test, "Rank Hands Ties Test", True,
+                       all(hand.compare_to(tied_hands[0]) == h.TIE
+                           for strength, tied_hands in ranked for hand in tied_hands))
+
+    best = r.top_k(codes.tolist(), 10)
+    test.assert_equals(u_test, "Top K Test", [hand.get_strength() for hand in ordered_hands[:10]],
+                       [strength for strength, tied_hands in best for hand in tied_hands])
+
+    with tempfile.TemporaryDirectory() as test_dir:
+        output_path = os.path.join(test_dir, 'ranking_test.bin')
+        num_hands = r.external_sort([codes[:1234], codes[1234:]], output_path, run_size=1000)
+        reader = hs.HandStoreReader(output_path)
+        test.assert_equals(u_test, "External Sort Count Test", NUM_TEST_HANDS, num_hands)
+        test.assert_equals(u_test, "External Sort Order Test", True,
+                           [hand.get_strength() for hand in ordered_hands] == reader.get_strengths().tolist())
+        tie_classes = list(r.iter_tie_classes(reader))
+        test.assert_equals(u_test, "Tie Classes Test", True,
+                           [(strength, len(tied_hands)) for strength, tied_hands in ranked]
+                           == [(strength, stop - start) for strength, start, stop in tie_classes])
+        del reader
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_ranking()
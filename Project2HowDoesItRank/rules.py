@@ -0,0 +1,319 @@
+import collections
+import math
+import os
+import sys
+import card as c
+import hand_table as t
+import poker_hand as h
+
+WHEEL_RANKS = [c.ACE, 5, 4, 3, 2]
+WHEEL_HIGH_RANK = 5
+STRAIGHT_LENGTH = 5
+CACHE_DIRECTORY = os.path.dirname(t.CACHE_PATH)
+
+
+class HandShape:
+
+    __slots__ = ('__ranks', '__counts', '__group_ranks', '__is_flush', '__straight_high_rank')
+
+    def __init__(self, codes):
+        """
+        Describes five cards by what rule sets look at: the ranks, how many cards share
+        each rank, whether the suits match and whether the ranks run in sequence.
+
+        :param codes: Five card codes.
+        """
+        self.__ranks = sorted([c.get_code_rank(code) for code in codes], reverse=True)
+        groups = sorted(collections.Counter(self.__ranks).items(), key=lambda group: (group[1], group[0]),
+                        reverse=True)
+        self.__counts = [count for rank, count in groups]
+        self.__group_ranks = [rank for rank, count in groups]
+        self.__is_flush = len({c.get_code_suit_index(code) for code in codes}) == 1
+
+        self.__straight_high_rank = 0
+        if len(groups) == STRAIGHT_LENGTH:
+            if self.__ranks[0] - self.__ranks[-1] == STRAIGHT_LENGTH - 1:
+                self.__straight_high_rank = self.__ranks[0]
+            elif self.__ranks == WHEEL_RANKS:
+                self.__straight_high_rank = WHEEL_HIGH_RANK
+
+    def get_ranks(self):
+        """
+        Gets and returns the ranks of the cards.
+
+        :return: List of ranks, sorted from highest to lowest.
+        """
+        return self.__ranks
+
+    def get_counts(self):
+        """
+        Gets and returns how many cards share each rank, such as [3, 2] for a full house.
+
+        :return: List of counts, sorted from highest to lowest.
+        """
+        return self.__counts
+
+    def get_group_ranks(self):
+        """
+        Gets and returns each rank once, ordered by how many cards have it and then by rank,
+        such as [trips, pair] for a full house.
+
+        :return: List of ranks, in the same order as get_counts.
+        """
+        return self.__group_ranks
+
+    def get_rank_count(self, rank):
+        """
+        Gets and returns the number of cards of a rank.
+
+        :param rank: The rank.
+        :return: The number of cards.
+        """
+        return self.__ranks.count(rank)
+
+    def is_flush(self):
+        """
+        Checks whether all cards share a suit.
+
+        :return: True iff the cards are a flush.
+        """
+        return self.__is_flush
+
+    def get_straight_high_rank(self):
+        """
+        Gets the highest rank of the straight the cards make, which is 5 for A-2-3-4-5.
+
+        :return: The highest rank, or 0 if the cards are not a straight.
+        """
+        return self.__straight_high_rank
+
+
+class RuleSet:
+
+    def __init__(self, name, categories, cache_path=None):
+        """
+        Constructs a hand ranking from a table of categories. A hand belongs to the first
+        category whose test it passes, categories further up the table are worth more, and
+        hands in the same category are ordered by their tie-break ranks.
+
+        The ranking is compiled into hand_table lookup tables the first time a hand is
+        evaluated, so every rule set costs the same per hand however many categories it has.
+
+        :param name: Name of the rule set.
+        :param categories: List of (name, test, tie-break) tuples, best category first. The test
+        and the tie-break take a HandShape; the tie-break returns up to five ranks, most
+        significant first.
+        :param cache_path: Path of a file to keep the compiled tables in between runs, as
+        hand_table.load_tables does, or None to compile them in every process. The file is
+        rebuilt when card, poker_hand, hand_table or rules change, so only rule sets defined
+        in this module should have one.
+        """
+        self.__name = name
+        self.__categories = categories
+        self.__cache_path = cache_path
+        self.__flush_table = None
+        self.__rank_table = None
+
+    def get_name(self):
+        """
+        Gets and returns the name of the rule set.
+
+        :return: The name.
+        """
+        return self.__name
+
+    def get_cache_path(self):
+        """
+        Gets and returns the path of the file the compiled tables are kept in.
+
+        :return: The path, or None if the tables are not kept.
+        """
+        return self.__cache_path
+
+    def get_category_names(self):
+        """
+        Gets the name of every category, keyed by the category value stored in strength keys.
+
+        :return: Dictionary mapping category values to names, best category first.
+        """
+        return {len(self.__categories) - index: name for index, (name, matches, tie_break) in
+                enumerate(self.__categories)}
+
+    def get_category(self, strength):
+        """
+        Gets the category stored in a strength key.
+
+        :param strength: The strength key.
+        :return: The category value, higher for better categories.
+        """
+        return strength >> h.CATEGORY_SHIFT
+
+    def get_category_name(self, strength):
+        """
+        Gets the name of the category stored in a strength key.
+
+        :param strength: The strength key.
+        :return: The category name.
+        """
+        return self.__categories[len(self.__categories) - self.get_category(strength)][0]
+
+    def classify(self, codes):
+        """
+        Works out the strength key of five cards by going down the category table. This is
+        how the lookup tables are filled; evaluate is the fast path.
+
+        :param codes: Five card codes.
+        :return: The strength key.
+        """
+        shape = HandShape(codes)
+        for index, (name, matches, tie_break) in enumerate(self.__categories):
+            if matches(shape):
+                strength = len(self.__categories) - index
+                tie_break_ranks = tie_break(shape)
+                for i in range(h.NUM_CARDS_IN_HAND):
+                    strength <<= h.RANK_BITS
+                    if i < len(tie_break_ranks):
+                        strength |= tie_break_ranks[i]
+                return strength
+        raise ValueError(f'{self.__name} rules have no category for {codes}')
+
+    def get_tables(self):
+        """
+        Gets the lookup tables of the rule set, loading them from the cache file, or
+        compiling them, the first time.
+
+        :return: Tuple of the flush table and the rank table, as hand_table.build_tables makes them.
+        """
+        if self.__flush_table is None:
+            if self.__cache_path is None:
+                self.__flush_table, self.__rank_table = t.build_tables(self.classify)
+            else:
+                source_hash = t.get_source_hash([c, h, t, sys.modules[__name__]])
+                self.__flush_table, self.__rank_table = t.load_tables(self.__cache_path, self.classify, source_hash)
+        return self.__flush_table, self.__rank_table
+
+    def evaluate(self, codes):
+        """
+        Looks up the strength key of a hand of five distinct cards.
+
+        :param codes: Sequence of five card codes.
+        :return: The strength key.
+        """
+        if self.__flush_table is None:
+            self.get_tables()
+        return t.evaluate(codes, self.__flush_table, self.__rank_table)
+
+    def compare(self, codes_1, codes_2):
+        """
+        Compares two hands given as card codes.
+
+        :param codes_1: Card codes of the first hand.
+        :param codes_2: Card codes of the second hand.
+        :return: 1 if hand 1 wins, -1 if hand 2 wins, and 0 if they tie
+        """
+        strength_1 = self.evaluate(codes_1)
+        strength_2 = self.evaluate(codes_2)
+        if strength_1 > strength_2:
+            return h.HAND_1_WINS
+        elif strength_1 < strength_2:
+            return h.HAND_2_WINS
+        else:
+            return h.TIE
+
+    def count_categories(self):
+        """
+        Counts how many of the 2,598,960 five-card hands fall in each category, from the
+        lookup tables instead of dealing every hand.
+
+        :return: Dictionary mapping category names to numbers of hands.
+        """
+        flush_table, rank_table = self.get_tables()
+        counts = collections.Counter()
+        for strength in flush_table:
+            if strength:
+                counts[self.get_category_name(strength)] += c.NUM_SUITS
+        for prime_product, strength in rank_table.items():
+            num_hands = 1
+            for prime in t.RANK_PRIMES:
+                count = 0
+                while prime_product % prime == 0:
+                    prime_product //= prime
+                    count += 1
+                num_hands *= math.comb(c.NUM_SUITS, count)
+            if num_hands == c.NUM_SUITS ** h.NUM_CARDS_IN_HAND:
+                num_hands -= c.NUM_SUITS
+            counts[self.get_category_name(strength)] += num_hands
+        return {name: counts[name] for name in self.get_category_names().values()}
+
+
+def __project_pairs(shape):
+    """
+    Lists the paired ranks the way PokerHand.__get_pairs does: any rank with two or more
+    cards, highest first, with four of a kind listed twice.
+    """
+    pairs = []
+    for rank in shape.get_group_ranks():
+        count = shape.get_rank_count(rank)
+        if count > 1:
+            pairs.extend([rank] * (2 if count == h.FOUR_OF_A_KIND else 1))
+    return sorted(pairs, reverse=True)
+
+
+def __project_high_cards(shape):
+    """
+    Lists the high cards the way PokerHand.__get_high_cards_in_pairs does: ranks with one
+    card or three cards, highest first.
+    """
+    return [rank for rank in sorted(shape.get_group_ranks(), reverse=True)
+            if shape.get_rank_count(rank) in (1, h.THREE_OF_A_KIND)]
+
+
+def get_cache_path(name):
+    """
+    Gets the path of the cache file of a rule set, next to hand_table's.
+
+    :param name: Name of the rule set.
+    :return: The path.
+    """
+    return os.path.join(CACHE_DIRECTORY, f'hand_tables_{name}.pickle')
+
+
+# The four categories of PokerHand, where three of a kind counts as a Pair and four of a
+# kind and full houses count as Two Pair.
+PROJECT_RULES = RuleSet('project', [
+    ('Flush', lambda shape: shape.is_flush(), lambda shape: shape.get_ranks()),
+    ('Two Pair', lambda shape: len(__project_pairs(shape)) == h.NUM_TWO_PAIRS,
+     lambda shape: __project_pairs(shape)[:h.NUM_TWO_PAIRS] + __project_high_cards(shape)[:1]),
+    ('Pair', lambda shape: len(__project_pairs(shape)) == h.NUM_PAIRS,
+     lambda shape: __project_pairs(shape)[:h.NUM_PAIRS]
+     + __project_high_cards(shape)[h.NUM_PAIRS:h.NUM_HIGH_CARDS_PAIR]),
+    ('High Card', lambda shape: True, lambda shape: shape.get_ranks()),
+], get_cache_path('project'))
+
+STANDARD_RULES = RuleSet('standard', [
+    ('Straight Flush', lambda shape: shape.is_flush() and shape.get_straight_high_rank() > 0,
+     lambda shape: [shape.get_straight_high_rank()]),
+    ('Four of a Kind', lambda shape: shape.get_counts()[0] == 4, lambda shape: shape.get_group_ranks()),
+    ('Full House', lambda shape: shape.get_counts() == [3, 2], lambda shape: shape.get_group_ranks()),
+    ('Flush', lambda shape: shape.is_flush(), lambda shape: shape.get_ranks()),
+    ('Straight', lambda shape: shape.get_straight_high_rank() > 0, lambda shape: [shape.get_straight_high_rank()]),
+    ('Three of a Kind', lambda shape: shape.get_counts()[0] == 3, lambda shape: shape.get_group_ranks()),
+    ('Two Pair', lambda shape: shape.get_counts()[:2] == [2, 2], lambda shape: shape.get_group_ranks()),
+    ('Pair', lambda shape: shape.get_counts()[0] == 2, lambda shape: shape.get_group_ranks()),
+    ('High Card', lambda shape: True, lambda shape: shape.get_ranks()),
+], get_cache_path('standard'))
+
+RULE_SETS = {rule_set.get_name(): rule_set for rule_set in [PROJECT_RULES, STANDARD_RULES]}
+
+
+def get_rule_set(name):
+    """
+    Gets a rule set by name.
+
+    :param name: 'project' or 'standard'.
+    :return: The RuleSet.
+    """
+    rule_set = RULE_SETS.get(name)
+    if rule_set is None:
+        raise ValueError(f'Unknown rule set: {name}')
+    return rule_set
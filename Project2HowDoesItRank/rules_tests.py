@@ -0,0 +1,83 @@
+import os
+import tempfile
+import test_suite as test
+import card as c
+import hand_table as t
+import poker_hand as h
+import rules as ru
+
+
+def __utest_rule_sets():
+    u_test = test.create()
+
+    flush_table, rank_table = ru.PROJECT_RULES.get_tables()
+    test.assert_equals(u_test, "Project Flush Table Matches PokerHand Test", True, flush_table == t.get_tables()[0])
+    test.assert_equals(u_test, "Project Rank Table Matches PokerHand Test", True, rank_table == t.get_tables()[1])
+    test.assert_equals(u_test, "Project Census Test",
+                       {h.HAND_TYPE_NAMES[hand_type]: count for hand_type, count in [
+                           (h.FLUSH, 5148), (h.TWO_PAIR, 127920), (h.PAIR, 1153152), (h.HIGH_CARD, 1312740)]},
+                       ru.PROJECT_RULES.count_categories())
+    test.assert_equals(u_test, "Standard Census Test",
+                       {'Straight Flush': 40, 'Four of a Kind': 624, 'Full House': 3744, 'Flush': 5108,
+                        'Straight': 10200, 'Three of a Kind': 54912, 'Two Pair': 123552, 'Pair': 1098240,
+                        'High Card': 1302540},
+                       ru.STANDARD_RULES.count_categories())
+
+    wheel = [c.parse(name) for name in ['AS', '2D', '3H', '4C', '5S']]
+    six_high = [c.parse(name) for name in ['2D', '3H', '4C', '5S', '6S']]
+    broadway_flush = [c.parse(name) for name in ['AH', 'KH', 'QH', 'JH', 'TH']]
+    four_of_a_kind = [c.parse(name) for name in ['QS', 'QD', 'QH', 'QC', '2S']]
+    full_house = [c.parse(name) for name in ['KS', 'KD', 'KH', 'QC', 'QS']]
+    three_of_a_kind = [c.parse(name) for name in ['7S', '7D', '7H', '4C', '3S']]
+    two_pair = [c.parse(name) for name in ['AS', 'AD', 'KH', 'KC', '3S']]
+
+    test.assert_equals(u_test, "Wheel Test", 'Straight',
+                       ru.STANDARD_RULES.get_category_name(ru.STANDARD_RULES.evaluate(wheel)))
+    test.assert_equals(u_test, "Wheel Loses To Six High Straight Test (Hand 2 Wins[-1])", h.HAND_2_WINS,
+                       ru.STANDARD_RULES.compare(wheel, six_high))
+    test.assert_equals(u_test, "Straight Flush Test", 'Straight Flush',
+                       ru.STANDARD_RULES.get_category_name(ru.STANDARD_RULES.evaluate(broadway_flush)))
+    test.assert_equals(u_test, "Standard Quads vs Full House Test (Hand 1 Wins[1])", h.HAND_1_WINS,
+                       ru.STANDARD_RULES.compare(four_of_a_kind, full_house))
+    test.assert_equals(u_test, "Project Quads vs Full House Test (Hand 2 Wins[-1])", h.HAND_2_WINS,
+                       ru.PROJECT_RULES.compare(four_of_a_kind, full_house))
+    test.assert_equals(u_test, "Standard Trips vs Two Pair Test (Hand 1 Wins[1])", h.HAND_1_WINS,
+                       ru.STANDARD_RULES.compare(three_of_a_kind, two_pair))
+    test.assert_equals(u_test, "Project Trips vs Two Pair Test (Hand 2 Wins[-1])", h.HAND_2_WINS,
+                       ru.PROJECT_RULES.compare(three_of_a_kind, two_pair))
+    test.assert_equals(u_test, "Project Matches Hand Table Test", t.evaluate(three_of_a_kind),
+                       ru.PROJECT_RULES.evaluate(three_of_a_kind))
+
+    test.print_summary(u_test)
+
+
+def __utest_cache():
+    u_test = test.create()
+
+    classified = []
+
+    def is_flush(shape):
+        classified.append(shape)
+        return shape.is_flush()
+
+    categories = [('Flush', is_flush, lambda shape: shape.get_ranks()),
+                  ('High Card', lambda shape: True, lambda shape: shape.get_ranks())]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'tables.pickle')
+        tables = ru.RuleSet('cached', categories, path).get_tables()
+        test.assert_equals(u_test, "Cache File Written Test", True, os.path.exists(path))
+        classified.clear()
+        test.assert_equals(u_test, "Loaded From Cache Test", tables,
+                           ru.RuleSet('cached', categories, path).get_tables())
+        test.assert_equals(u_test, "Not Compiled Again Test", 0, len(classified))
+
+    test.assert_equals(u_test, "No Cache Path Test", None, ru.RuleSet('uncached', categories).get_cache_path())
+    test.assert_equals(u_test, "Cache Path By Name Test", ru.get_cache_path('standard'),
+                       ru.STANDARD_RULES.get_cache_path())
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_rule_sets()
+    __utest_cache()
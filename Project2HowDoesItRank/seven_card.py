@@ -0,0 +1,207 @@
+import itertools
+import numpy as np
+import card as c
+import hand_table as t
+import poker_hand as h
+
+NUM_CARDS_IN_HOLDING = 7
+MIN_CARDS_TO_FLUSH = h.NUM_CARDS_IN_HAND
+CHUNK_SIZE = 1 << 16
+RANK_VALUES = np.arange(c.LOWEST_RANK, c.ACE + 1)
+TIE_BREAK_SHIFTS = h.RANK_BITS * np.arange(h.NUM_CARDS_IN_HAND - 1, -1, -1)
+
+CODE_RANK = [c.get_code_rank(code) for code in range(c.NUM_CARDS_IN_DECK)]
+
+
+def __pack(hand_type, tie_break_ranks):
+    """
+    Packs a hand type and its tie-break ranks into a strength key, the same way
+    PokerHand does.
+
+    :param hand_type: The hand type.
+    :param tie_break_ranks: Up to five ranks, most significant first.
+    :return: The strength key.
+    """
+    strength = hand_type
+    for i in range(h.NUM_CARDS_IN_HAND):
+        strength <<= h.RANK_BITS
+        if i < len(tie_break_ranks):
+            strength |= tie_break_ranks[i]
+    return strength
+
+
+def evaluate(codes):
+    """
+    Works out the strength key of the best five-card hand that can be made from 5 to 7
+    distinct cards, without trying every five-card subset. One pass over the cards counts
+    the ranks and suits, and the best hand is then read off the counts:
+
+    - a suit with five or more cards makes a flush of its five highest ranks;
+    - four of a kind is the best Two Pair when it is also the highest repeated rank,
+      and otherwise the two highest repeated ranks make it, with the best of the
+      remaining ranks and any three of a kind as the last tie-break;
+    - a single pair keeps the three highest other ranks, and three of a kind also
+      tries keeping all three of its cards, since its own rank then counts as a
+      high card;
+    - otherwise the five highest ranks make a High Card hand.
+
+    :param codes: Sequence of 5 to 7 card codes.
+    :return: The strength key, the highest that hand_table.evaluate gives any five of the cards.
+    """
+    rank_counts = [0] * (c.ACE + 1)
+    suit_counts = [0] * c.NUM_SUITS
+    suit_rank_bits = [0] * c.NUM_SUITS
+    for code in codes:
+        rank_counts[CODE_RANK[code]] += 1
+        suit = t.CODE_SUIT[code]
+        suit_counts[suit] += 1
+        suit_rank_bits[suit] |= t.CODE_RANK_BIT[code]
+
+    for suit in range(c.NUM_SUITS):
+        if suit_counts[suit] >= MIN_CARDS_TO_FLUSH:
+            rank_bits = suit_rank_bits[suit]
+            for i in range(suit_counts[suit] - h.NUM_CARDS_IN_HAND):
+                rank_bits &= rank_bits - 1
+            return t.get_tables()[0][rank_bits]
+
+    repeated = []
+    singles = []
+    for rank in range(c.ACE, c.LOWEST_RANK - 1, -1):
+        count = rank_counts[rank]
+        if count > 1:
+            repeated.append(rank)
+        elif count == 1:
+            singles.append(rank)
+
+    if not repeated:
+        return __pack(h.HIGH_CARD, singles[:h.NUM_CARDS_IN_HAND])
+
+    top = repeated[0]
+    if rank_counts[top] == h.FOUR_OF_A_KIND:
+        return __pack(h.TWO_PAIR, [top, top, max(repeated[1:] + singles)])
+    if len(repeated) > 1:
+        second = repeated[1]
+        last = max(repeated[2:] + singles + [0])
+        if rank_counts[top] >= h.THREE_OF_A_KIND:
+            last = max(last, top)
+        if rank_counts[second] >= h.THREE_OF_A_KIND:
+            last = max(last, second)
+        return __pack(h.TWO_PAIR, [top, second, last])
+    if rank_counts[top] == h.THREE_OF_A_KIND:
+        high_cards = sorted([top] + singles[:2], reverse=True)
+        best = [top] + high_cards[1:]
+        if len(singles) > 2:
+            best = max(best, [top] + singles[1:3])
+        return __pack(h.PAIR, best)
+    return __pack(h.PAIR, [top] + singles[1:3])
+
+
+def evaluate_by_subsets(codes):
+    """
+    Works out the strength key of the best five-card hand by evaluating every five-card
+    subset, as a reference for evaluate.
+
+    :param codes: Sequence of 5 or more card codes.
+    :return: The strength key.
+    """
+    return max(t.evaluate(subset) for subset in itertools.combinations(codes, h.NUM_CARDS_IN_HAND))
+
+
+def compare(codes_1, codes_2):
+    """
+    Compares the best five-card hands that two holdings can make.
+
+    :param codes_1: Card codes of the first holding.
+    :param codes_2: Card codes of the second holding.
+    :return: 1 if holding 1 wins, -1 if holding 2 wins, and 0 if they tie
+    """
+    strength_1 = evaluate(codes_1)
+    strength_2 = evaluate(codes_2)
+    if strength_1 > strength_2:
+        return h.HAND_1_WINS
+    elif strength_1 < strength_2:
+        return h.HAND_2_WINS
+    else:
+        return h.TIE
+
+
+def __sort_descending(values):
+    return -np.sort(-values, axis=1)
+
+
+def __pack_many(hand_types, tie_break_ranks):
+    tie_break_ranks = np.pad(tie_break_ranks, ((0, 0), (0, h.NUM_CARDS_IN_HAND - tie_break_ranks.shape[1])))
+    return (hand_types << h.CATEGORY_SHIFT) | (tie_break_ranks << TIE_BREAK_SHIFTS).sum(axis=1)
+
+
+def __evaluate_chunk(codes):
+    """
+    Evaluates a chunk of holdings with array operations, following the same rules as evaluate.
+
+    :param codes: Array of shape (N, K) of card codes, with K from 5 to 7.
+    :return: Tuple of arrays of hand types and strength keys.
+    """
+    codes = codes.astype(np.int32)
+    ranks = codes // c.NUM_SUITS + c.LOWEST_RANK
+    suits = codes % c.NUM_SUITS
+    num_hands = len(codes)
+    zeros = np.zeros(num_hands, dtype=np.int32)
+
+    suit_counts = (suits[:, :, None] == np.arange(c.NUM_SUITS)).sum(axis=1)
+    flush_suits = suit_counts.argmax(axis=1)
+    is_flush = suit_counts.max(axis=1) >= MIN_CARDS_TO_FLUSH
+    flush_ranks = __sort_descending(np.where(suits == flush_suits[:, None], ranks, 0))[:, :h.NUM_CARDS_IN_HAND]
+
+    rank_counts = (ranks[:, :, None] == RANK_VALUES).sum(axis=1)
+    repeated = __sort_descending(np.where(rank_counts > 1, RANK_VALUES, 0))
+    singles = __sort_descending(np.where(rank_counts == 1, RANK_VALUES, 0))
+    top, second = repeated[:, 0], repeated[:, 1]
+    rows = np.arange(num_hands)
+    top_count = np.where(top > 0, rank_counts[rows, top - c.LOWEST_RANK], 0)
+    second_count = np.where(second > 0, rank_counts[rows, second - c.LOWEST_RANK], 0)
+
+    present = rank_counts > 0
+    highest_other = np.where(present & (RANK_VALUES != top[:, None]), RANK_VALUES, 0).max(axis=1)
+    highest_remaining = np.where(present & (RANK_VALUES != top[:, None]) & (RANK_VALUES != second[:, None]),
+                                 RANK_VALUES, 0).max(axis=1)
+    two_pair_last = np.maximum.reduce([highest_remaining,
+                                       np.where(top_count >= h.THREE_OF_A_KIND, top, 0),
+                                       np.where(second_count >= h.THREE_OF_A_KIND, second, 0)])
+
+    trip_high_cards = __sort_descending(np.stack([top, singles[:, 0], singles[:, 1]], axis=1))
+    trip_last = np.maximum((trip_high_cards[:, 1] << h.RANK_BITS) | trip_high_cards[:, 2],
+                           (singles[:, 1] << h.RANK_BITS) | singles[:, 2])
+
+    is_four_of_a_kind = top_count == h.FOUR_OF_A_KIND
+    is_two_pair = ~is_four_of_a_kind & (second > 0)
+    is_three_of_a_kind = (top_count == h.THREE_OF_A_KIND) & (second == 0)
+    is_pair = (top_count == 2) & (second == 0)
+
+    conditions = [is_flush, is_four_of_a_kind, is_two_pair, is_three_of_a_kind, is_pair]
+    hand_types = np.select(conditions, [h.FLUSH, h.TWO_PAIR, h.TWO_PAIR, h.PAIR, h.PAIR], h.HIGH_CARD)
+    tie_break_ranks = np.select(
+        [np.repeat(condition[:, None], h.NUM_CARDS_IN_HAND, axis=1) for condition in conditions],
+        [flush_ranks,
+         np.stack([top, top, highest_other, zeros, zeros], axis=1),
+         np.stack([top, second, two_pair_last, zeros, zeros], axis=1),
+         np.stack([top, trip_last >> h.RANK_BITS, trip_last & ((1 << h.RANK_BITS) - 1), zeros, zeros], axis=1),
+         np.stack([top, singles[:, 1], singles[:, 2], zeros, zeros], axis=1)],
+        singles[:, :h.NUM_CARDS_IN_HAND])
+    return hand_types, __pack_many(hand_types, tie_break_ranks)
+
+
+def evaluate_many(codes):
+    """
+    Evaluates many holdings at once.
+
+    :param codes: Array of shape (N, K) of card codes, with K from 5 to 7.
+    :return: Tuple of arrays of hand types and strength keys, the same values evaluate gives.
+    """
+    codes = np.asarray(codes)
+    codes = codes.reshape(len(codes), -1)
+    hand_types = np.empty(len(codes), dtype=np.int32)
+    strengths = np.empty(len(codes), dtype=np.int32)
+    for start in range(0, len(codes), CHUNK_SIZE):
+        stop = start + CHUNK_SIZE
+        hand_types[start:stop], strengths[start:stop] = __evaluate_chunk(codes[start:stop])
+    return hand_types, strengths
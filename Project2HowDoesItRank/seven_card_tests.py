@@ -0,0 +1,69 @@
+import random
+import numpy as np
+import test_suite as test
+import card as c
+import hand_table as t
+import poker_hand as h
+import seven_card as sc
+
+NUM_TEST_HANDS = 20000
+
+
+def __get_test_holdings(generator, num_holdings, num_ranks):
+    """
+    Deals holdings from only a few ranks, so most of them have three or four of a kind,
+    full houses or several pairs.
+    """
+    holdings = []
+    for i in range(num_holdings):
+        ranks = generator.sample(range(c.LOWEST_RANK, c.ACE + 1), num_ranks)
+        cards = [c.encode(rank, suit) for rank in ranks for suit in c.SUITS]
+        holdings.append(generator.sample(cards, sc.NUM_CARDS_IN_HOLDING))
+    return holdings
+
+
+def __utest_evaluate():
+    u_test = test.create()
+
+    generator = random.Random(NUM_TEST_HANDS)
+    holdings = [generator.sample(range(c.NUM_CARDS_IN_DECK), sc.NUM_CARDS_IN_HOLDING) for i in range(NUM_TEST_HANDS)]
+    for num_ranks in [2, 3, 4, 5]:
+        holdings += __get_test_holdings(generator, NUM_TEST_HANDS // 10, num_ranks)
+    holdings += [generator.sample([c.encode(rank, 'Hearts') for rank in range(c.LOWEST_RANK, c.ACE + 1)], 4)
+                 + generator.sample(range(c.NUM_CARDS_IN_DECK), 3) for i in range(NUM_TEST_HANDS // 10)]
+    holdings = [list(dict.fromkeys(holding)) for holding in holdings]
+    holdings = [holding for holding in holdings if len(holding) >= h.NUM_CARDS_IN_HAND]
+
+    expected = [sc.evaluate_by_subsets(holding) for holding in holdings]
+    num_mismatches = sum(sc.evaluate(holding) != strength for holding, strength in zip(holdings, expected))
+    test.assert_equals(u_test, "Holdings Match Best Subset Test", 0, num_mismatches)
+
+    five_card_holdings = [holding[:h.NUM_CARDS_IN_HAND] for holding in holdings[:1000]]
+    num_mismatches = sum(sc.evaluate(holding) != t.evaluate(holding) for holding in five_card_holdings)
+    test.assert_equals(u_test, "Five Cards Match Hand Table Test", 0, num_mismatches)
+
+    seven_card_holdings = np.array([holding for holding in holdings if len(holding) == sc.NUM_CARDS_IN_HOLDING])
+    hand_types, strengths = sc.evaluate_many(seven_card_holdings)
+    expected_strengths = np.array([sc.evaluate(holding) for holding in seven_card_holdings.tolist()])
+    test.assert_equals(u_test, "Evaluate Many Test", 0, int((strengths != expected_strengths).sum()))
+    test.assert_equals(u_test, "Evaluate Many Types Test", 0,
+                       int((hand_types != expected_strengths >> h.CATEGORY_SHIFT).sum()))
+    six_card_holdings = seven_card_holdings[:1000, :6]
+    expected_strengths = np.array([sc.evaluate_by_subsets(holding) for holding in six_card_holdings.tolist()])
+    test.assert_equals(u_test, "Evaluate Many Six Cards Test", 0,
+                       int((sc.evaluate_many(six_card_holdings)[1] != expected_strengths).sum()))
+
+    four_of_a_kind = [c.encode(5, suit) for suit in c.SUITS] + [c.encode(9, 'Spades'), c.encode(9, 'Hearts'),
+                                                                c.encode(2, 'Clubs')]
+    test.assert_equals(u_test, "Higher Pair Beats Four Of A Kind Test", [9, 5, 5],
+                       [(sc.evaluate(four_of_a_kind) >> shift) & ((1 << h.RANK_BITS) - 1)
+                        for shift in sc.TIE_BREAK_SHIFTS[:3].tolist()])
+    flush = [c.encode(rank, 'Clubs') for rank in [2, 4, 6, 8, 10, 12]] + [c.encode(14, 'Spades')]
+    test.assert_equals(u_test, "Six Card Flush Test", t.evaluate(flush[1:6]), sc.evaluate(flush))
+    test.assert_equals(u_test, "Compare Test (Hand 1 Wins[1])", h.HAND_1_WINS, sc.compare(flush, four_of_a_kind))
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_evaluate()
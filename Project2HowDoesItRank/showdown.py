@@ -0,0 +1,89 @@
+import numpy as np
+import batch_evaluator as b
+import deal_generator as g
+import poker_hand as h
+import ranking as r
+
+MAX_SEATS = 10
+
+
+def __check_num_seats(num_seats):
+    if num_seats > MAX_SEATS:
+        raise ValueError(f'A table has at most {MAX_SEATS} seats: {num_seats}')
+
+
+def deal_table(game_deck, num_seats):
+    """
+    Deals one hand per seat from a deck.
+
+    :param game_deck: The deck to deal from.
+    :param num_seats: Number of seats, at most 10.
+    :return: List of hands.
+    """
+    return [h.hand_from_codes(codes) for codes in game_deck.deal_hands(num_seats)]
+
+
+def showdown(hands, key=r.get_strength):
+    """
+    Finds the winners among any number of hands in one pass, looking at each
+    hand's strength key once.
+
+    :param hands: Sequence of PokerHand objects or card code sequences.
+    :param key: Function giving the strength key of a hand.
+    :return: Tuple of the list of winning seats and the winning strength key. The pot
+    is split between the winners when there is more than one.
+    :raises ValueError: if there are more than MAX_SEATS hands.
+    """
+    __check_num_seats(len(hands))
+    winners = []
+    best_strength = -1
+    for seat, hand in enumerate(hands):
+        strength = key(hand)
+        if strength > best_strength:
+            best_strength = strength
+            winners = [seat]
+        elif strength == best_strength:
+            winners.append(seat)
+    return winners, best_strength
+
+
+def showdown_many(tables):
+    """
+    Finds the winners of many tables at once.
+
+    :param tables: Array of shape (T, N) of strength keys, or of shape (T, N, 5) of card codes.
+    :return: Tuple of a (T, N) boolean array of winners and a (T, N) array of each seat's
+    share of the pot.
+    :raises ValueError: if N is more than MAX_SEATS.
+    """
+    tables = np.asarray(tables)
+    __check_num_seats(tables.shape[1])
+    if tables.ndim == 3:
+        num_tables, num_seats = tables.shape[:2]
+        strengths = b.evaluate_many(tables.reshape(-1, h.NUM_CARDS_IN_HAND))[1].reshape(num_tables, num_seats)
+    else:
+        strengths = tables
+    winners = strengths == strengths.max(axis=1, keepdims=True)
+    shares = winners / winners.sum(axis=1, keepdims=True)
+    return winners, shares
+
+
+def simulate_tables(num_tables, num_seats, generator=None):
+    """
+    Deals and resolves many tables, adding up how much of the pot each seat wins.
+
+    :param num_tables: Number of tables.
+    :param num_seats: Number of seats at each table, at most 10.
+    :param generator: DealGenerator to deal with, or None for a randomly seeded one.
+    :return: Array of the total share of the pots won by each seat.
+    :raises ValueError: if num_seats is more than MAX_SEATS.
+    """
+    __check_num_seats(num_seats)
+    if generator is None:
+        generator = g.DealGenerator()
+    total_shares = np.zeros(num_seats)
+    for start in range(0, num_tables, g.CHUNK_SIZE):
+        deals = generator.generate(min(g.CHUNK_SIZE, num_tables - start), num_seats * h.NUM_CARDS_IN_HAND)
+        winners, shares = showdown_many(deals.reshape(len(deals), num_seats, h.NUM_CARDS_IN_HAND))
+        total_shares += shares.sum(axis=0)
+    return total_shares
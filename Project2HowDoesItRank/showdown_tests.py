@@ -0,0 +1,64 @@
+import test_suite as test
+import card as c
+import deal_generator as g
+import deck as d
+import poker_hand as h
+import showdown as sd
+
+NUM_TEST_TABLES = 2000
+
+
+def __utest_showdown():
+    u_test = test.create()
+
+    flush = [c.encode(rank, 'Hearts') for rank in [2, 7, 14, 9, 13]]
+    other_flush = [c.encode(rank, 'Clubs') for rank in [2, 7, 14, 9, 13]]
+    pair = [c.encode(6, 'Spades'), c.encode(6, 'Hearts'), c.encode(9, 'Clubs'), c.encode(4, 'Diamonds'),
+            c.encode(13, 'Spades')]
+
+    test.assert_equals(u_test, "Single Winner Test", [1], sd.showdown([pair, flush, pair])[0])
+    test.assert_equals(u_test, "Split Pot Test", [0, 2], sd.showdown([flush, pair, other_flush])[0])
+
+    winners, shares = sd.showdown_many([[pair, flush, pair], [flush, pair, other_flush]])
+    test.assert_equals(u_test, "Showdown Many Winners Test", [[False, True, False], [True, False, True]],
+                       winners.tolist())
+    test.assert_equals(u_test, "Showdown Many Shares Test", [[0, 1, 0], [0.5, 0, 0.5]], shares.tolist())
+
+    generator = g.DealGenerator(NUM_TEST_TABLES)
+    deals = generator.generate(NUM_TEST_TABLES, sd.MAX_SEATS * h.NUM_CARDS_IN_HAND)
+    tables = deals.reshape(NUM_TEST_TABLES, sd.MAX_SEATS, h.NUM_CARDS_IN_HAND)
+    winners = sd.showdown_many(tables)[0]
+    num_mismatches = 0
+    for table, table_winners in zip(tables.tolist(), winners.tolist()):
+        hands = [h.hand_from_codes(codes) for codes in table]
+        expected = [seat for seat in range(sd.MAX_SEATS)
+                    if all(hands[seat].compare_to(other) != h.HAND_2_WINS for other in hands)]
+        if (expected != sd.showdown(hands)[0]
+                or expected != [seat for seat in range(sd.MAX_SEATS) if table_winners[seat]]):
+            num_mismatches += 1
+    test.assert_equals(u_test, "Showdown Matches Compare To Test", 0, num_mismatches)
+
+    game_deck = d.Deck()
+    test.assert_equals(u_test, "Deal Table Test", sd.MAX_SEATS, len(sd.deal_table(game_deck, sd.MAX_SEATS)))
+    try:
+        sd.deal_table(game_deck, 11)
+        overdrawn = False
+    except IndexError:
+        overdrawn = True
+    test.assert_equals(u_test, "Deal Table Overdraw Test", True, overdrawn)
+
+    for name, resolve in [("Showdown", lambda: sd.showdown([pair] * (sd.MAX_SEATS + 1))),
+                          ("Showdown Many", lambda: sd.showdown_many([[pair] * (sd.MAX_SEATS + 1)])),
+                          ("Simulate Tables", lambda: sd.simulate_tables(1, sd.MAX_SEATS + 1))]:
+        try:
+            resolve()
+            rejected = False
+        except ValueError:
+            rejected = True
+        test.assert_equals(u_test, f"{name} Too Many Seats Test", True, rejected)
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_showdown()
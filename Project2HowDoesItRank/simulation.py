@@ -0,0 +1,137 @@
+import argparse
+import collections
+import multiprocessing
+import random
+import deck as d
+import hand_table as t
+import poker_hand as h
+
+ROUNDS_PER_TASK = 10000
+NUM_HANDS_PER_ROUND = 2
+OUTCOMES = [h.HAND_1_WINS, h.TIE, h.HAND_2_WINS]
+
+
+def get_task_rng(seed, task_index):
+    """
+    Creates the random number generator for one task. Each (seed, task) pair gets its
+    own stream, so results do not depend on how tasks are spread across processes.
+
+    :param seed: The seed of the whole simulation.
+    :param task_index: The position of the task.
+    :return: A random.Random.
+    """
+    return random.Random(f'{seed}:{task_index}')
+
+
+def play_rounds(num_rounds, rng):
+    """
+    Plays rounds of the game without any input. Like main, each deck keeps dealing
+    two hands per round until fewer than 5 cards are left, then a new deck is shuffled.
+
+    :param num_rounds: Number of rounds to play.
+    :param rng: random.Random used to shuffle the decks.
+    :return: Counter of rounds keyed by (hand 1 type, hand 2 type, result).
+    """
+    tally = collections.Counter()
+    rounds_played = 0
+    game_deck = d.Deck(rng)
+    while rounds_played < num_rounds:
+        while not game_deck.less_than_5_cards() and rounds_played < num_rounds:
+            hand_1_codes, hand_2_codes = game_deck.deal_hands(NUM_HANDS_PER_ROUND)
+            strength_1 = t.evaluate(hand_1_codes)
+            strength_2 = t.evaluate(hand_2_codes)
+            if strength_1 > strength_2:
+                result = h.HAND_1_WINS
+            elif strength_1 < strength_2:
+                result = h.HAND_2_WINS
+            else:
+                result = h.TIE
+            tally[(t.get_hand_type(strength_1), t.get_hand_type(strength_2), result)] += 1
+            rounds_played += 1
+        game_deck.reset()
+    return tally
+
+
+def __play_task(task):
+    seed, task_index, num_rounds = task
+    return play_rounds(num_rounds, get_task_rng(seed, task_index))
+
+
+def simulate(num_rounds, num_workers=None, seed=0):
+    """
+    Plays many rounds across a pool of processes and merges their tallies. The rounds
+    are split into tasks of ROUNDS_PER_TASK rounds, so the same seed gives the same
+    tally with any number of workers.
+
+    :param num_rounds: Number of rounds to play.
+    :param num_workers: Number of processes, or None for one per core.
+    :param seed: The seed of the simulation.
+    :return: Counter of rounds keyed by (hand 1 type, hand 2 type, result).
+    :raises ValueError: if num_rounds is not positive.
+    """
+    if num_rounds <= 0:
+        raise ValueError(f'The number of rounds must be positive: {num_rounds}')
+    tasks = []
+    for task_index, start in enumerate(range(0, num_rounds, ROUNDS_PER_TASK)):
+        tasks.append((seed, task_index, min(ROUNDS_PER_TASK, num_rounds - start)))
+
+    tally = collections.Counter()
+    if num_workers == 1:
+        for task in tasks:
+            tally.update(__play_task(task))
+    else:
+        with multiprocessing.Pool(num_workers) as pool:
+            for task_tally in pool.imap_unordered(__play_task, tasks):
+                tally.update(task_tally)
+    return tally
+
+
+def get_outcome_frequencies(tally):
+    """
+    Gets how often each result happened.
+
+    :param tally: Counter returned by simulate.
+    :return: Dictionary mapping HAND_1_WINS, TIE, and HAND_2_WINS to their frequency, all
+    0 for an empty tally.
+    """
+    total = sum(tally.values()) or 1
+    outcome_counts = {outcome: 0 for outcome in OUTCOMES}
+    for (hand_1_type, hand_2_type, result), count in tally.items():
+        outcome_counts[result] += count
+    return {outcome: count / total for outcome, count in outcome_counts.items()}
+
+
+def get_type_frequencies(tally):
+    """
+    Gets how often each hand type was dealt, counting both hands of every round.
+
+    :param tally: Counter returned by simulate.
+    :return: Dictionary mapping hand types to their frequency, all 0 for an empty tally.
+    """
+    type_counts = {hand_type: 0 for hand_type in h.HAND_TYPE_NAMES}
+    for (hand_1_type, hand_2_type, result), count in tally.items():
+        type_counts[hand_1_type] += count
+        type_counts[hand_2_type] += count
+    total = sum(type_counts.values()) or 1
+    return {hand_type: count / total for hand_type, count in type_counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Plays many rounds of the game without input.')
+    parser.add_argument('--rounds', type=int, default=1000000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    tally = simulate(args.rounds, args.workers, args.seed)
+    outcome_frequencies = get_outcome_frequencies(tally)
+    print(f'Rounds: {sum(tally.values())}')
+    print(f'Hand 1 wins: {outcome_frequencies[h.HAND_1_WINS]:.6f}')
+    print(f'Tie: {outcome_frequencies[h.TIE]:.6f}')
+    print(f'Hand 2 wins: {outcome_frequencies[h.HAND_2_WINS]:.6f}')
+    for hand_type, frequency in get_type_frequencies(tally).items():
+        print(f'{h.HAND_TYPE_NAMES[hand_type]}: {frequency:.6f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+import collections
+import test_suite as test
+import poker_hand as h
+import simulation as s
+
+NUM_TEST_ROUNDS = 2 * s.ROUNDS_PER_TASK + 5000
+
+
+def __utest_simulate():
+    u_test = test.create()
+
+    tally = s.simulate(NUM_TEST_ROUNDS, 1, seed=3)
+    test.assert_equals(u_test, "Round Count Test", NUM_TEST_ROUNDS, sum(tally.values()))
+    for num_workers in [2, 3]:
+        test.assert_equals(u_test, f"{num_workers} Workers Match One Worker Test", tally,
+                           s.simulate(NUM_TEST_ROUNDS, num_workers, seed=3))
+    test.assert_equals(u_test, "Seed Changes Tally Test", False, tally == s.simulate(NUM_TEST_ROUNDS, 1, seed=4))
+
+    # Both hands are dealt from the same shuffled deck, so neither seat has an edge.
+    outcome_frequencies = s.get_outcome_frequencies(tally)
+    test.assert_equals(u_test, "Win Symmetry Test", True,
+                       abs(outcome_frequencies[h.HAND_1_WINS] - outcome_frequencies[h.HAND_2_WINS]) < 0.02)
+    hand_1_types = collections.Counter()
+    hand_2_types = collections.Counter()
+    for (hand_1_type, hand_2_type, result), count in tally.items():
+        hand_1_types[hand_1_type] += count
+        hand_2_types[hand_2_type] += count
+    test.assert_equals(u_test, "Hand Type Symmetry Test", True,
+                       all(abs(hand_1_types[hand_type] - hand_2_types[hand_type]) < 0.02 * NUM_TEST_ROUNDS
+                           for hand_type in h.HAND_TYPE_NAMES))
+    test.assert_equals(u_test, "Better Type Wins Test", True,
+                       all((result == h.HAND_1_WINS) == (hand_1_type > hand_2_type)
+                           for hand_1_type, hand_2_type, result in tally if hand_1_type != hand_2_type))
+    test.assert_equals(u_test, "Frequencies Add Up Test", 1.0, round(sum(outcome_frequencies.values()), 9))
+
+    try:
+        s.simulate(0)
+        rejected = False
+    except ValueError:
+        rejected = True
+    test.assert_equals(u_test, "Zero Rounds Test", True, rejected)
+    test.assert_equals(u_test, "Empty Tally Test", {h.HAND_1_WINS: 0, h.TIE: 0, h.HAND_2_WINS: 0},
+                       s.get_outcome_frequencies(collections.Counter()))
+    test.assert_equals(u_test, "Empty Tally Types Test", {hand_type: 0 for hand_type in h.HAND_TYPE_NAMES},
+                       s.get_type_frequencies(collections.Counter()))
+
+    test.print_summary(u_test)
+
+
+if __name__ == '__main__':
+    __utest_simulate()
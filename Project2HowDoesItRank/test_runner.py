@@ -0,0 +1,207 @@
+import argparse
+import concurrent.futures
+import contextlib
+import importlib
+import inspect
+import io
+import json
+import os
+import sys
+import time
+import traceback
+import xml.etree.ElementTree as ElementTree
+import test_suite as test
+
+TEST_PREFIXES = ('__utest', '__u_test')
+SKIPPED_MODULES = {'test_runner', 'test_suite'}
+PROJECT_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+MAX_OUTPUT_LENGTH = 10000
+
+
+def find_modules(directory=PROJECT_DIRECTORY):
+    """
+    Lists the project modules that may hold test functions.
+
+    :param directory: Directory of the modules.
+    :return: Sorted list of module names.
+    """
+    return sorted(name[:-3] for name in os.listdir(directory)
+                  if name.endswith('.py') and name[:-3] not in SKIPPED_MODULES)
+
+
+def discover(module_names):
+    """
+    Finds the test functions of some modules: module-level functions whose names start
+    with __utest or __u_test and that take no arguments, in the order they are defined.
+
+    :param module_names: Names of the modules to search.
+    :return: Tuple of a list of (module name, function name) cases and a dictionary mapping
+    the names of modules that could not be imported to the error.
+    """
+    cases = []
+    import_errors = {}
+    for module_name in module_names:
+        try:
+            module = importlib.import_module(module_name)
+        except Exception:
+            import_errors[module_name] = traceback.format_exc()
+            continue
+        for name, value in vars(module).items():
+            if name.startswith(TEST_PREFIXES) and inspect.isfunction(value) \
+                    and value.__module__ == module_name and not inspect.signature(value).parameters:
+                cases.append((module_name, name))
+    return cases, import_errors
+
+
+def run_case(case):
+    """
+    Runs one test function with its output captured and its test suites collected quietly.
+
+    :param case: Tuple of the module name and the function name.
+    :return: Dictionary with the module, name, time in seconds, passes, fails, the failures,
+    any error raised and the captured output.
+    """
+    module_name, function_name = case
+    output = io.StringIO()
+    suites = test.collect()
+    error = None
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            getattr(importlib.import_module(module_name), function_name)()
+    except Exception:
+        error = traceback.format_exc()
+    finally:
+        elapsed = time.perf_counter() - start
+        test.stop_collecting()
+    return {'module': module_name, 'name': function_name, 'time': elapsed,
+            'passes': sum(test.num_passes(suite) for suite in suites),
+            'fails': sum(test.num_fails(suite) for suite in suites),
+            'failures': [failure for suite in suites for failure in test.get_failures(suite)],
+            'error': error, 'output': output.getvalue()[:MAX_OUTPUT_LENGTH]}
+
+
+def run(module_names=None, num_workers=None):
+    """
+    Discovers the test functions of some modules and runs them in worker processes.
+
+    :param module_names: Names of the modules to test, or None for every project module.
+    :param num_workers: Number of processes, or None for one per core. With 1 the cases run
+    in this process.
+    :return: List of case results from run_case, in discovery order, including one errored
+    case per module that could not be imported.
+    """
+    if module_names is None:
+        module_names = find_modules()
+    cases, import_errors = discover(module_names)
+    if num_workers == 1:
+        results = [run_case(case) for case in cases]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(num_workers) as executor:
+            results = list(executor.map(run_case, cases))
+    for module_name, error in import_errors.items():
+        results.append({'module': module_name, 'name': '<import>', 'time': 0.0, 'passes': 0, 'fails': 0,
+                        'failures': [], 'error': error, 'output': ''})
+    return results
+
+
+def is_successful(result):
+    """
+    Checks whether a case passed.
+
+    :param result: Case result from run_case.
+    :return: True iff every assertion passed and nothing was raised.
+    """
+    return result['fails'] == 0 and result['error'] is None
+
+
+def format_summary(results, elapsed):
+    """
+    Formats one line per failed case and a summary line.
+
+    :param results: Case results from run.
+    :param elapsed: Wall time of the run, in seconds.
+    :return: The text.
+    """
+    lines = []
+    for result in results:
+        if is_successful(result):
+            continue
+        lines.append(f"FAIL {result['module']}.{result['name']} ({result['time']:.3f}s)")
+        for failure in result['failures']:
+            lines.append(f"    {failure['message']}: expected {failure['expected']}, actual {failure['actual']}")
+        if result['error'] is not None:
+            lines.extend('    ' + line for line in result['error'].rstrip().splitlines())
+    num_passes = sum(result['passes'] for result in results)
+    num_fails = sum(result['fails'] for result in results)
+    num_failed_cases = sum(not is_successful(result) for result in results)
+    lines.append(f'{len(results)} cases, {num_failed_cases} failed; {num_passes + num_fails} Tests executed, '
+                 f'{num_passes} Passed, {num_fails} Failed in {elapsed:.2f}s')
+    return '\n'.join(lines)
+
+
+def write_json(results, path):
+    """
+    Writes the case results as JSON.
+
+    :param results: Case results from run.
+    :param path: Path of the file.
+    """
+    with open(path, 'w') as output_file:
+        json.dump(results, output_file, indent=2)
+
+
+def write_junit(results, path):
+    """
+    Writes the case results as JUnit XML, with one test suite per module and one test case
+    per test function.
+
+    :param results: Case results from run.
+    :param path: Path of the file.
+    """
+    root = ElementTree.Element('testsuites')
+    results_by_module = {}
+    for result in results:
+        results_by_module.setdefault(result['module'], []).append(result)
+    for module_name, module_results in results_by_module.items():
+        suite = ElementTree.SubElement(root, 'testsuite', {
+            'name': module_name,
+            'tests': str(len(module_results)),
+            'failures': str(sum(result['fails'] > 0 for result in module_results)),
+            'errors': str(sum(result['error'] is not None for result in module_results)),
+            'time': f"{sum(result['time'] for result in module_results):.6f}"})
+        for result in module_results:
+            case = ElementTree.SubElement(suite, 'testcase', {
+                'classname': module_name, 'name': result['name'], 'time': f"{result['time']:.6f}",
+                'assertions': str(result['passes'] + result['fails'])})
+            for failure in result['failures']:
+                element = ElementTree.SubElement(case, 'failure', {'message': failure['message']})
+                element.text = f"expected: {failure['expected']}\nactual: {failure['actual']}"
+            if result['error'] is not None:
+                element = ElementTree.SubElement(case, 'error', {'message': result['error'].splitlines()[-1]})
+                element.text = result['error']
+            if result['output']:
+                ElementTree.SubElement(case, 'system-out').text = result['output']
+    ElementTree.ElementTree(root).write(path, encoding='unicode', xml_declaration=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Runs the __utest and __u_test functions of the project modules.')
+    parser.add_argument('modules', nargs='*', help='Modules to test, every project module by default')
+    parser.add_argument('--workers', type=int, default=None, help='Number of processes, 1 to run in this process')
+    parser.add_argument('--json', help='Write the results as JSON to this file')
+    parser.add_argument('--junit', help='Write the results as JUnit XML to this file')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run(args.modules or None, args.workers)
+    print(format_summary(results, time.perf_counter() - start))
+    if args.json:
+        write_json(results, args.json)
+    if args.junit:
+        write_junit(results, args.junit)
+    sys.exit(0 if all(is_successful(result) for result in results) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,10 @@
 PASSES = "passes"
 FAILS = "fails"
+FAILURES = "failures"
+MAX_VALUE_LENGTH = 200
+# Whether assert_equals and print_summary print, and the list every new suite is added to
+# while results are being collected, or None.
+SETTINGS = {"quiet": False, "collected_suites": None}
 
 
 def create():
@@ -8,40 +13,76 @@ def create():
     
     :return: the new empty test suite
     '''
-    suite = {PASSES: 0, FAILS: 0}
+    suite = {PASSES: 0, FAILS: 0, FAILURES: []}
+    if SETTINGS["collected_suites"] is not None:
+        SETTINGS["collected_suites"].append(suite)
     return suite
 
 
+def collect(quiet=True):
+    '''
+    Starts collecting every test suite created from now on, so a test runner can read the
+    results of test functions that create their own suites.
+
+    :param quiet: True to stop assert_equals and print_summary from printing.
+    :return: The list the new suites are added to.
+    '''
+    SETTINGS["quiet"] = quiet
+    SETTINGS["collected_suites"] = []
+    return SETTINGS["collected_suites"]
+
+
+def stop_collecting():
+    '''
+    Stops collecting test suites and turns printing back on.
+    '''
+    SETTINGS["quiet"] = False
+    SETTINGS["collected_suites"] = None
+
+
+def __shorten(value):
+    text = str(value)
+    if len(text) > MAX_VALUE_LENGTH:
+        text = text[:MAX_VALUE_LENGTH] + "..."
+    return text
+
+
 def __pass(test_suite):
-    print("PASS")
+    if not SETTINGS["quiet"]:
+        print("PASS")
     test_suite[PASSES] += 1
 
 
-def __fail(test_suite):
-    print("FAIL")
+def __fail(test_suite, msg, expected, actual):
+    if not SETTINGS["quiet"]:
+        print("FAIL")
     test_suite[FAILS] += 1
+    test_suite[FAILURES].append({"message": msg, "expected": __shorten(expected), "actual": __shorten(actual)})
 
 
 def assert_equals(test_suite, msg, expected, actual):
     '''
     Runs a test case, checking whether code being tested produces the correct result 
-    for a specific test case. Prints a message indicating whether it does.
+    for a specific test case. Prints a message indicating whether it does, unless the
+    results are being collected quietly. Failures are also kept in the suite.
 
     :param test_suite: the test suite this test case belongs to.
     :param: msg is a message to print at the beginning.
     :param: expected is the correct result
     :param: actual is the result of the code under test.
     '''
-    print(msg)
-    print("expected: " + str(expected))
-    print("actual: " + str(actual))
+    if not SETTINGS["quiet"]:
+        print(msg)
+        print("expected: " + str(expected))
+        print("actual: " + str(actual))
 
     if expected == actual:
         __pass(test_suite)
     else:
-        __fail(test_suite)
+        __fail(test_suite, msg, expected, actual)
 
-    print("")
+    if not SETTINGS["quiet"]:
+        print("")
 
 
 def num_tests(test_suite):
@@ -74,6 +115,16 @@ def num_passes(test_suite):
     return test_suite[PASSES]
 
 
+def get_failures(test_suite):
+    '''
+    Returns the failed test cases run so far in the given test suite.
+
+    :param test_suite: The suite of tests.
+    :return: List of dictionaries with the message, expected and actual values of each failure
+    '''
+    return test_suite[FAILURES]
+
+
 def print_summary(test_suite):
     '''
     Prints a summary of test suite results. Includes a tally of tests run, tests passed,
@@ -81,6 +132,8 @@ def print_summary(test_suite):
     
     :param test_suite: The suite of tests.
     '''
+    if SETTINGS["quiet"]:
+        return
     print("%d Tests executed, %d Passed, %d Failed" %
           (num_tests(test_suite), num_passes(test_suite), num_fails(test_suite)))
 